@@ -1,13 +1,19 @@
 from flask import Flask, redirect, url_for
 from flask_migrate import Migrate  # type: ignore
 
+from app.cli import init_cli
 from app.db.database import db, init_db
 from app.routes.main import main
 from app.routes.manual_entry import manual_entry
 from app.routes.monthly_log import monthly_log_bp
 from app.routes.settings import settings_bp
+from app.routes.stats import stats_bp
 from app.routes.time_log import time_log
 from app.routes.time_summary import time_summary
+from app.services.holiday_cache import init_holiday_cache
+from app.services.import_jobs import init_import_jobs
+from app.services.response_cache import init_response_cache
+from app.services.upload_registry import init_upload_sweeper
 
 
 def create_app(config_object):
@@ -16,6 +22,10 @@ def create_app(config_object):
 
     init_db(app)
     migrate = Migrate(app, db)
+    init_holiday_cache(app)
+    init_response_cache(app)
+    init_import_jobs(app)
+    init_cli(app)
 
     app.register_blueprint(main)
     app.register_blueprint(manual_entry)
@@ -23,9 +33,11 @@ def create_app(config_object):
     app.register_blueprint(time_log)
     app.register_blueprint(monthly_log_bp)
     app.register_blueprint(settings_bp)
+    app.register_blueprint(stats_bp)
 
-    from app.routes.import_log import import_log_bp
+    from app.routes.import_log import UPLOAD_FOLDER, import_log_bp
 
     app.register_blueprint(import_log_bp)
+    init_upload_sweeper(app, UPLOAD_FOLDER)
 
     return app
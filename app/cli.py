@@ -0,0 +1,39 @@
+import time
+
+import click
+from flask import Flask
+from flask.cli import AppGroup
+
+from app.services.holiday_sync import SyncReport, sync_holidays
+
+holidays_cli = AppGroup("holidays", help="Manage the stored holidays.")
+
+
+@holidays_cli.command("sync")
+@click.option("--start", type=int, help="First year to fetch [current year].")
+@click.option("--end", type=int, help="Last year to fetch [start + 1].")
+def sync_command(start, end):
+    """Fetch the holidays of START..END from the provider and store them."""
+    start = start or time.localtime().tm_year
+    end = end or start + 1
+    if end < start:
+        raise click.BadParameter("--end is before --start")
+
+    report = sync_holidays(range(start, end + 1))
+    echo_report(report)
+
+
+def echo_report(report: SyncReport) -> None:
+    for result in report.years:
+        if result.error:
+            status = f"failed: {result.error}"
+        elif not result.holidays:
+            status = "no holidays found"
+        else:
+            status = f"{len(result.holidays)} holidays"
+        click.echo(f"{result.year}: {status} ({result.elapsed:.2f}s)")
+    click.echo(f"Saved {report.saved} holidays in {report.elapsed:.2f}s")
+
+
+def init_cli(app: Flask) -> None:
+    app.cli.add_command(holidays_cli)
@@ -18,6 +18,46 @@ class Config:
         "HOLIDAY_API_URL",
         "https://api.argentinadatos.com/v1/feriados/{year}",
     )
+    # Seconds per attempt, retries after a connection error, timeout or
+    # 429/5xx, and the base of the jittered exponential backoff between them
+    HOLIDAY_HTTP_TIMEOUT = float(os.getenv("HOLIDAY_HTTP_TIMEOUT", "10"))
+    HOLIDAY_HTTP_RETRIES = int(os.getenv("HOLIDAY_HTTP_RETRIES", "2"))
+    HOLIDAY_HTTP_BACKOFF = float(os.getenv("HOLIDAY_HTTP_BACKOFF", "0.5"))
+    # Provider responses kept for revalidation with ETag/Last-Modified; an
+    # empty value disables the cache
+    HOLIDAY_HTTP_CACHE_DIR = os.getenv(
+        "HOLIDAY_HTTP_CACHE_DIR", os.path.join(os.getcwd(), "instance", "holiday_cache")
+    )
+    # COMPOSITE provider: seconds to wait for the API before also asking the
+    # website, and whether to always ask both and compare their dates
+    HOLIDAY_HEDGE_AFTER = float(os.getenv("HOLIDAY_HEDGE_AFTER", "2"))
+    HOLIDAY_CROSS_CHECK = os.getenv("HOLIDAY_CROSS_CHECK", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # Years fetched at the same time by `flask holidays sync` and init_db
+    HOLIDAY_SYNC_WORKERS = int(os.getenv("HOLIDAY_SYNC_WORKERS", "4"))
+
+    # Response cache for the month views: "memory", "filesystem" or "none"
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+    RESPONSE_CACHE_DIR = os.getenv(
+        "RESPONSE_CACHE_DIR", os.path.join(os.getcwd(), "instance", "response_cache")
+    )
+
+    # Processes extracting PDF import pages; 1 extracts in the request
+    # process, 0 uses one per CPU
+    PDF_IMPORT_WORKERS = int(os.getenv("PDF_IMPORT_WORKERS", "1"))
+
+    # Threads parsing and importing uploads in the background; 0 runs the
+    # work inside the request
+    IMPORT_JOB_WORKERS = int(os.getenv("IMPORT_JOB_WORKERS", "2"))
+
+    # Uploads not confirmed or cancelled are deleted after UPLOAD_TTL_HOURS by
+    # a sweeper running every UPLOAD_SWEEP_INTERVAL seconds (0 disables it)
+    UPLOAD_TTL_HOURS = float(os.getenv("UPLOAD_TTL_HOURS", "24"))
+    UPLOAD_SWEEP_INTERVAL = float(os.getenv("UPLOAD_SWEEP_INTERVAL", "3600"))
 
     # Configuración horaria
     WORKING_HOURS_PER_DAY = 8
@@ -0,0 +1,207 @@
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy import insert, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.database import db
+from app.models.models import ScheduleEntry
+from app.utils.time_calculator import calculate_daily_minutes
+
+SCHEDULE_COLUMNS = ("entries", "absence_code", "observation", "worked_minutes")
+
+# Bound parameters allowed per statement by SQLite builds before 3.32;
+# PostgreSQL allows 65535
+SQLITE_MAX_VARIABLES = 999
+
+# Rows per upsert statement; every row binds its key and SCHEDULE_COLUMNS
+UPSERT_BATCH_SIZE = SQLITE_MAX_VARIABLES // (2 + len(SCHEDULE_COLUMNS))
+
+
+def _schedule_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    values = {
+        "employee_id": row["employee_id"],
+        "date": row["date"],
+        "entries": row.get("entries", []),
+        "absence_code": row.get("absence_code"),
+        "observation": row.get("observation"),
+    }
+    # Bulk statements bypass the model validators, so keep worked_minutes in
+    # sync here
+    values["worked_minutes"] = calculate_daily_minutes(values["entries"] or [])
+    return values
+
+
+def dialect_insert(model: Any) -> Any:
+    """
+    An INSERT for `model` supporting ON CONFLICT on PostgreSQL and SQLite,
+    or None on databases without it.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    return None
+
+
+def _upsert_batch(rows: List[Dict[str, Any]], update_columns: Sequence[str]) -> None:
+    statement = dialect_insert(ScheduleEntry)
+    if statement is not None:
+        statement = statement.values(rows).on_conflict_do_update(
+            index_elements=["employee_id", "date"],
+            set_={column: statement.excluded[column] for column in update_columns},
+        )
+        db.session.execute(statement)
+        return
+
+    # Other databases: look the keys up once and split the batch
+    keys = [(row["employee_id"], row["date"]) for row in rows]
+    existing = {
+        (employee_id, entry_date): entry_id
+        for entry_id, employee_id, entry_date in db.session.query(
+            ScheduleEntry.id, ScheduleEntry.employee_id, ScheduleEntry.date
+        ).filter(tuple_(ScheduleEntry.employee_id, ScheduleEntry.date).in_(keys))
+    }
+    updates = [
+        dict(
+            {column: row[column] for column in update_columns},
+            id=existing[(row["employee_id"], row["date"])],
+        )
+        for row in rows
+        if (row["employee_id"], row["date"]) in existing
+    ]
+    inserts = [row for row in rows if (row["employee_id"], row["date"]) not in existing]
+    if updates:
+        db.session.execute(update(ScheduleEntry), updates)
+    if inserts:
+        db.session.execute(insert(ScheduleEntry), inserts)
+
+
+def upsert_schedule_entries(
+    rows: Iterable[Mapping[str, Any]],
+    update_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Insert schedule entries, or update the existing row with the same
+    (employee_id, date), in a few set-based statements.
+
+    Each row needs employee_id and date; entries, absence_code and
+    observation default to [], None and None. New rows take every value;
+    existing rows only change `update_columns` (default: all of them).
+    worked_minutes is always derived from entries and updated with them.
+
+    Runs in the current transaction; returns the number of rows written.
+    """
+    if update_columns is None:
+        update_columns = SCHEDULE_COLUMNS
+    elif "entries" in update_columns and "worked_minutes" not in update_columns:
+        update_columns = [*update_columns, "worked_minutes"]
+    unknown = set(update_columns) - set(SCHEDULE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Cannot update columns: {sorted(unknown)}")
+
+    # Later rows for the same key win, as they would with one upsert per row
+    prepared = {(row["employee_id"], row["date"]): _schedule_row(row) for row in rows}
+    batch = list(prepared.values())
+    for start in range(0, len(batch), UPSERT_BATCH_SIZE):
+        _upsert_batch(batch[start : start + UPSERT_BATCH_SIZE], update_columns)
+    return len(batch)
+
+
+@dataclass
+class MergeResult:
+    """Outcome of merge_schedule_entries."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    elapsed: float = 0.0  # seconds
+    # Dates that were inserted or updated
+    changed_dates: List[date] = field(default_factory=list)
+
+    def add(self, other: "MergeResult") -> None:
+        """Accumulate the result of merging another batch."""
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.elapsed += other.elapsed
+        self.changed_dates.extend(other.changed_dates)
+
+
+def merge_schedule_entries(
+    employee_id: int, rows: Iterable[Mapping[str, Any]]
+) -> MergeResult:
+    """
+    Merge rows into an employee's schedule in one transaction: load every
+    existing entry of the rows' date span with one query, diff in memory and
+    write only the differences with bulk statements.
+
+    Each row needs a date and may set entries, absence_code and observation.
+    Existing entries only change the columns a row provides; new entries
+    default the rest. A later row for the same date overrides an earlier one.
+    """
+    started = time.perf_counter()
+    result = MergeResult()
+
+    by_date = {row["date"]: row for row in rows}
+    if not by_date:
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    existing = {
+        entry.date: entry
+        for entry in db.session.query(
+            ScheduleEntry.id,
+            ScheduleEntry.date,
+            ScheduleEntry.entries,
+            ScheduleEntry.absence_code,
+            ScheduleEntry.observation,
+            ScheduleEntry.worked_minutes,
+        ).filter(
+            ScheduleEntry.employee_id == employee_id,
+            ScheduleEntry.date.between(min(by_date), max(by_date)),
+        )
+    }
+
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    for entry_date, row in sorted(by_date.items()):
+        current = existing.get(entry_date)
+        if current is None:
+            inserts.append(dict(row, employee_id=employee_id))
+            result.changed_dates.append(entry_date)
+            continue
+
+        desired = {
+            column: row[column]
+            for column in ("entries", "absence_code", "observation")
+            if column in row
+        }
+        if "entries" in desired:
+            desired["worked_minutes"] = calculate_daily_minutes(
+                desired["entries"] or []
+            )
+        changes = {
+            column: value
+            for column, value in desired.items()
+            if getattr(current, column) != value
+        }
+        if changes:
+            updates.append(dict(changes, id=current.id))
+            result.changed_dates.append(entry_date)
+        else:
+            result.unchanged += 1
+
+    if inserts:
+        # ON CONFLICT also covers rows inserted concurrently since the load
+        upsert_schedule_entries(inserts)
+    if updates:
+        db.session.execute(update(ScheduleEntry), updates)
+
+    result.inserted = len(inserts)
+    result.updated = len(updates)
+    result.elapsed = time.perf_counter() - started
+    return result
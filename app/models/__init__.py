@@ -1,3 +1,19 @@
-from app.models.models import AbsenceCode, Employee, Holiday, ScheduleEntry
+from app.models.models import (
+    AbsenceCode,
+    BalanceLedger,
+    Employee,
+    Holiday,
+    MonthVersion,
+    ScheduleEntry,
+    Upload,
+)
 
-__all__ = ["Employee", "ScheduleEntry", "Holiday", "AbsenceCode"]
+__all__ = [
+    "Employee",
+    "ScheduleEntry",
+    "Holiday",
+    "AbsenceCode",
+    "BalanceLedger",
+    "MonthVersion",
+    "Upload",
+]
@@ -1,11 +1,13 @@
+from datetime import datetime, timezone
 from typing import List
 
 from sqlalchemy import JSON, Column
 from sqlalchemy import Date as SQLADate
-from sqlalchemy import ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, relationship, validates
 
 from app.db.database import db
+from app.utils.time_calculator import calculate_daily_minutes
 
 
 class Employee(db.Model):  # type: ignore
@@ -21,6 +23,11 @@ class Employee(db.Model):  # type: ignore
 
 class ScheduleEntry(db.Model):  # type: ignore
     __tablename__ = "schedule_entries"
+    __table_args__ = (
+        Index(
+            "ix_schedule_entries_employee_id_date", "employee_id", "date", unique=True
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     employee_id = Column(Integer, ForeignKey("employees.id"))
@@ -28,11 +35,19 @@ class ScheduleEntry(db.Model):  # type: ignore
     entries = Column(JSON, nullable=False)
     absence_code = Column(String, nullable=True)
     observation = Column(String, nullable=True)
+    # Minutes worked according to `entries`, kept in sync on every write so
+    # summaries can aggregate without loading the JSON
+    worked_minutes = Column(Integer, nullable=False, default=0, server_default="0")
 
     employee: Mapped["Employee"] = relationship(
         "Employee", back_populates="schedule_entries"
     )
 
+    @validates("entries")
+    def _sync_worked_minutes(self, key, entries):
+        self.worked_minutes = calculate_daily_minutes(entries or [])  # type: ignore[assignment]
+        return entries
+
 
 class Holiday(db.Model):  # type: ignore
     __tablename__ = "holidays"
@@ -49,3 +64,83 @@ class AbsenceCode(db.Model):  # type: ignore
     id = Column(Integer, primary_key=True)
     code = Column(String, unique=True, nullable=False)
     description = Column(String)
+
+
+class BalanceLedger(db.Model):  # type: ignore
+    """
+    Daily flex-time balance per employee with its running (prefix) sum, so the
+    balance over any date range is the difference of two cumulative values.
+    """
+
+    __tablename__ = "balance_ledger"
+    __table_args__ = (
+        UniqueConstraint("employee_id", "date", name="uq_balance_ledger_employee_date"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    date = Column(SQLADate, nullable=False)
+    # Worked minus required minutes for this day
+    balance_minutes = Column(Integer, nullable=False, default=0)
+    # Sum of balance_minutes from the first ledger day up to and including this day
+    cumulative_minutes = Column(Integer, nullable=False, default=0)
+
+
+class MonthVersion(db.Model):  # type: ignore
+    """
+    Counter bumped on every write that changes an employee's month, used to
+    answer conditional GETs without loading the month.
+    """
+
+    __tablename__ = "month_versions"
+    __table_args__ = (
+        UniqueConstraint(
+            "employee_id", "year", "month", name="uq_month_versions_employee_month"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+    # Naive UTC, truncated to seconds like the Last-Modified header
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0),
+    )
+
+
+class HolidayVersion(db.Model):  # type: ignore
+    """
+    Counter bumped on every write that changes a year's holidays, so each
+    process can tell when its cached copy of the year is out of date.
+    """
+
+    __tablename__ = "holiday_versions"
+    __table_args__ = (UniqueConstraint("year", name="uq_holiday_versions_year"),)
+
+    id = Column(Integer, primary_key=True)
+    year = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class Upload(db.Model):  # type: ignore
+    """An import file waiting in the upload folder for preview and confirm."""
+
+    __tablename__ = "uploads"
+
+    # The upload_id used in the import URLs
+    id = Column(String(64), primary_key=True)
+    # Name of the file inside the upload folder
+    filename = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    sha256 = Column(String(64), nullable=False)
+    # Naive UTC; the sweeper deletes uploads by age
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        index=True,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
@@ -13,6 +13,7 @@ from flask import (
     Blueprint,
     current_app,
     flash,
+    jsonify,
     redirect,
     render_template,
     request,
@@ -21,9 +22,28 @@ from flask import (
 from werkzeug.utils import secure_filename
 
 from app.db.database import db
-from app.models.models import Employee, ScheduleEntry
+from app.db.repository import MergeResult, merge_schedule_entries
+from app.models.models import Employee
+from app.services.import_jobs import (
+    KIND_IMPORT,
+    KIND_PARSE,
+    STAGE_DONE,
+    STAGE_FAILED,
+    STAGE_IMPORTING,
+    STAGE_PARSED,
+    STAGE_PARSING,
+    get_import_jobs,
+)
 from app.services.importer.factory import ImporterFactory
 from app.services.importer.protocol import ImportResult
+from app.services.importer.result_cache import content_hash, load_result, store_result
+from app.services.schedule_events import schedule_changed
+from app.services.upload_registry import (
+    get_upload_path,
+    register_upload,
+    remove_upload,
+    upload_digest,
+)
 from app.utils.time_calculator import calculate_daily_hours
 
 logger = logging.getLogger(__name__)
@@ -35,6 +55,9 @@ import_log_bp = Blueprint("import_log", __name__, url_prefix="/import")
 UPLOAD_FOLDER = os.path.join(os.getcwd(), "uploads")
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Rows merged per statement batch of an import job, between progress updates
+IMPORT_BATCH_ROWS = 500
+
 
 @import_log_bp.route("/", methods=["GET", "POST"])
 def upload_file():
@@ -61,7 +84,13 @@ def upload_file():
             temp_filename = f"{upload_id}.{file_ext}"
             filepath = os.path.join(UPLOAD_FOLDER, temp_filename)
             file.save(filepath)
+            register_upload(UPLOAD_FOLDER, upload_id, temp_filename)
+            db.session.commit()
 
+            # Parse in the background; the preview waits for it
+            get_import_jobs().submit(
+                upload_id, KIND_PARSE, _parse_task(upload_id, filepath)
+            )
             return redirect(url_for("import_log.preview", upload_id=upload_id))
 
     return render_template("import_upload.html")
@@ -71,15 +100,22 @@ def upload_file():
 def preview(upload_id):
     # Find file
     filepath = _get_filepath(upload_id)
+    job = get_import_jobs().get(upload_id)
+    if job is not None and not job.finished:
+        return render_template("import_status.html", job=job.to_dict())
+
     if not filepath:
         flash("File not found or expired", "error")
         return redirect(url_for("import_log.upload_file"))
 
+    if job is not None and job.kind == KIND_PARSE and job.stage == STAGE_FAILED:
+        get_import_jobs().discard(upload_id)
+        flash(f"Error parsing file: {job.error}", "error")
+        return redirect(url_for("import_log.upload_file"))
+
     try:
-        importer = ImporterFactory.get_importer(filepath)
-        with open(filepath, "rb") as f:
-            content = f.read()
-            result = importer.parse(content)
+        # Normally cached by the parse job
+        result = _parse_upload(upload_id, filepath, store=True)
 
         return render_template(
             "import_preview.html", result=result, upload_id=upload_id
@@ -97,10 +133,50 @@ def confirm(upload_id):
         return redirect(url_for("import_log.upload_file"))
 
     try:
-        importer = ImporterFactory.get_importer(filepath)
-        with open(filepath, "rb") as f:
-            content = f.read()
-            result = importer.parse(content)
+        job = get_import_jobs().submit(
+            upload_id, KIND_IMPORT, _import_task(upload_id, filepath)
+        )
+    except RuntimeError as e:
+        flash(str(e), "error")
+        return redirect(url_for("import_log.preview", upload_id=upload_id))
+
+    if not job.finished:
+        # The preview page follows the job until it is done
+        return redirect(url_for("import_log.preview", upload_id=upload_id))
+    if job.stage == STAGE_FAILED:
+        flash(f"Error importing data: {job.error}", "error")
+        return redirect(url_for("import_log.preview", upload_id=upload_id))
+
+    flash(job.message or "Import finished", "success")
+    return redirect(url_for("monthly_log.view_monthly_log"))
+
+
+@import_log_bp.route("/status/<upload_id>", methods=["GET"])
+def status(upload_id):
+    """Stage, progress, rows processed and throughput of an upload's job."""
+    job = get_import_jobs().get(upload_id)
+    if job is None:
+        return jsonify({"error": "No import job for this upload"}), 404
+    return jsonify(job.to_dict())
+
+
+def _parse_task(upload_id, filepath):
+    def task(job):
+        job.update(stage=STAGE_PARSING)
+        result = _parse_upload(upload_id, filepath, store=True)
+        job.update(
+            stage=STAGE_PARSED,
+            total_rows=result.total_records,
+            processed_rows=result.total_records,
+        )
+
+    return task
+
+
+def _import_task(upload_id, filepath):
+    def task(job):
+        job.update(stage=STAGE_IMPORTING)
+        result = _parse_upload(upload_id, filepath)
 
         # Import valid records
         count = 0
@@ -108,16 +184,14 @@ def confirm(upload_id):
         # Ideally user selects employee in Upload or Preview
         # For now, let's hardcode 1 or get from request if we added it
         employee_id = 1
+        rows_by_date = {}
 
         for record in result.records:
             if not record.is_valid:
                 continue
 
-            # Check duplicate/overwrite?
+            # A later record for the same date overwrites an earlier one
             entry_date = datetime.strptime(record.date, "%Y-%m-%d").date()
-            existing = ScheduleEntry.query.filter_by(
-                employee_id=employee_id, date=entry_date
-            ).first()
 
             entries_data = []
             if record.entry_time and record.exit_time:
@@ -125,50 +199,97 @@ def confirm(upload_id):
                     {"entry": record.entry_time, "exit": record.exit_time}
                 )
 
-            if existing:
-                existing.entries = entries_data
-                existing.observation = record.observation
-                # If valid entries exist, we assume normal work day, so unset absence?
-                if entries_data:
-                    existing.absence_code = None
-            else:
-                new_entry = ScheduleEntry(
-                    employee_id=employee_id,
-                    date=entry_date,
-                    entries=entries_data,
-                    observation=record.observation,
-                )
-                db.session.add(new_entry)
+            row = {
+                "date": entry_date,
+                "entries": entries_data,
+                "observation": record.observation,
+            }
+            # If valid entries exist, we assume normal work day, so unset
+            # absence; days without times keep their absence code
+            if entries_data:
+                row["absence_code"] = None
+            rows_by_date[entry_date] = row
             count += 1
 
-        db.session.commit()
+        rows = [rows_by_date[day] for day in sorted(rows_by_date)]
+        job.update(total_rows=len(rows))
+        merge = MergeResult()
+        try:
+            # One transaction; batches only let the job report progress
+            for start in range(0, len(rows), IMPORT_BATCH_ROWS):
+                batch = rows[start : start + IMPORT_BATCH_ROWS]
+                merge.add(merge_schedule_entries(employee_id, batch))
+                job.update(processed_rows=start + len(batch))
+            schedule_changed(employee_id, merge.changed_dates)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        logger.info(
+            "Imported %s: %d inserted, %d updated, %d unchanged in %.3fs",
+            upload_id,
+            merge.inserted,
+            merge.updated,
+            merge.unchanged,
+            merge.elapsed,
+        )
 
         # Cleanup
-        os.remove(filepath)
+        remove_upload(UPLOAD_FOLDER, upload_id)
+        db.session.commit()
 
-        flash(f"Successfully imported {count} records", "success")
-        return redirect(url_for("monthly_log.view_monthly_log"))
+        job.update(
+            stage=STAGE_DONE,
+            message=(
+                f"Successfully imported {count} records: {merge.inserted} new, "
+                f"{merge.updated} updated, {merge.unchanged} unchanged "
+                f"({merge.elapsed:.2f}s)"
+            ),
+        )
 
-    except Exception as e:
-        db.session.rollback()
-        flash(f"Error importing data: {str(e)}", "error")
-        return redirect(url_for("import_log.preview", upload_id=upload_id))
+    return task
 
 
 @import_log_bp.route("/cancel/<upload_id>", methods=["POST"])
 def cancel(upload_id):
-    filepath = _get_filepath(upload_id)
-    if filepath:
-        try:
-            os.remove(filepath)
-        except:
-            pass
+    if get_upload_path(UPLOAD_FOLDER, upload_id):
+        remove_upload(UPLOAD_FOLDER, upload_id)
+        db.session.commit()
+    get_import_jobs().discard(upload_id)
     return redirect(url_for("import_log.upload_file"))
 
 
+def _parse_upload(upload_id, filepath, store=False):
+    """
+    Parse an upload once: reuse the result cached by the preview while the
+    file content is unchanged, otherwise parse it again (and cache it if
+    `store` is set).
+
+    The digest recorded at upload time finds the cached result without
+    reading the file; unregistered files are hashed.
+    """
+    content = None
+    digest = upload_digest(upload_id, filepath)
+    if digest is None:
+        content = _read(filepath)
+        digest = content_hash(content)
+
+    result = load_result(UPLOAD_FOLDER, upload_id, digest)
+    if result is None:
+        if content is None:
+            content = _read(filepath)
+        importer = ImporterFactory.get_importer(filepath)
+        result = importer.parse(content)
+        if store:
+            store_result(UPLOAD_FOLDER, upload_id, digest, result)
+    return result
+
+
+def _read(filepath):
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
 def _get_filepath(upload_id):
-    # Search for file with upload_id prefix
-    for f in os.listdir(UPLOAD_FOLDER):
-        if f.startswith(upload_id):
-            return os.path.join(UPLOAD_FOLDER, f)
-    return None
+    return get_upload_path(UPLOAD_FOLDER, upload_id)
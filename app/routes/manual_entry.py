@@ -4,8 +4,10 @@ from typing import Any, Dict, Optional, cast
 from flask import Blueprint, jsonify, render_template, request
 
 from app.db.database import db
+from app.db.repository import upsert_schedule_entries
 from app.models.models import AbsenceCode, Employee, ScheduleEntry
-from app.utils.time_calculator import calculate_daily_hours
+from app.services.schedule_events import schedule_changed
+from app.utils.time_calculator import calculate_daily_minutes
 from app.utils.validators import validate_date, validate_entries
 
 manual_entry = Blueprint("manual_entry", __name__)
@@ -51,28 +53,25 @@ def save_entry():
     if employee_id is None:
         return jsonify({"error": "Employee ID is required"}), 400
 
-    existing_entry = ScheduleEntry.query.filter_by(
-        employee_id=employee_id, date=entry_date
-    ).first()
+    entries = [] if absence_code else data.get("entries", [])
 
-    entries = data.get("entries", [])
-
-    if existing_entry:
-        existing_entry.entries = [] if absence_code else entries
-        existing_entry.absence_code = absence_code
-        db.session.commit()
-    else:
-        schedule_entry = ScheduleEntry(
-            employee_id=employee_id,
-            date=entry_date,
-            entries=[] if absence_code else entries,
-            absence_code=absence_code,
-        )
-        db.session.add(schedule_entry)
-        db.session.commit()
+    # The observation of an existing entry is kept
+    upsert_schedule_entries(
+        [
+            {
+                "employee_id": employee_id,
+                "date": entry_date,
+                "entries": entries,
+                "absence_code": absence_code,
+            }
+        ],
+        update_columns=["entries", "absence_code"],
+    )
+    schedule_changed(employee_id, [entry_date])
+    db.session.commit()
 
     if absence_code is None:
-        hours = calculate_daily_hours(entries)
+        hours = calculate_daily_minutes(entries) / 60
         return jsonify({"status": "success", "hours": hours})
 
     return jsonify({"status": "success"})
@@ -93,11 +92,7 @@ def get_entry(date):
             {
                 "entries": entry.entries,
                 "absence_code": entry.absence_code,
-                "hours": (
-                    calculate_daily_hours(entry.entries)
-                    if not entry.absence_code
-                    else 0
-                ),
+                "hours": entry.worked_minutes / 60 if not entry.absence_code else 0,
             }
         )
 
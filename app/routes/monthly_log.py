@@ -4,10 +4,20 @@ from datetime import date, datetime, timedelta
 from flask import Blueprint, jsonify, render_template, request
 
 from app.db.database import db
-from app.models.models import AbsenceCode, Holiday, ScheduleEntry
+from app.db.repository import upsert_schedule_entries
+from app.models.models import AbsenceCode, ScheduleEntry
+from app.services.holiday_cache import holidays_between
+from app.services.month_versions import conditional_month
+from app.services.period_service import classify_day
+from app.services.response_cache import cached_month
+from app.services.schedule_events import schedule_changed
+from app.services.work_calendar import configured_weekmask
 
 monthly_log_bp = Blueprint("monthly_log", __name__, url_prefix="/monthly-log")
 
+# Upper bound for each range of /api/update-days
+MAX_RANGE_DAYS = 366
+
 
 @monthly_log_bp.route("/", methods=["GET"])
 def view_monthly_log():
@@ -16,6 +26,8 @@ def view_monthly_log():
 
 
 @monthly_log_bp.route("/api/<int:year>/<int:month>", methods=["GET"])
+@conditional_month()
+@cached_month("monthly_log")
 def get_monthly_log_data(year, month):
     """
     Provides the data for all days in a given month for the calendar view.
@@ -31,25 +43,20 @@ def get_monthly_log_data(year, month):
         ).all()
         entries_map = {entry.date: entry for entry in entries_query}
 
-        holidays_query = Holiday.query.filter(
-            Holiday.date.between(start_date, end_date)
-        ).all()
-        holidays_set = {h.date for h in holidays_query}
+        holidays_set = holidays_between(start_date, end_date)
 
+        weekmask = configured_weekmask()
         days_data = []
         current_date = start_date
         while current_date <= end_date:
-            day_type = "Work Day"
             entry = entries_map.get(current_date)
 
-            if entry is not None:
-                # An explicit entry exists, it takes highest precedence.
-                # If absence_code is None, it's an explicit "Work Day".
-                day_type = entry.absence_code or "Work Day"
-            elif current_date in holidays_set:
-                day_type = "Holiday"
-            elif current_date.weekday() >= 5:
-                day_type = "Weekend"
+            if entry is not None and not entry.absence_code:
+                # An explicit entry without an absence code overrides the
+                # calendar: it marks the day as a "Work Day".
+                day_type = "Work Day"
+            else:
+                day_type = classify_day(current_date, entry, holidays_set, weekmask)
 
             days_data.append(
                 {
@@ -65,17 +72,74 @@ def get_monthly_log_data(year, month):
         return jsonify({"error": str(e)}), 500
 
 
+def _requested_dates(data):
+    """
+    Collects the dates of an update-days request from its "dates" list and
+    its "ranges" list of {"start", "end"} objects (both inclusive).
+
+    Returns a (dates, error_message) tuple.
+    """
+    if not isinstance(data.get("dates", []), list) or not isinstance(
+        data.get("ranges", []), list
+    ):
+        return None, "dates and ranges must be lists"
+
+    try:
+        dates = {datetime.strptime(d, "%Y-%m-%d").date() for d in data.get("dates", [])}
+        for date_range in data.get("ranges", []):
+            start = datetime.strptime(date_range["start"], "%Y-%m-%d").date()
+            end = datetime.strptime(date_range["end"], "%Y-%m-%d").date()
+            if end < start:
+                return None, "Range end must not be before its start"
+            if (end - start).days + 1 > MAX_RANGE_DAYS:
+                return None, f"A range cannot exceed {MAX_RANGE_DAYS} days"
+            dates.update(
+                start + timedelta(days=i) for i in range((end - start).days + 1)
+            )
+    except (KeyError, TypeError, ValueError):
+        return None, "Invalid date or range"
+
+    return sorted(dates), None
+
+
+def _set_day_types(employee_id, dates, absence_code):
+    """
+    Sets the absence code (None for a work day) of every date with a single
+    upsert. Absences clear the worked time; a work day keeps it.
+    """
+    upsert_schedule_entries(
+        [
+            {
+                "employee_id": employee_id,
+                "date": entry_date,
+                "entries": [],
+                "absence_code": absence_code,
+            }
+            for entry_date in dates
+        ],
+        update_columns=(
+            ["absence_code", "entries"] if absence_code else ["absence_code"]
+        ),
+    )
+
+
 @monthly_log_bp.route("/api/update-days", methods=["POST"])
 def update_day_types():
     """
-    Updates the type for a list of dates.
+    Updates the type for a list of dates and/or date ranges.
     Handles a special "DEFAULT" type to revert to the base calendar state.
     """
     data = request.json
-    if not data or "dates" not in data or "day_type" not in data:
+    if (
+        not data
+        or ("dates" not in data and "ranges" not in data)
+        or "day_type" not in data
+    ):
         return jsonify({"error": "Invalid request body"}), 400
 
-    dates_to_update = [datetime.strptime(d, "%Y-%m-%d").date() for d in data["dates"]]
+    dates_to_update, error = _requested_dates(data)
+    if error:
+        return jsonify({"error": error}), 400
     new_day_type = data["day_type"]
 
     try:
@@ -87,26 +151,11 @@ def update_day_types():
         else:
             # For any other type, create or update entries.
             new_absence_code = None if new_day_type == "Work Day" else new_day_type
-            for entry_date in dates_to_update:
-                existing_entry = ScheduleEntry.query.filter_by(
-                    employee_id=1, date=entry_date
-                ).first()
-
-                if existing_entry:
-                    existing_entry.absence_code = new_absence_code
-                    if new_absence_code:
-                        existing_entry.entries = []
-                else:
-                    new_entry = ScheduleEntry(
-                        employee_id=1,
-                        date=entry_date,
-                        entries=[],
-                        absence_code=new_absence_code,
-                    )
-                    db.session.add(new_entry)
+            _set_day_types(1, dates_to_update, new_absence_code)
 
+        schedule_changed(1, dates_to_update)
         db.session.commit()
-        return jsonify({"status": "success"})
+        return jsonify({"status": "success", "updated": len(dates_to_update)})
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
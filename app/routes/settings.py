@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, render_template, request
 
 from app.db.database import db
 from app.models.models import AbsenceCode, ScheduleEntry
+from app.services.schedule_events import schedule_relabelled
 
 settings_bp = Blueprint("settings", __name__, url_prefix="/settings")
 
@@ -72,7 +73,23 @@ def update_absence_code(code_id):
         return jsonify({"error": "Another code with this name already exists"}), 409
 
     try:
+        # Entries store the code's text, so they are renamed along with it and
+        # the months showing them recomputed
+        using_code = ScheduleEntry.query.filter(
+            ScheduleEntry.absence_code == code_to_update.code
+        )
+        affected = using_code.with_entities(
+            ScheduleEntry.employee_id, ScheduleEntry.date
+        ).all()
+        using_code.update(
+            {ScheduleEntry.absence_code: new_code_str}, synchronize_session=False
+        )
         code_to_update.code = new_code_str
+        for employee_id in {row.employee_id for row in affected}:
+            schedule_relabelled(
+                employee_id,
+                [row.date for row in affected if row.employee_id == employee_id],
+            )
         db.session.commit()
         return jsonify({"id": code_to_update.id, "code": code_to_update.code})
     except Exception as e:
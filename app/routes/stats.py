@@ -0,0 +1,32 @@
+from flask import Blueprint, jsonify
+
+from app.services.holiday_cache import get_holiday_cache
+from app.services.holiday_providers.composite_provider import hedge_stats
+from app.services.holiday_providers.http_client import provider_stats
+from app.services.response_cache import get_response_cache
+
+stats_bp = Blueprint("stats", __name__, url_prefix="/stats")
+
+
+@stats_bp.route("/holiday-cache", methods=["GET"])
+def holiday_cache_stats():
+    """Hit/miss counters of the in-process holiday cache."""
+    return jsonify(get_holiday_cache().stats())
+
+
+@stats_bp.route("/response-cache", methods=["GET"])
+def response_cache_stats():
+    """Hit rates of the month response cache, per cached view."""
+    return jsonify(get_response_cache().stats())
+
+
+@stats_bp.route("/holiday-providers", methods=["GET"])
+def holiday_provider_stats():
+    """Requests, attempts and latency of the holiday providers' HTTP calls."""
+    return jsonify(provider_stats())
+
+
+@stats_bp.route("/holiday-hedging", methods=["GET"])
+def holiday_hedging_stats():
+    """Which source answered the COMPOSITE holiday provider, and how fast."""
+    return jsonify(hedge_stats())
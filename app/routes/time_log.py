@@ -4,7 +4,8 @@ from datetime import datetime, timedelta
 from flask import Blueprint, jsonify, render_template, request
 
 from app.models.models import ScheduleEntry
-from app.utils.time_calculator import calculate_daily_hours
+from app.services.month_versions import conditional_month
+from app.services.response_cache import cached_month
 
 time_log = Blueprint("time_log", __name__, url_prefix="/logs")
 
@@ -15,6 +16,8 @@ def show_logs():
 
 
 @time_log.route("/monthly/<int:year>/<int:month>", methods=["GET"])
+@conditional_month()
+@cached_month("time_log")
 def get_monthly_logs(year, month):
     try:
         # Get start and end dates for the month
@@ -47,7 +50,7 @@ def get_monthly_logs(year, month):
                 )
             else:
                 # If it's a regular work day
-                hours = calculate_daily_hours(entry.entries)
+                hours = entry.worked_minutes / 60
                 formatted_entries.append(
                     {
                         "date": entry.date.strftime("%Y-%m-%d"),
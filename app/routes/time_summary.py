@@ -1,13 +1,54 @@
 from calendar import monthrange
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 
 from flask import Blueprint, jsonify, render_template, request
 
-from app.models.models import Holiday, ScheduleEntry
-from app.utils.time_calculator import calculate_daily_hours
+from app.db.database import db
+from app.services.balance_ledger import get_balance
+from app.services.month_versions import conditional_month, conditional_range
+from app.services.period_service import GRANULARITIES, aggregate_period, period_totals
+from app.services.response_cache import cached_month
 
 time_summary = Blueprint("time_summary", __name__, url_prefix="/summary")
 
+# Upper bound for /summary/range so a single request cannot scan years of data
+MAX_RANGE_DAYS = 366
+
+
+def _parse_range_args(max_days=MAX_RANGE_DAYS):
+    """
+    Reads and validates the start/end query parameters; max_days=None lifts
+    the range limit.
+
+    Returns a (start, end, error_response) tuple; error_response is None
+    when the range is valid.
+    """
+    start_str = request.args.get("start")
+    end_str = request.args.get("end")
+    if not start_str or not end_str:
+        return None, None, (jsonify({"error": "Both start and end are required"}), 400)
+
+    try:
+        start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None, None, (jsonify({"error": "Invalid date format"}), 400)
+
+    if end_date < start_date:
+        return (
+            None,
+            None,
+            (jsonify({"error": "End date must not be before start date"}), 400),
+        )
+    if max_days is not None and (end_date - start_date).days + 1 > max_days:
+        return (
+            None,
+            None,
+            (jsonify({"error": f"Range cannot exceed {max_days} days"}), 400),
+        )
+
+    return start_date, end_date, None
+
 
 @time_summary.route("/", methods=["GET"])
 def show_summary():
@@ -19,91 +60,101 @@ def get_daily_summary(date):
     try:
         # Parse the date string to a datetime object
         date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-        # Fetch relevant records for the day
-        entry = ScheduleEntry.query.filter_by(date=date_obj, employee_id=1).first()
-        holiday = Holiday.query.filter_by(date=date_obj).first()
-
-        # Determine the type of the day with clear precedence
-        day_type = "Work Day"  # Default
-        if entry and entry.absence_code:
-            day_type = entry.absence_code
-        elif holiday:
-            day_type = "Holiday"
-        elif date_obj.weekday() >= 5:  # 5: Saturday, 6: Sunday
-            day_type = "Weekend"
-
-        # Determine required hours and actual hours based on day type
-        required_hours = 0.0
-        hours_worked = 0.0
-
-        if day_type == "Work Day":
-            required_hours = 8.0
-            if entry:
-                hours_worked = calculate_daily_hours(entry.entries)
-
-        # Final response data
-        response_data = {
-            "type": day_type,
-            "hours": hours_worked,
-            "required": required_hours,
-            "difference": hours_worked - required_hours,
-            "absence_code": entry.absence_code if entry else None,
-        }
-
-        return jsonify(response_data)
+    def build():
+        try:
+            period = aggregate_period(date_obj, date_obj, "day")
+            response_data = dict(period["periods"][0]["days"][0])
+            response_data.pop("date")
+
+            return jsonify(response_data)
+
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return conditional_range(date_obj, date_obj, build)
+
+
+@time_summary.route("/range", methods=["GET"])
+def get_range_summary():
+    """
+    Returns the per-day summary for every date between start and end
+    (inclusive), plus the totals for the whole range.
+    """
+    start_date, end_date, error = _parse_range_args()
+    if error:
+        return error
+
+    def build():
+        try:
+            period = aggregate_period(start_date, end_date, "custom")
+            return jsonify(
+                {
+                    "start": period["start"],
+                    "end": period["end"],
+                    "days": period["periods"][0]["days"],
+                    "total": period["total"],
+                    "required": period["required"],
+                    "difference": period["difference"],
+                }
+            )
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    return conditional_range(start_date, end_date, build)
+
+
+@time_summary.route("/period", methods=["GET"])
+def get_period_summary():
+    """
+    Returns the totals between start and end grouped into day, week, month,
+    quarter, year or custom buckets, each with its per-day summaries.
+    """
+    start_date, end_date, error = _parse_range_args()
+    if error:
+        return error
+
+    granularity = request.args.get("granularity", "month")
+    if granularity not in GRANULARITIES:
+        return jsonify({"error": f"Invalid granularity: '{granularity}'"}), 400
 
+    try:
+        return jsonify(aggregate_period(start_date, end_date, granularity))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@time_summary.route("/balance", methods=["GET"])
+def get_balance_summary():
+    """
+    Returns the flex-time balance (worked minus required) between start and
+    end. Served from the balance ledger, so ranges of any length cost the same.
+    """
+    start_date, end_date, error = _parse_range_args(max_days=None)
+    if error:
+        return error
+
+    try:
+        balance = get_balance(1, start_date, end_date)
+        # The ledger may have been built on first use
+        db.session.commit()
+        return jsonify(balance)
     except Exception as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
 
 @time_summary.route("/monthly/<int:year>/<int:month>", methods=["GET"])
+@conditional_month()
+@cached_month("monthly_summary")
 def get_monthly_summary(year, month):
     try:
         start_date = date(year, month, 1)
         _, days_in_month = monthrange(year, month)
         end_date = date(year, month, days_in_month)
 
-        # Fetch all relevant data for the month in optimized queries
-        entries_query = ScheduleEntry.query.filter(
-            ScheduleEntry.date.between(start_date, end_date),
-            ScheduleEntry.employee_id == 1,
-        ).all()
-        entries_map = {entry.date: entry for entry in entries_query}
-
-        holidays_query = Holiday.query.filter(
-            Holiday.date.between(start_date, end_date)
-        ).all()
-        holidays_set = {h.date for h in holidays_query}
-
-        total_worked = 0.0
-        total_required = 0.0
-
-        current_date = start_date
-        while current_date <= end_date:
-            entry = entries_map.get(current_date)
-
-            is_work_day = True
-            if entry and entry.absence_code:
-                is_work_day = False
-            elif current_date in holidays_set:
-                is_work_day = False
-            elif current_date.weekday() >= 5:
-                is_work_day = False
-
-            if is_work_day:
-                total_required += 8.0
-                if entry:
-                    total_worked += calculate_daily_hours(entry.entries)
-
-            current_date += timedelta(days=1)
-
-        monthly_data = {
-            "total": total_worked,
-            "required": total_required,
-            "difference": total_worked - total_required,
-        }
-
-        return jsonify(monthly_data)
+        return jsonify(period_totals(start_date, end_date))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
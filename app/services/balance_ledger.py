@@ -0,0 +1,333 @@
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, func, insert, update
+
+from app.db.database import db
+from app.models.models import BalanceLedger, ScheduleEntry
+from app.services.holiday_cache import get_holiday_cache, holidays_between
+from app.services.period_service import classify_day
+from app.services.work_calendar import WorkCalendar, configured_weekmask
+
+
+def _minutes_per_day() -> int:
+    return int(round(float(current_app.config.get("WORKING_HOURS_PER_DAY", 8)) * 60))
+
+
+def _required_minutes(start: date, end: date) -> int:
+    """Minutes required between start and end (inclusive) with nothing worked."""
+    if end < start:
+        return 0
+    return WorkCalendar.from_db(start, end).required_days(start, end) * (
+        _minutes_per_day()
+    )
+
+
+def _day_balance(
+    day: date,
+    row: Optional[Any],
+    holidays: Set[date],
+    minutes_per_day: int,
+    weekmask: str,
+) -> int:
+    """Worked minus required minutes for one day; non-work days are neutral."""
+    if classify_day(day, row, holidays, weekmask) != "Work Day":
+        return 0
+    worked = int(row.worked_minutes) if row is not None else 0
+    return worked - minutes_per_day
+
+
+def _balances(
+    days: List[date], rows: Mapping[date, Any], holidays: Set[date]
+) -> Dict[date, int]:
+    minutes_per_day = _minutes_per_day()
+    weekmask = configured_weekmask()
+    return {
+        day: _day_balance(day, rows.get(day), holidays, minutes_per_day, weekmask)
+        for day in days
+    }
+
+
+def _balances_between(employee_id: int, start: date, end: date) -> Dict[date, int]:
+    """Balance for every day in [start, end], loaded with two range queries."""
+    rows = (
+        db.session.query(
+            ScheduleEntry.date,
+            ScheduleEntry.absence_code,
+            ScheduleEntry.worked_minutes,
+        )
+        .filter(
+            ScheduleEntry.employee_id == employee_id,
+            ScheduleEntry.date.between(start, end),
+        )
+        .all()
+    )
+    holidays = holidays_between(start, end)
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    return _balances(days, {row.date: row for row in rows}, holidays)
+
+
+def _balances_for(employee_id: int, days: List[date]) -> Dict[date, int]:
+    """Balance for a sparse set of days, loaded with two IN queries."""
+    rows = (
+        db.session.query(
+            ScheduleEntry.date,
+            ScheduleEntry.absence_code,
+            ScheduleEntry.worked_minutes,
+        )
+        .filter(
+            ScheduleEntry.employee_id == employee_id,
+            ScheduleEntry.date.in_(days),
+        )
+        .all()
+    )
+    cache = get_holiday_cache()
+    holidays = {day for day in days if cache.is_holiday(day)}
+    return _balances(days, {row.date: row for row in rows}, holidays)
+
+
+def _bounds(employee_id: int) -> Tuple[Optional[date], Optional[date]]:
+    """First and last day covered by an employee's ledger."""
+    first, last = (
+        db.session.query(func.min(BalanceLedger.date), func.max(BalanceLedger.date))
+        .filter(BalanceLedger.employee_id == employee_id)
+        .one()
+    )
+    return first, last
+
+
+def _cumulative_on(employee_id: int, day: date) -> int:
+    value = (
+        db.session.query(BalanceLedger.cumulative_minutes)
+        .filter(BalanceLedger.employee_id == employee_id, BalanceLedger.date == day)
+        .scalar()
+    )
+    return int(value or 0)
+
+
+def _insert_days(employee_id: int, start: date, end: date, cumulative: int) -> int:
+    """
+    Append ledger rows for [start, end], continuing from the given cumulative
+    value. Returns the net balance of the inserted days.
+    """
+    balances = _balances_between(employee_id, start, end)
+    running = cumulative
+    rows = []
+    for day in sorted(balances):
+        running += balances[day]
+        rows.append(
+            {
+                "employee_id": employee_id,
+                "date": day,
+                "balance_minutes": balances[day],
+                "cumulative_minutes": running,
+            }
+        )
+    if rows:
+        db.session.execute(insert(BalanceLedger), rows)
+    return running - cumulative
+
+
+def _shift_cumulative(employee_id: int, deltas: Dict[date, int]) -> None:
+    """
+    Propagate per-day balance changes into the running sums.
+
+    Between two changed days every row moves by the same amount, the sum of
+    the changes so far, so each such run is one range UPDATE; all runs go in
+    a single executemany of one cached statement.
+    """
+    changed = sorted(day for day, delta in deltas.items() if delta)
+    if not changed:
+        return
+
+    ledger = BalanceLedger.__table__
+    runs = []
+    running = 0
+    for index, day in enumerate(changed):
+        running += deltas[day]
+        if running:
+            runs.append(
+                {
+                    "ledger_employee_id": employee_id,
+                    "shift_from": day,
+                    "shift_to": (
+                        changed[index + 1] if index + 1 < len(changed) else date.max
+                    ),
+                    "shift": running,
+                }
+            )
+    if not runs:
+        return
+
+    db.session.execute(
+        update(ledger)
+        .where(
+            ledger.c.employee_id == bindparam("ledger_employee_id"),
+            ledger.c.date >= bindparam("shift_from"),
+            ledger.c.date < bindparam("shift_to"),
+        )
+        .values(cumulative_minutes=ledger.c.cumulative_minutes + bindparam("shift")),
+        runs,
+    )
+
+
+def rebuild_ledger(employee_id: int) -> None:
+    """Recompute an employee's ledger from the first to the last schedule entry."""
+    db.session.query(BalanceLedger).filter(
+        BalanceLedger.employee_id == employee_id
+    ).delete(synchronize_session=False)
+
+    first, last = (
+        db.session.query(func.min(ScheduleEntry.date), func.max(ScheduleEntry.date))
+        .filter(ScheduleEntry.employee_id == employee_id)
+        .one()
+    )
+    if first is not None:
+        _insert_days(employee_id, first, last, 0)
+
+
+def apply_changes(employee_id: int, dates: Iterable[date], extend: bool = True) -> None:
+    """
+    Update an employee's ledger after the days in `dates` changed.
+
+    Days outside the covered range extend it (when `extend` is set); days
+    inside it get their balance recomputed and the running sums after them
+    shifted by the difference. Must run in the same transaction as the change.
+    """
+    days = sorted(set(dates))
+    if not days:
+        return
+
+    first, last = _bounds(employee_id)
+    if first is None or last is None:
+        if extend:
+            rebuild_ledger(employee_id)
+        return
+
+    if extend and days[0] < first:
+        prepended = _insert_days(employee_id, days[0], first - timedelta(days=1), 0)
+        if prepended:
+            db.session.execute(
+                update(BalanceLedger)
+                .where(
+                    BalanceLedger.employee_id == employee_id,
+                    BalanceLedger.date >= first,
+                )
+                .values(
+                    cumulative_minutes=BalanceLedger.cumulative_minutes + prepended
+                ),
+                execution_options={"synchronize_session": False},
+            )
+    if extend and days[-1] > last:
+        _insert_days(
+            employee_id,
+            last + timedelta(days=1),
+            days[-1],
+            _cumulative_on(employee_id, last),
+        )
+
+    covered = [day for day in days if first <= day <= last]
+    if not covered:
+        return
+
+    current = {
+        row.date: row
+        for row in db.session.query(
+            BalanceLedger.id, BalanceLedger.date, BalanceLedger.balance_minutes
+        )
+        .filter(
+            BalanceLedger.employee_id == employee_id,
+            BalanceLedger.date.in_(covered),
+        )
+        .all()
+    }
+    balances = _balances_for(employee_id, covered)
+    deltas = {day: balances[day] - current[day].balance_minutes for day in covered}
+
+    # One executemany for every changed day
+    changed_rows = [
+        {"id": current[day].id, "balance_minutes": balances[day]}
+        for day, delta in deltas.items()
+        if delta
+    ]
+    if changed_rows:
+        db.session.execute(update(BalanceLedger), changed_rows)
+    _shift_cumulative(employee_id, deltas)
+
+
+def refresh_holiday_dates(dates: Iterable[date]) -> None:
+    """Recompute the covered days of every ledger after holidays changed."""
+    days = sorted(set(dates))
+    if not days:
+        return
+
+    employee_ids = [
+        employee_id
+        for (employee_id,) in db.session.query(BalanceLedger.employee_id)
+        .filter(BalanceLedger.date.between(days[0], days[-1]))
+        .distinct()
+        .all()
+    ]
+    for employee_id in employee_ids:
+        apply_changes(employee_id, days, extend=False)
+
+
+def _cumulative_through(employee_id: int, day: date, first: date, last: date) -> int:
+    """
+    Running balance at the end of `day`, relative to the start of the ledger.
+
+    Days outside the ledger hold no entries, so every working day there
+    counts as fully missed and is taken from the work calendar.
+    """
+    if day < first:
+        return _required_minutes(day + timedelta(days=1), first - timedelta(days=1))
+    if day > last:
+        return _cumulative_on(employee_id, last) - _required_minutes(
+            last + timedelta(days=1), day
+        )
+    return _cumulative_on(employee_id, day)
+
+
+def get_balance(employee_id: int, start: date, end: date) -> Dict[str, Any]:
+    """
+    Flex-time balance between start and end (inclusive).
+
+    Answered from two ledger lookups, whatever the length of the range. The
+    ledger is built on first use when an employee does not have one yet.
+    """
+    day_before = start - timedelta(days=1)
+    cumulative = {
+        row.date: row.cumulative_minutes
+        for row in db.session.query(
+            BalanceLedger.date, BalanceLedger.cumulative_minutes
+        )
+        .filter(
+            BalanceLedger.employee_id == employee_id,
+            BalanceLedger.date.in_([day_before, end]),
+        )
+        .all()
+    }
+
+    if day_before in cumulative and end in cumulative:
+        minutes = cumulative[end] - cumulative[day_before]
+    else:
+        # At least one end falls outside the ledger
+        first, last = _bounds(employee_id)
+        if first is None:
+            rebuild_ledger(employee_id)
+            first, last = _bounds(employee_id)
+
+        if first is None or last is None:
+            minutes = -_required_minutes(start, end)
+        else:
+            minutes = _cumulative_through(employee_id, end, first, last) - (
+                _cumulative_through(employee_id, day_before, first, last)
+            )
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "balance_minutes": minutes,
+        "balance": minutes / 60,
+    }
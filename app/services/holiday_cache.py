@@ -0,0 +1,251 @@
+import threading
+from datetime import date
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+import numpy as np
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event, insert, inspect, update
+from sqlalchemy.orm import Session
+
+from app.db.database import db
+from app.db.repository import dialect_insert
+from app.models.models import Holiday, HolidayVersion
+
+EXTENSION_KEY = "holiday_cache"
+
+# Marks a transaction that bulk-updated or bulk-deleted holidays
+ALL_YEARS = frozenset({"all"})
+
+# Session.info key of the holiday versions read by the current transaction
+VERSIONS_KEY = "holiday_versions"
+
+
+class HolidayYear:
+    """One year of holidays as a set and as a day-of-year bitmap."""
+
+    def __init__(self, year: int, dates: Iterable[date], version: int = 0):
+        self.year = year
+        # The HolidayVersion the dates were loaded at
+        self.version = version
+        self.dates: FrozenSet[date] = frozenset(dates)
+        self.bitmap = np.zeros(366, dtype=bool)
+        for day in self.dates:
+            self.bitmap[day.timetuple().tm_yday - 1] = True
+
+    def __contains__(self, day: object) -> bool:
+        if not isinstance(day, date) or day.year != self.year:
+            return False
+        return bool(self.bitmap[day.timetuple().tm_yday - 1])
+
+
+class HolidayCache:
+    """
+    Process-local cache of the Holiday table, loaded lazily one year at a
+    time. Holidays change about once a year, so summaries read them from
+    here instead of querying the table on every request.
+
+    Each transaction reads the holiday_versions counters once and reloads
+    the cached years whose counter moved, so holidays written by another
+    process (a sync, init_db.py) are picked up by the next request.
+    """
+
+    def __init__(self) -> None:
+        self._years: Dict[int, HolidayYear] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def year(self, year: int) -> HolidayYear:
+        version = _current_versions().get(year, 0)
+        with self._lock:
+            cached = self._years.get(year)
+            if cached is not None and cached.version == version:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        holidays = Holiday.query.filter(
+            Holiday.date.between(date(year, 1, 1), date(year, 12, 31))
+        ).all()
+        loaded = HolidayYear(year, (h.date for h in holidays), version)
+        with self._lock:
+            self._years[year] = loaded
+        return loaded
+
+    def is_holiday(self, day: date) -> bool:
+        return day in self.year(day.year)
+
+    def between(self, start: date, end: date) -> Set[date]:
+        """Holiday dates between start and end (inclusive)."""
+        holidays: Set[date] = set()
+        for year in range(start.year, end.year + 1):
+            holidays.update(d for d in self.year(year).dates if start <= d <= end)
+        return holidays
+
+    def invalidate(self, years: Optional[Iterable[int]] = None) -> None:
+        """Drop the given years, or everything when years is None."""
+        with self._lock:
+            if years is None:
+                self._years.clear()
+            else:
+                for year in years:
+                    self._years.pop(year, None)
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "cached_years": sorted(self._years),
+            }
+
+
+def get_holiday_cache(app: Optional[Flask] = None) -> HolidayCache:
+    """The holiday cache of the given (or current) application."""
+    app = app or current_app._get_current_object()  # type: ignore[attr-defined]
+    cache = app.extensions.get(EXTENSION_KEY)
+    if cache is None:
+        cache = app.extensions[EXTENSION_KEY] = HolidayCache()
+    return cache
+
+
+def holidays_between(start: date, end: date) -> Set[date]:
+    return get_holiday_cache().between(start, end)
+
+
+def invalidate_holiday_dates(dates: Iterable[date]) -> None:
+    """
+    Drop the years of `dates` from this process's cache and bump their
+    versions, so other processes drop them once the write commits.
+    """
+    years = {day.year for day in dates}
+    if not years:
+        return
+    get_holiday_cache().invalidate(years)
+    _mark_pending(db.session(), years)
+    _bump_versions(years)
+
+
+def _current_versions() -> Dict[int, int]:
+    """Holiday version of each year, read once per transaction."""
+    session = db.session()
+    versions = session.info.get(VERSIONS_KEY)
+    if versions is None:
+        versions = {
+            year: version
+            for year, version in session.query(
+                HolidayVersion.year, HolidayVersion.version
+            )
+        }
+        session.info[VERSIONS_KEY] = versions
+    return versions
+
+
+def _bump_versions(years: Set[int]) -> None:
+    """Increment the counters of `years` in the database itself."""
+    rows = [{"year": year, "version": 1} for year in sorted(years)]
+    statement = dialect_insert(HolidayVersion)
+    if statement is not None:
+        statement = statement.values(rows)
+        db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["year"],
+                set_={"version": HolidayVersion.version + 1},
+            )
+        )
+        return
+
+    # Other databases: increment what exists, then create the rest
+    db.session.execute(
+        update(HolidayVersion)
+        .where(HolidayVersion.year.in_(years))
+        .values(version=HolidayVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    existing = {
+        year
+        for (year,) in db.session.query(HolidayVersion.year).filter(
+            HolidayVersion.year.in_(years)
+        )
+    }
+    missing = [row for row in rows if row["year"] not in existing]
+    if missing:
+        db.session.execute(insert(HolidayVersion), missing)
+
+
+def _mark_pending(session: Session, years: Set[int]) -> None:
+    """Remember years written in the session's transaction until it ends."""
+    pending = session.info.setdefault(EXTENSION_KEY, set())
+    if pending is not ALL_YEARS:
+        pending.update(years)
+
+
+def _holiday_years(session: Session) -> Set[int]:
+    """Years touched by the Holiday rows pending in a flush."""
+    years: Set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Holiday):
+            continue
+        # Include the previous date of an edited holiday
+        history = inspect(obj).attrs.date.history  # type: ignore[attr-defined]
+        for day in (obj.date, *(history.deleted or ())):
+            if isinstance(day, date):
+                years.add(day.year)
+    return years
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    years = _holiday_years(session)
+    if years and has_app_context():
+        get_holiday_cache().invalidate(years)
+        _mark_pending(session, years)
+
+
+def _after_bulk_write(orm_execute_state) -> None:
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Holiday and has_app_context():
+        get_holiday_cache().invalidate()
+        orm_execute_state.session.info[EXTENSION_KEY] = ALL_YEARS
+
+
+def _after_commit(session: Session) -> None:
+    # Invalidate again once the change is visible to other sessions, in case
+    # another request reloaded a year between the flush and the commit
+    pending = session.info.pop(EXTENSION_KEY, None)
+    if pending and has_app_context():
+        get_holiday_cache().invalidate(None if pending is ALL_YEARS else pending)
+
+
+def _after_rollback(session: Session) -> None:
+    # A year reloaded after the flush holds rows that never got committed
+    pending = session.info.pop(EXTENSION_KEY, None)
+    if pending and has_app_context():
+        get_holiday_cache().invalidate(None if pending is ALL_YEARS else pending)
+
+
+def _after_transaction_end(session: Session, transaction) -> None:
+    # The next transaction may see versions committed in the meantime
+    if transaction.parent is None:
+        session.info.pop(VERSIONS_KEY, None)
+
+
+def init_holiday_cache(app: Flask) -> None:
+    """Attach a fresh cache to the app and watch the session for holiday writes."""
+    app.extensions[EXTENSION_KEY] = HolidayCache()
+    listeners: Tuple[Tuple[str, Callable[..., None]], ...] = (
+        ("after_flush", _after_flush),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+        ("after_transaction_end", _after_transaction_end),
+        ("do_orm_execute", _after_bulk_write),
+    )
+    for name, listener in listeners:
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import requests
 
 from app.models.models import Holiday
+from app.services.holiday_providers.http_client import HolidayHttpClient
 
 
 class ArgentinaApiProvider:
@@ -11,8 +12,9 @@ class ArgentinaApiProvider:
     Holiday provider that fetches holidays from the ArgentinaDatos API.
     """
 
-    def __init__(self, api_url: str):
+    def __init__(self, api_url: str, client: Optional[HolidayHttpClient] = None):
         self.url_template = api_url
+        self.client = client or HolidayHttpClient("ARGENTINA_API")
 
     def get_holidays(self, year: int) -> List[Holiday]:
         """
@@ -20,9 +22,8 @@ class ArgentinaApiProvider:
         """
         url = self.url_template.format(year=year)
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            # Unchanged years come back from the cache without decoding
+            data = self.client.fetch(url, lambda response: response.json())
         except requests.RequestException as e:
             print(f"Error fetching holiday data from API for year {year}: {e}")
             return []
@@ -1,13 +1,52 @@
 import json
 import re
 from datetime import datetime
-from typing import Any, Dict, List, cast
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 
 from app.models.models import Holiday
+from app.services.holiday_providers.http_client import HolidayHttpClient
+
+# Characters of the page fed to the parser between checks for the script
+SCAN_CHUNK_SIZE = 16 * 1024
+
+
+class HolidayScriptFinder(HTMLParser):
+    """
+    Streams through a page keeping only <script> bodies, until one defines
+    `const holidays{year}`. The rest of the page is never built into a tree.
+    """
+
+    def __init__(self, year: int):
+        super().__init__()
+        self._pattern = re.compile(rf"const holidays{year}\s*=")
+        self._parts: Optional[List[str]] = None
+        self.script: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "script":
+            self._parts = []
+
+    def handle_data(self, data: str) -> None:
+        if self._parts is not None:
+            self._parts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._parts is not None:
+            content = "".join(self._parts)
+            self._parts = None
+            if self.script is None and self._pattern.search(content):
+                self.script = content
+
+    def find(self, html: str) -> Optional[str]:
+        """The holiday script of `html`, reading no further than its end."""
+        for start in range(0, len(html), SCAN_CHUNK_SIZE):
+            self.feed(html[start : start + SCAN_CHUNK_SIZE])
+            if self.script is not None:
+                break
+        return self.script
 
 
 class ArgentinaWebsiteProvider:
@@ -16,8 +55,9 @@ class ArgentinaWebsiteProvider:
     This provider parses an embedded JSON object from a <script> tag.
     """
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, client: Optional[HolidayHttpClient] = None):
         self.url_template = base_url
+        self.client = client or HolidayHttpClient("ARGENTINA_WEBSITE")
 
     def _parse_holidays_from_script(self, script_content: str) -> List[Dict[str, Any]]:
         """
@@ -42,6 +82,13 @@ class ArgentinaWebsiteProvider:
             print(f"Failed to decode JSON from script: {e}")
             return []
 
+    def _extract_holidays(self, html: str, year: int) -> List[Dict[str, Any]]:
+        """The raw holiday entries of the page's `const holidays{year}` script."""
+        script = HolidayScriptFinder(year).find(html)
+        if script:
+            return self._parse_holidays_from_script(script)
+        return []
+
     def get_holidays(self, year: int) -> List[Holiday]:
         """
         Scrapes Argentine holidays for a given year and returns them as Holiday objects.
@@ -51,25 +98,16 @@ class ArgentinaWebsiteProvider:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
-            response = requests.get(url, timeout=10, headers=headers)
-            response.raise_for_status()
+            # Unchanged years come back from the cache without parsing the page
+            holidays_list = self.client.fetch(
+                url,
+                lambda response: self._extract_holidays(response.text, year),
+                headers=headers,
+            )
         except requests.RequestException as e:
             print(f"Error fetching holiday data for year {year}: {e}")
             return []
 
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        holidays_list = []
-        script_tag = soup.find(
-            "script", string=re.compile(rf"const holidays{year}\s*=")
-        )
-
-        # Add explicit check for None and assert the type to satisfy mypy
-        if script_tag:
-            assert isinstance(script_tag, Tag)
-            if script_tag.string:
-                holidays_list = self._parse_holidays_from_script(script_tag.string)
-
         if not holidays_list:
             return []
 
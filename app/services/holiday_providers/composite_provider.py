@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from app.models.models import Holiday
+from app.services.holiday_providers.base import HolidayProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_AFTER = 2.0
+
+# (source name, holidays, seconds taken) of one provider call
+SourceResult = Tuple[str, List[Holiday], float]
+
+
+@dataclass
+class HedgeOutcome:
+    """How one year was fetched."""
+
+    year: int
+    winner: Optional[str] = None
+    hedged: bool = False
+    # Seconds taken by each source that finished before the year was returned
+    latencies: Dict[str, float] = field(default_factory=dict)
+    # Dates the winner and another source disagreed on, when cross-checking
+    mismatched_dates: List[str] = field(default_factory=list)
+
+
+class HedgeStats:
+    """Wins, hedges and per-source latency of the composite provider."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.years = 0
+        self.hedged = 0
+        self.mismatches = 0
+        self.wins: Dict[str, int] = {}
+        self.calls: Dict[str, int] = {}
+        self.empty: Dict[str, int] = {}
+        self.latency: Dict[str, float] = {}
+
+    def record_source(self, name: str, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.empty[name] = self.empty.get(name, 0) + int(not ok)
+            self.latency[name] = self.latency.get(name, 0.0) + elapsed
+
+    def record_outcome(self, outcome: HedgeOutcome) -> None:
+        with self._lock:
+            self.years += 1
+            self.hedged += int(outcome.hedged)
+            self.mismatches += int(bool(outcome.mismatched_dates))
+            if outcome.winner:
+                self.wins[outcome.winner] = self.wins.get(outcome.winner, 0) + 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "years": self.years,
+                "hedged": self.hedged,
+                "mismatches": self.mismatches,
+                "sources": {
+                    name: {
+                        "calls": calls,
+                        "wins": self.wins.get(name, 0),
+                        "empty": self.empty[name],
+                        "avg_latency": round(self.latency[name] / calls, 4),
+                    }
+                    for name, calls in sorted(self.calls.items())
+                },
+            }
+
+
+_stats = HedgeStats()
+
+
+def hedge_stats() -> Dict[str, object]:
+    return _stats.stats()
+
+
+class CompositeHolidayProvider:
+    """
+    Asks several providers for a year and returns the first non-empty answer.
+
+    The first source is asked right away; the next one when the previous
+    has not answered within `hedge_after` seconds, or as soon as it comes
+    back empty. With `cross_check`, every source is asked at once and the
+    winner's dates are compared with the other sources' before returning.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Tuple[str, HolidayProvider]],
+        hedge_after: float = DEFAULT_HEDGE_AFTER,
+        cross_check: bool = False,
+    ):
+        if not sources:
+            raise ValueError("CompositeHolidayProvider needs at least one source")
+        self.sources = list(sources)
+        self.hedge_after = hedge_after
+        self.cross_check = cross_check
+        self.outcomes: Dict[int, HedgeOutcome] = {}
+
+    def get_holidays(self, year: int) -> List[Holiday]:
+        outcome = HedgeOutcome(year)
+        remaining = list(self.sources)
+        running: Set[Future] = set()
+        # Losing requests are left to finish on their own
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.sources), thread_name_prefix="holiday-hedge"
+        )
+
+        def launch() -> None:
+            name, provider = remaining.pop(0)
+            running.add(executor.submit(self._call, name, provider, year))
+
+        winner: Optional[SourceResult] = None
+        others: List[SourceResult] = []
+        try:
+            launch()
+            while self.cross_check and remaining:
+                launch()
+
+            while running:
+                done, running = wait(
+                    running,
+                    timeout=self.hedge_after if remaining else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    outcome.hedged = True
+                    launch()
+                    continue
+                for future in done:
+                    result = future.result()
+                    outcome.latencies[result[0]] = result[2]
+                    if winner is None and result[1]:
+                        winner = result
+                    else:
+                        others.append(result)
+                if winner is not None:
+                    break
+                if remaining:
+                    # The sources so far came back empty; don't wait for a hedge
+                    launch()
+
+            if winner is not None and self.cross_check:
+                for future in wait(running).done:
+                    result = future.result()
+                    outcome.latencies[result[0]] = result[2]
+                    others.append(result)
+                outcome.mismatched_dates = _mismatched_dates(winner, others)
+        finally:
+            executor.shutdown(wait=False)
+
+        if winner is not None:
+            outcome.winner = winner[0]
+        self.outcomes[year] = outcome
+        _stats.record_outcome(outcome)
+        logger.info(
+            "Holidays %d from %s%s; latencies %s",
+            year,
+            outcome.winner or "no source",
+            " (hedged)" if outcome.hedged else "",
+            {name: round(elapsed, 3) for name, elapsed in outcome.latencies.items()},
+        )
+        if outcome.mismatched_dates:
+            logger.warning(
+                "Holiday sources disagree for %d on %s",
+                year,
+                ", ".join(outcome.mismatched_dates),
+            )
+        return winner[1] if winner is not None else []
+
+    @staticmethod
+    def _call(name: str, provider: HolidayProvider, year: int) -> SourceResult:
+        start = time.perf_counter()
+        try:
+            holidays = provider.get_holidays(year)
+        except Exception:
+            logger.exception("Holiday source %s failed for %d", name, year)
+            holidays = []
+        elapsed = time.perf_counter() - start
+        _stats.record_source(name, elapsed, bool(holidays))
+        return name, holidays, elapsed
+
+
+def _mismatched_dates(winner: SourceResult, others: List[SourceResult]) -> List[str]:
+    """Dates only some of the sources with an answer list, ISO formatted."""
+    dates = {holiday.date for holiday in winner[1]}
+    mismatched: Set[str] = set()
+    for _, holidays, _ in others:
+        if holidays:
+            mismatched |= {
+                day.isoformat() for day in dates ^ {h.date for h in holidays}
+            }
+    return sorted(mismatched)
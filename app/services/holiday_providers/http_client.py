@@ -0,0 +1,300 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Responses worth another attempt; any other error goes back to the provider
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+# Upper bound for one backoff sleep, Retry-After included
+MAX_BACKOFF = 8.0
+
+# Connections kept alive per host
+POOL_SIZE = 4
+
+# Bump when the providers change what they extract from a response, so older
+# cache entries are downloaded again
+CACHE_VERSION = 1
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """The keep-alive session shared by all holiday providers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class ProviderStats:
+    """Request, attempt and latency counters of one provider."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, attempts: int, latency: float, failed: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.attempts += attempts
+            self.failures += int(failed)
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.attempts - self.requests,
+                "failures": self.failures,
+                "not_modified": self.not_modified,
+                "avg_latency": (
+                    round(self.total_latency / self.requests, 4)
+                    if self.requests
+                    else 0.0
+                ),
+                "max_latency": round(self.max_latency, 4),
+            }
+
+
+_stats: Dict[str, ProviderStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_provider_stats(name: str) -> ProviderStats:
+    with _stats_lock:
+        return _stats.setdefault(name, ProviderStats())
+
+
+def provider_stats() -> Dict[str, Dict[str, object]]:
+    """Counters of every provider that has made a request, by name."""
+    with _stats_lock:
+        counters = dict(_stats)
+    return {name: counter.stats() for name, counter in sorted(counters.items())}
+
+
+class HttpCache:
+    """
+    What the providers extracted from a response, kept on disk with the
+    response's ETag and Last-Modified so the next fetch can revalidate it.
+    One JSON file per URL.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable cache entry for %s: %s", url, e)
+            return None
+        if entry.get("version") != CACHE_VERSION or entry.get("url") != url:
+            return None
+        return entry
+
+    def store(self, url: str, response: requests.Response, data: Any) -> None:
+        """Save `data` extracted from `response`; failures only cost a download."""
+        if not data:
+            # A 304 would keep answering with nothing, e.g. a page that did
+            # not list the year's holidays yet
+            self.discard(url)
+            return
+        entry = {
+            "version": CACHE_VERSION,
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "data": data,
+        }
+        if not entry["etag"] and not entry["last_modified"]:
+            # Nothing to revalidate with
+            return
+        path = self._path(url)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not cache the response of %s: %s", url, e)
+
+    def discard(self, url: str) -> None:
+        try:
+            os.remove(self._path(url))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove the cache entry of %s: %s", url, e)
+
+
+def _conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+class HolidayHttpClient:
+    """
+    GETs for a holiday provider over the shared session. Connection errors,
+    timeouts and RETRY_STATUSES are retried up to `retries` times, sleeping
+    a random time up to `backoff * 2**n` seconds between attempts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        session: Optional[requests.Session] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session = session
+        self.cache = cache
+        self.stats = get_provider_stats(name)
+
+    @classmethod
+    def from_config(cls, name: str, config: Any) -> "HolidayHttpClient":
+        cache_dir = getattr(config, "HOLIDAY_HTTP_CACHE_DIR", None)
+        return cls(
+            name,
+            timeout=float(getattr(config, "HOLIDAY_HTTP_TIMEOUT", DEFAULT_TIMEOUT)),
+            retries=int(getattr(config, "HOLIDAY_HTTP_RETRIES", DEFAULT_RETRIES)),
+            backoff=float(getattr(config, "HOLIDAY_HTTP_BACKOFF", DEFAULT_BACKOFF)),
+            cache=HttpCache(cache_dir) if cache_dir else None,
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session if self._session is not None else get_session()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        The successful response for `url`; raises requests.RequestException
+        once the retries are used up or for errors not worth retrying.
+        """
+        attempts = 0
+        failed = True
+        start = time.perf_counter()
+        try:
+            while True:
+                attempts += 1
+                retry_after = None
+                try:
+                    response = self.session.get(url, timeout=self.timeout, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempts > self.retries:
+                        raise
+                    logger.warning("%s: attempt %d failed: %s", url, attempts, e)
+                else:
+                    if (
+                        response.status_code not in RETRY_STATUSES
+                        or attempts > self.retries
+                    ):
+                        response.raise_for_status()
+                        failed = False
+                        return response
+                    logger.warning(
+                        "%s: attempt %d got HTTP %d",
+                        url,
+                        attempts,
+                        response.status_code,
+                    )
+                    retry_after = _retry_after(response)
+                    response.close()
+                time.sleep(self._delay(attempts, retry_after))
+        finally:
+            self.stats.record(attempts, time.perf_counter() - start, failed)
+
+    def fetch(
+        self, url: str, extract: Callable[[requests.Response], Any], **kwargs: Any
+    ) -> Any:
+        """
+        `extract(response)` for `url`. With a cache, the request carries the
+        stored validators and a 304 returns the stored extract without calling
+        `extract`; the extract must be JSON serializable.
+        """
+        entry = self.cache.load(url) if self.cache is not None else None
+        if entry is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **_conditional_headers(entry),
+            }
+
+        response = self.get(url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            self.stats.record_not_modified()
+            return entry["data"]
+
+        data = extract(response)
+        if self.cache is not None:
+            self.cache.store(url, response, data)
+        return data
+
+    def _delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        # Full jitter keeps clients that failed together from retrying together
+        delay = random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, MAX_BACKOFF))
+        return delay
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Retry-After in seconds; the HTTP-date form is ignored."""
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
@@ -5,12 +5,18 @@ from app.services.holiday_providers.argentina_website_provider import (
     ArgentinaWebsiteProvider,
 )
 from app.services.holiday_providers.base import HolidayProvider
+from app.services.holiday_providers.composite_provider import (
+    DEFAULT_HEDGE_AFTER,
+    CompositeHolidayProvider,
+)
+from app.services.holiday_providers.http_client import HolidayHttpClient
 
 # A mapping of provider names to their corresponding classes.
 # This makes it easy to add new providers in the future.
 PROVIDER_MAP = {
     "ARGENTINA_WEBSITE": ArgentinaWebsiteProvider,
     "ARGENTINA_API": ArgentinaApiProvider,
+    "COMPOSITE": CompositeHolidayProvider,
 }
 
 
@@ -28,16 +34,23 @@ def get_holiday_provider(config: Config) -> HolidayProvider:
 
     # Specific initialization logic for each provider
     if provider_name.upper() == "ARGENTINA_WEBSITE":
-        base_url = getattr(config, "HOLIDAYS_BASE_URL", None)
-        if not base_url:
-            raise ValueError("HOLIDAYS_BASE_URL is not configured.")
-        return ArgentinaWebsiteProvider(base_url=base_url)
+        return _website_provider(config)
 
     if provider_name.upper() == "ARGENTINA_API":
-        api_url = getattr(config, "HOLIDAY_API_URL", None)
-        if not api_url:
-            raise ValueError("HOLIDAY_API_URL is not configured.")
-        return ArgentinaApiProvider(api_url=api_url)
+        return _api_provider(config)
+
+    if provider_name.upper() == "COMPOSITE":
+        # The API answers faster and more reliably; the website is the hedge
+        return CompositeHolidayProvider(
+            [
+                ("ARGENTINA_API", _api_provider(config)),
+                ("ARGENTINA_WEBSITE", _website_provider(config)),
+            ],
+            hedge_after=float(
+                getattr(config, "HOLIDAY_HEDGE_AFTER", DEFAULT_HEDGE_AFTER)
+            ),
+            cross_check=bool(getattr(config, "HOLIDAY_CROSS_CHECK", False)),
+        )
 
     # This part would be extended for other providers
     # For now, we raise an error if the provider is in the map but has no
@@ -45,3 +58,23 @@ def get_holiday_provider(config: Config) -> HolidayProvider:
     raise NotImplementedError(
         f"Initialization logic for provider '{provider_name}' not implemented."
     )
+
+
+def _website_provider(config: Config) -> ArgentinaWebsiteProvider:
+    base_url = getattr(config, "HOLIDAYS_BASE_URL", None)
+    if not base_url:
+        raise ValueError("HOLIDAYS_BASE_URL is not configured.")
+    return ArgentinaWebsiteProvider(
+        base_url=base_url,
+        client=HolidayHttpClient.from_config("ARGENTINA_WEBSITE", config),
+    )
+
+
+def _api_provider(config: Config) -> ArgentinaApiProvider:
+    api_url = getattr(config, "HOLIDAY_API_URL", None)
+    if not api_url:
+        raise ValueError("HOLIDAY_API_URL is not configured.")
+    return ArgentinaApiProvider(
+        api_url=api_url,
+        client=HolidayHttpClient.from_config("ARGENTINA_API", config),
+    )
@@ -0,0 +1,119 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Iterable, List, Optional
+
+from flask import current_app
+
+from app.db.database import db
+from app.models.models import Holiday
+from app.services.holiday_providers.base import HolidayProvider
+from app.services.holiday_service import get_holiday_provider
+from app.services.schedule_events import holidays_changed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class YearSync:
+    """Outcome of fetching one year."""
+
+    year: int
+    holidays: List[Holiday] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.holidays)
+
+
+@dataclass
+class SyncReport:
+    years: List[YearSync]
+    saved: int = 0
+    elapsed: float = 0.0
+
+
+class HolidaySyncService:
+    """
+    Fetches holidays for several years at once, at most `workers` years in
+    flight, and replaces the stored holidays of every year that returned any.
+    """
+
+    def __init__(self, provider: HolidayProvider, workers: int = DEFAULT_WORKERS):
+        self.provider = provider
+        self.workers = max(1, workers)
+
+    @classmethod
+    def from_config(cls, config: Any) -> "HolidaySyncService":
+        return cls(
+            get_holiday_provider(config),
+            int(getattr(config, "HOLIDAY_SYNC_WORKERS", DEFAULT_WORKERS)),
+        )
+
+    def fetch(self, years: Iterable[int]) -> List[YearSync]:
+        """Fetch each year on the thread pool; results are in year order."""
+        years = sorted(set(years))
+        if not years:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.workers, len(years)),
+            thread_name_prefix="holiday-sync",
+        ) as executor:
+            return list(executor.map(self._fetch_year, years))
+
+    def _fetch_year(self, year: int) -> YearSync:
+        start = time.perf_counter()
+        try:
+            holidays = self.provider.get_holidays(year)
+            result = YearSync(year, holidays)
+        except Exception as e:
+            logger.exception("Fetching the holidays of %d failed", year)
+            result = YearSync(year, error=str(e))
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def sync(self, years: Iterable[int]) -> SyncReport:
+        """
+        Fetch `years` and store them in one transaction. Years that failed or
+        came back empty keep their current holidays.
+        """
+        start = time.perf_counter()
+        report = SyncReport(self.fetch(years))
+
+        fetched = [result for result in report.years if result.ok]
+        if fetched:
+            # One holiday per date, the last one a provider returned
+            holidays = {h.date: h for result in fetched for h in result.holidays}
+            stale = Holiday.query.filter(
+                db.or_(
+                    *(
+                        Holiday.date.between(
+                            date(result.year, 1, 1), date(result.year, 12, 31)
+                        )
+                        for result in fetched
+                    )
+                )
+            )
+            previous_dates = [holiday.date for holiday in stale]
+            stale.delete(synchronize_session=False)
+            db.session.add_all(holidays.values())
+            holidays_changed(previous_dates + list(holidays))
+            db.session.commit()
+            report.saved = len(holidays)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+def sync_holidays(years: Iterable[int]) -> SyncReport:
+    """Sync `years` with the current application's holiday provider."""
+    # The provider factory reads settings as attributes
+    config = SimpleNamespace(**current_app.config)
+    return HolidaySyncService.from_config(config).sync(years)
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from flask import Flask, current_app
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_KEY = "import_jobs"
+
+# An upload goes queued -> parsing -> parsed -> importing -> done, or ends
+# in failed at any step
+STAGE_QUEUED = "queued"
+STAGE_PARSING = "parsing"
+STAGE_PARSED = "parsed"
+STAGE_IMPORTING = "importing"
+STAGE_DONE = "done"
+STAGE_FAILED = "failed"
+
+FINISHED_STAGES = (STAGE_PARSED, STAGE_DONE, STAGE_FAILED)
+
+# What a job does with its upload
+KIND_PARSE = "parse"
+KIND_IMPORT = "import"
+
+# Finished jobs are forgotten after this many seconds
+JOB_TTL = 3600
+
+
+@dataclass
+class ImportJob:
+    """Progress of the background work on one upload."""
+
+    upload_id: str
+    kind: str
+    stage: str = STAGE_QUEUED
+    total_rows: int = 0
+    processed_rows: int = 0
+    # Outcome for the user once the job has finished
+    message: Optional[str] = None
+    error: Optional[str] = None
+    updated_at: float = field(default_factory=time.time)
+    # perf_counter() when the current stage started
+    stage_started: float = field(default_factory=time.perf_counter)
+    stage_elapsed: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def finished(self) -> bool:
+        return self.stage in FINISHED_STAGES
+
+    def update(self, **changes: Any) -> None:
+        with self._lock:
+            if "stage" in changes and changes["stage"] != self.stage:
+                self.stage_started = time.perf_counter()
+                self.stage_elapsed = 0.0
+            for name, value in changes.items():
+                setattr(self, name, value)
+            if self.finished:
+                self.stage_elapsed = time.perf_counter() - self.stage_started
+            self.updated_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = (
+                self.stage_elapsed
+                if self.finished
+                else time.perf_counter() - self.stage_started
+            )
+            # Parsing is the first half of the work, writing the second
+            if self.stage in (STAGE_QUEUED, STAGE_PARSING):
+                progress = 0.0
+            elif self.stage == STAGE_IMPORTING and self.total_rows:
+                progress = 50.0 + 50.0 * self.processed_rows / self.total_rows
+            elif self.stage == STAGE_IMPORTING:
+                progress = 50.0
+            elif self.stage == STAGE_PARSED:
+                progress = 50.0
+            else:
+                progress = 100.0
+            return {
+                "upload_id": self.upload_id,
+                "kind": self.kind,
+                "stage": self.stage,
+                "finished": self.finished,
+                "progress": round(progress, 1),
+                "total_rows": self.total_rows,
+                "processed_rows": self.processed_rows,
+                "rows_per_second": (
+                    round(self.processed_rows / elapsed, 1) if elapsed > 0 else None
+                ),
+                "elapsed": round(elapsed, 3),
+                "message": self.message,
+                "error": self.error,
+            }
+
+
+class ImportJobManager:
+    """
+    Runs import work on a local thread pool, one job per upload. With no
+    workers, jobs run inline in the calling request.
+    """
+
+    def __init__(self, app: Flask, workers: int):
+        self._app = app
+        self._jobs: Dict[str, ImportJob] = {}
+        self._lock = threading.Lock()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import-job")
+            if workers > 0
+            else None
+        )
+
+    @property
+    def inline(self) -> bool:
+        return self._executor is None
+
+    def get(self, upload_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            return self._jobs.get(upload_id)
+
+    def submit(
+        self, upload_id: str, kind: str, task: Callable[[ImportJob], None]
+    ) -> ImportJob:
+        """Queue `task(job)` for the upload, replacing its finished job."""
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(upload_id)
+            if job is not None and not job.finished:
+                raise RuntimeError(f"Upload {upload_id} is already being processed")
+            job = self._jobs[upload_id] = ImportJob(upload_id, kind)
+
+        if self._executor is None:
+            self._run(job, task)
+        else:
+            self._executor.submit(self._run, job, task)
+        return job
+
+    def discard(self, upload_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(upload_id, None)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _run(self, job: ImportJob, task: Callable[[ImportJob], None]) -> None:
+        if self.inline:
+            self._execute(job, task)
+            return
+        # Pool threads need their own app context (and so database session)
+        with self._app.app_context():
+            self._execute(job, task)
+
+    @staticmethod
+    def _execute(job: ImportJob, task: Callable[[ImportJob], None]) -> None:
+        try:
+            task(job)
+        except Exception as e:
+            logger.exception("Import job for %s failed", job.upload_id)
+            job.update(stage=STAGE_FAILED, error=str(e))
+
+    def _prune(self) -> None:
+        cutoff = time.time() - JOB_TTL
+        for upload_id, job in list(self._jobs.items()):
+            if job.finished and job.updated_at < cutoff:
+                del self._jobs[upload_id]
+
+
+def init_import_jobs(app: Flask) -> ImportJobManager:
+    manager = app.extensions[EXTENSION_KEY] = ImportJobManager(
+        app, int(app.config.get("IMPORT_JOB_WORKERS", 2))
+    )
+    return manager
+
+
+def get_import_jobs() -> ImportJobManager:
+    """The import job manager of the current application."""
+    manager: Optional[ImportJobManager] = current_app.extensions.get(EXTENSION_KEY)
+    if manager is None:
+        manager = init_import_jobs(
+            current_app._get_current_object()  # type: ignore[attr-defined]
+        )
+    return manager
@@ -1,7 +1,12 @@
 import io
-from typing import Any, List, Optional
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
+import numpy as np
+import openpyxl  # type: ignore
 import pandas as pd  # type: ignore
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype  # type: ignore
 
 from app.services.importer.protocol import (
     ImporterProtocol,
@@ -10,79 +15,134 @@ from app.services.importer.protocol import (
 )
 from app.utils.validators import validate_date, validate_time_format
 
+MISSING_DATE_COLUMN = "Could not find 'Fecha' or 'Date' column"
+
+# Whole-column equivalents of validate_date (datetime.strptime "%Y-%m-%d",
+# which also accepts unpadded months and days) and validate_time_format
+DATE_PATTERN = r"(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+TIME_PATTERN = r"(?:[01][0-9]|2[0-3]):[0-5][0-9]"
+
+# pandas' default missing-value strings, passed to read_excel explicitly so
+# the streaming path turns the same cells into NA
+NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
 
 class ExcelImporter(ImporterProtocol):
     def parse(self, file_content: Any) -> ImportResult:
+        # .xlsx workbooks are zip files and are streamed row by row; legacy
+        # .xls files still go through pandas
+        if isinstance(file_content, bytes) and zipfile.is_zipfile(
+            io.BytesIO(file_content)
+        ):
+            return self._parse_streaming(file_content)
+        return self._parse_dataframe(file_content)
+
+    def _parse_streaming(self, file_content: bytes) -> ImportResult:
         records: List[TimeEntryRecord] = []
         errors: List[str] = []
 
         try:
-            # Read Excel file
-            df = pd.read_excel(io.BytesIO(file_content))
+            # Same options pandas uses, without building a DataFrame
+            workbook = openpyxl.load_workbook(
+                io.BytesIO(file_content),
+                read_only=True,
+                data_only=True,
+                keep_links=False,
+            )
+            try:
+                rows = workbook.worksheets[0].iter_rows(values_only=True)
+                header = next(rows, ())
+                col_map = self._map_columns(
+                    (
+                        f"Unnamed: {i}" if value is None else value
+                        for i, value in enumerate(header)
+                    )
+                )
+                if "date" not in col_map:
+                    errors.append(MISSING_DATE_COLUMN)
+                    return ImportResult([], 0, 0, errors)
 
-            # Normalize headers
-            df.columns = df.columns.astype(str).str.lower().str.strip()
-
-            # Map columns
-            col_map = {}
-            for col in df.columns:
-                if "fecha" in col or "date" in col:
-                    col_map["date"] = col
-                elif "entrada" in col or "in" in col:
-                    col_map["entry"] = col
-                elif "salida" in col or "out" in col:
-                    col_map["exit"] = col
-                elif "observ" in col or "note" in col:
-                    col_map["obs"] = col
+                records.extend(self.iter_records(rows, col_map))
+            finally:
+                workbook.close()
 
-            if "date" not in col_map:
-                errors.append("Could not find 'Fecha' or 'Date' column")
-                return ImportResult([], 0, 0, errors)
+        except Exception as e:
+            errors.append(f"Error parsing Excel: {str(e)}")
 
-            for _, row in df.iterrows():
-                date_val = row[col_map["date"]]
-                if pd.isna(date_val):
-                    continue
+        valid_records = sum(1 for r in records if r.is_valid)
+        return ImportResult(records, len(records), valid_records, errors)
 
-                # Handle dates
-                if isinstance(date_val, pd.Timestamp):
-                    date_str = date_val.strftime("%Y-%m-%d")
-                else:
-                    date_str = str(date_val).strip()
+    def iter_records(
+        self, rows: Iterable[Sequence[Any]], col_map: Dict[str, int]
+    ) -> Iterator[TimeEntryRecord]:
+        """
+        Lazily turn worksheet rows (after the header) into records, reading
+        only the mapped cells so memory does not grow with the sheet.
+        """
+        for row in rows:
+            values = {key: self._cell(row, index) for key, index in col_map.items()}
+            record = self._build_record(
+                values["date"],
+                values.get("entry"),
+                values.get("exit"),
+                values.get("obs"),
+            )
+            if record is not None:
+                yield record
 
-                entry_val = (
-                    row.get(col_map.get("entry")) if "entry" in col_map else None
-                )
-                exit_val = row.get(col_map.get("exit")) if "exit" in col_map else None
-                obs_val = row.get(col_map.get("obs")) if "obs" in col_map else None
-
-                entry_str = self._format_time(entry_val)
-                exit_str = self._format_time(exit_val)
-
-                # Logic for validating
-                is_valid = True
-                error_msg = None
-
-                if not validate_date(date_str):
-                    is_valid = False
-                    error_msg = f"Invalid date format: {date_str}"
-                elif entry_str and not validate_time_format(entry_str):
-                    is_valid = False
-                    error_msg = f"Invalid entry time: {entry_str}"
-                elif exit_str and not validate_time_format(exit_str):
-                    is_valid = False
-                    error_msg = f"Invalid exit time: {exit_str}"
-
-                records.append(
-                    TimeEntryRecord(
-                        date=date_str,
-                        entry_time=entry_str,
-                        exit_time=exit_str,
-                        observation=str(obs_val) if pd.notna(obs_val) else None,
-                        is_valid=is_valid,
-                        error_message=error_msg,
-                    )
-                )
+    @staticmethod
+    def _cell(row: Sequence[Any], index: int) -> Any:
+        value = row[index] if index < len(row) else None
+        # Convert cells the way pandas does: missing-value strings become
+        # NA and whole floats become ints
+        if isinstance(value, str) and value in NA_VALUES:
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def _parse_dataframe(self, file_content: Any) -> ImportResult:
+        records: List[TimeEntryRecord] = []
+        errors: List[str] = []
+
+        try:
+            # Read Excel file
+            df = pd.read_excel(
+                io.BytesIO(file_content),
+                keep_default_na=False,
+                na_values=list(NA_VALUES),
+            )
+
+            col_map = self._map_columns(df.columns)
+            if "date" not in col_map:
+                errors.append(MISSING_DATE_COLUMN)
+                return ImportResult([], 0, 0, errors)
+
+            records = self._records_from_frame(df, col_map)
 
         except Exception as e:
             errors.append(f"Error parsing Excel: {str(e)}")
@@ -90,6 +150,116 @@ class ExcelImporter(ImporterProtocol):
         valid_records = sum(1 for r in records if r.is_valid)
         return ImportResult(records, len(records), valid_records, errors)
 
+    def _records_from_frame(
+        self, df: pd.DataFrame, col_map: Dict[str, int]
+    ) -> List[TimeEntryRecord]:
+        """
+        Build the records of a DataFrame with whole-column operations; gives
+        the same records as calling _build_record on every row.
+        """
+        frame = df[df.iloc[:, col_map["date"]].notna()]
+        if frame.empty:
+            return []
+
+        def column(key: str) -> pd.Series:
+            if key not in col_map:
+                return pd.Series(None, index=frame.index, dtype=object)
+            return frame.iloc[:, col_map[key]]
+
+        dates = _format_date_column(column("date"))
+        entries = _format_time_column(column("entry"))
+        exits = _format_time_column(column("exit"))
+        obs = column("obs")
+        observations = _as_str(obs).astype(object).where(obs.notna(), None)
+
+        bad_date = ~_valid_dates(dates)
+        bad_entry = _invalid_times(entries)
+        bad_exit = _invalid_times(exits)
+        error_messages = np.select(
+            [bad_date, bad_entry, bad_exit],
+            [
+                "Invalid date format: " + dates,
+                "Invalid entry time: " + entries.fillna(""),
+                "Invalid exit time: " + exits.fillna(""),
+            ],
+            default=np.array(None),
+        )
+        valid = ~(bad_date | bad_entry | bad_exit)
+
+        return [
+            TimeEntryRecord(
+                date=date_str,
+                entry_time=entry_str,
+                exit_time=exit_str,
+                observation=obs_str,
+                is_valid=is_valid,
+                error_message=error_msg,
+            )
+            for date_str, entry_str, exit_str, obs_str, is_valid, error_msg in zip(
+                dates.tolist(),
+                entries.tolist(),
+                exits.tolist(),
+                observations.tolist(),
+                valid.tolist(),
+                error_messages.tolist(),
+            )
+        ]
+
+    @staticmethod
+    def _map_columns(columns: Iterable[Any]) -> Dict[str, int]:
+        """Positions of the date, entry, exit and observation columns."""
+        col_map: Dict[str, int] = {}
+        for index, column in enumerate(columns):
+            # Normalize headers
+            col = str(column).lower().strip()
+            if "fecha" in col or "date" in col:
+                col_map["date"] = index
+            elif "entrada" in col or "in" in col:
+                col_map["entry"] = index
+            elif "salida" in col or "out" in col:
+                col_map["exit"] = index
+            elif "observ" in col or "note" in col:
+                col_map["obs"] = index
+        return col_map
+
+    def _build_record(
+        self, date_val: Any, entry_val: Any, exit_val: Any, obs_val: Any
+    ) -> Optional[TimeEntryRecord]:
+        if pd.isna(date_val):
+            return None
+
+        # Handle dates; pandas keeps plain datetimes in mixed columns
+        if isinstance(date_val, datetime):
+            date_str = date_val.strftime("%Y-%m-%d")
+        else:
+            date_str = str(date_val).strip()
+
+        entry_str = self._format_time(entry_val)
+        exit_str = self._format_time(exit_val)
+
+        # Logic for validating
+        is_valid = True
+        error_msg = None
+
+        if not validate_date(date_str):
+            is_valid = False
+            error_msg = f"Invalid date format: {date_str}"
+        elif entry_str and not validate_time_format(entry_str):
+            is_valid = False
+            error_msg = f"Invalid entry time: {entry_str}"
+        elif exit_str and not validate_time_format(exit_str):
+            is_valid = False
+            error_msg = f"Invalid exit time: {exit_str}"
+
+        return TimeEntryRecord(
+            date=date_str,
+            entry_time=entry_str,
+            exit_time=exit_str,
+            observation=str(obs_val) if pd.notna(obs_val) else None,
+            is_valid=is_valid,
+            error_message=error_msg,
+        )
+
     def _format_time(self, val: Any) -> Optional[str]:
         if pd.isna(val):
             return None
@@ -106,3 +276,63 @@ class ExcelImporter(ImporterProtocol):
         s = str(val).strip()
         # Basic fixes
         return s
+
+
+def _as_str(col: pd.Series) -> pd.Series:
+    """str() of every value."""
+    if col.dtype == object or is_numeric_dtype(col):
+        return col.astype(str)
+    # astype(str) renders e.g. datetime64 columns differently from str()
+    return col.map(str)
+
+
+def _format_date_column(col: pd.Series) -> pd.Series:
+    """Vectorized date formatting of _build_record; col has no NA values."""
+    if is_datetime64_any_dtype(col):
+        return col.dt.strftime("%Y-%m-%d").astype(object)
+
+    dates = _as_str(col).str.strip()
+    if col.dtype == object:
+        # pandas keeps plain datetimes in mixed columns
+        stamps = col.map(lambda value: isinstance(value, datetime)).astype(bool)
+        if stamps.any():
+            dates[stamps] = col[stamps].map(lambda value: value.strftime("%Y-%m-%d"))
+    return dates
+
+
+def _format_time_column(col: pd.Series) -> pd.Series:
+    """Vectorized ExcelImporter._format_time; None where the value is NA."""
+    missing = col.isna()
+    if is_datetime64_any_dtype(col):
+        formatted = col.dt.strftime("%H:%M")
+    else:
+        formatted = _as_str(col).str.strip()
+        if col.dtype == object:
+            # time, datetime and Timestamp values
+            stamps = ~missing & col.map(lambda value: hasattr(value, "strftime"))
+            stamps = stamps.astype(bool)
+            if stamps.any():
+                formatted[stamps] = col[stamps].map(
+                    lambda value: value.strftime("%H:%M")
+                )
+    return formatted.astype(object).where(~missing, None)
+
+
+def _valid_dates(dates: pd.Series) -> pd.Series:
+    parts = dates.str.fullmatch(DATE_PATTERN)
+    valid = pd.Series(False, index=dates.index)
+    if not parts.any():
+        return valid
+
+    ymd = dates[parts].str.extract(DATE_PATTERN).astype(int).to_numpy()
+    year, month, day = ymd[:, 0], ymd[:, 1], ymd[:, 2]
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = DAYS_IN_MONTH[month - 1] + ((month == 2) & leap)
+    valid[parts] = (year >= 1) & (day <= month_days)
+    return valid
+
+
+def _invalid_times(times: pd.Series) -> pd.Series:
+    """Non-empty times that are not HH:MM."""
+    filled = times.fillna("")
+    return (filled != "") & ~filled.str.fullmatch(TIME_PATTERN).astype(bool)
@@ -1,28 +1,202 @@
 import io
+import multiprocessing
+import os
 import re
-from typing import Any, List, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import pdfplumber  # type: ignore
+from flask import current_app, has_app_context
 
 from app.services.importer.protocol import (
     ImporterProtocol,
     ImportResult,
     TimeEntryRecord,
 )
+from app.utils.time_parser import format_minutes, parse_time
 from app.utils.validators import validate_date, validate_time_format
 
+Table = List[List[Optional[str]]]
+
+# Below this many pages per worker, starting processes costs more than the
+# extraction it saves
+MIN_PAGES_PER_WORKER = 2
+
+# Text-layer fast path: words whose tops differ by less than this share a
+# line, and header words closer than this form one column title (points)
+LINE_TOLERANCE = 3
+HEADER_WORD_GAP = 6
+
+DATE_CELL = re.compile(r"\d{4}-\d{1,2}-\d{1,2}|\d{2}/\d{2}/\d{4}")
+TIME_CELL = re.compile(r"\d{1,2}:\d{2}")
+
+PARSE_MODE_TEXT = "text"
+PARSE_MODE_TABLE = "table"
+
+
+def _header_map(row_clean: List[str]) -> Dict[str, int]:
+    """Column positions of a lower-cased header row."""
+    header_map = {}
+    for col_idx, val in enumerate(row_clean):
+        if "fecha" in val or "date" in val:
+            header_map["date"] = col_idx
+        elif "entrada" in val or "in" in val:
+            header_map["entry"] = col_idx
+        elif "salida" in val or "out" in val:
+            header_map["exit"] = col_idx
+        elif "observ" in val or "note" in val:
+            header_map["obs"] = col_idx
+    return header_map
+
+
+def _lines(words: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group pdfplumber words into lines, top to bottom and left to right."""
+    lines: List[List[Dict[str, Any]]] = []
+    for word in sorted(words, key=lambda w: (w["top"], w["x0"])):
+        if lines and word["top"] - lines[-1][0]["top"] < LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w["x0"]) for line in lines]
+
+
+def _text_table(words: List[Dict[str, Any]]) -> Optional[Table]:
+    """
+    Rebuild a page's table from its text layer: the header line defines the
+    columns and every later line whose date column holds a date is a row.
+    Returns None when the page has no header line.
+    """
+    lines = _lines(words)
+    for index, line in enumerate(lines):
+        # Header words close together form one title, e.g. "Hora entrada"
+        titles: List[List[Dict[str, Any]]] = []
+        for word in line:
+            if titles and word["x0"] - titles[-1][-1]["x1"] < HEADER_WORD_GAP:
+                titles[-1].append(word)
+            else:
+                titles.append([word])
+        header = [" ".join(w["text"] for w in title) for title in titles]
+        row_clean = [title.lower().strip() for title in header]
+        if "fecha" in row_clean or "date" in row_clean:
+            break
+    else:
+        return None
+
+    # Cells belong to the column whose title centre is nearest
+    centres = [(title[0]["x0"] + title[-1]["x1"]) / 2 for title in titles]
+    bounds = [(left + right) / 2 for left, right in zip(centres, centres[1:])]
+    date_col = _header_map(row_clean)["date"]
+
+    table: Table = [list(header)]
+    for line in lines[index + 1 :]:
+        cells: List[List[str]] = [[] for _ in header]
+        for word in line:
+            cells[bisect_right(bounds, (word["x0"] + word["x1"]) / 2)].append(
+                word["text"]
+            )
+        row: List[Optional[str]] = [" ".join(cell) for cell in cells]
+        if DATE_CELL.fullmatch(row[date_col] or ""):
+            table.append(row)
+    return table
+
+
+def _is_text_layout(table: Optional[Table]) -> bool:
+    """
+    Probe: the text layer is enough when the page has a header, at least
+    one date row, and every time in those rows is well formed.
+    """
+    if not table or len(table) < 2:
+        return False
+    header_map = _header_map([cell.lower().strip() for cell in table[0] if cell])
+    time_cols = [header_map[key] for key in ("entry", "exit") if key in header_map]
+    return all(
+        TIME_CELL.fullmatch(row[col] or "") or not row[col]
+        for row in table[1:]
+        for col in time_cols
+    )
+
+
+def _extract_page_range(file_content: bytes, start: int, stop: int) -> List[Table]:
+    """Tables of pages [start, stop), in order; runs in a worker process."""
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        return [
+            table for page in pdf.pages[start:stop] for table in page.extract_tables()
+        ]
+
+
+def _mp_context() -> Any:
+    """
+    Workers never fork the (threaded) web server process itself: they come
+    from a fork server that has already imported this module, or are
+    spawned where fork servers are not available.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split the pages into `workers` contiguous, nearly equal ranges."""
+    size, extra = divmod(page_count, workers)
+    ranges = []
+    start = 0
+    for index in range(workers):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
 
 class PDFImporter(ImporterProtocol):
+    def __init__(self, workers: Optional[int] = None, mode: str = "auto"):
+        # None reads PDF_IMPORT_WORKERS from the app config; 0 means one
+        # worker per CPU and 1 extracts in this process
+        self.workers = workers
+        # "auto" probes the first page, "text" or "table" force a path
+        if mode not in ("auto", PARSE_MODE_TEXT, PARSE_MODE_TABLE):
+            raise ValueError(f"Unknown PDF parse mode: {mode}")
+        self.mode = mode
+
+    def _worker_count(self, page_count: int) -> int:
+        workers = self.workers
+        if workers is None:
+            workers = (
+                int(current_app.config.get("PDF_IMPORT_WORKERS", 1))
+                if has_app_context()
+                else 1
+            )
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, page_count // MIN_PAGES_PER_WORKER))
+
     def parse(self, file_content: Any) -> ImportResult:
         records: List[TimeEntryRecord] = []
         errors: List[str] = []
+        parse_mode = None
 
         try:
+            tables: List[Table] = []
+            workers = 1
             with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                for page in pdf.pages:
-                    tables = page.extract_tables()
-                    for table in tables:
-                        records.extend(self._process_table(table))
+                parse_mode = self._select_mode(pdf)
+                if parse_mode == PARSE_MODE_TEXT:
+                    for page in pdf.pages:
+                        table = _text_table(page.extract_words())
+                        if table:
+                            tables.append(table)
+                else:
+                    workers = self._worker_count(len(pdf.pages))
+                    if workers == 1:
+                        for page in pdf.pages:
+                            tables.extend(page.extract_tables())
+            if workers > 1:
+                tables = self._extract_parallel(file_content, len(pdf.pages), workers)
+
+            for table in tables:
+                records.extend(self._process_table(table))
         except Exception as e:
             errors.append(f"Error parsing PDF: {str(e)}")
 
@@ -32,9 +206,38 @@ class PDFImporter(ImporterProtocol):
             total_records=len(records),
             valid_records=valid_records,
             errors=errors,
+            parse_mode=parse_mode,
         )
 
-    def _process_table(self, table: List[List[Optional[str]]]) -> List[TimeEntryRecord]:
+    def _select_mode(self, pdf: Any) -> str:
+        """
+        Use the text layer when the first page reads as a plain listing;
+        table detection is much more expensive.
+        """
+        if self.mode != "auto":
+            return self.mode
+        if not pdf.pages:
+            return PARSE_MODE_TABLE
+        probe = _text_table(pdf.pages[0].extract_words())
+        return PARSE_MODE_TEXT if _is_text_layout(probe) else PARSE_MODE_TABLE
+
+    def _extract_parallel(
+        self, file_content: bytes, page_count: int, workers: int
+    ) -> List[Table]:
+        """
+        Extract the tables with a process pool, each worker opening the
+        document itself for one range of pages; tables keep the page order.
+        """
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=_mp_context()
+        ) as executor:
+            futures = [
+                executor.submit(_extract_page_range, file_content, start, stop)
+                for start, stop in _page_ranges(page_count, workers)
+            ]
+            return [table for future in futures for table in future.result()]
+
+    def _process_table(self, table: Table) -> List[TimeEntryRecord]:
         records = []
         # Simple heuristic: find header row
         header_map = {}
@@ -45,15 +248,7 @@ class PDFImporter(ImporterProtocol):
             row_clean = [str(c).lower().strip() if c else "" for c in row]
             if "fecha" in row_clean or "date" in row_clean:
                 # Map columns
-                for col_idx, val in enumerate(row_clean):
-                    if "fecha" in val or "date" in val:
-                        header_map["date"] = col_idx
-                    elif "entrada" in val or "in" in val:
-                        header_map["entry"] = col_idx
-                    elif "salida" in val or "out" in val:
-                        header_map["exit"] = col_idx
-                    elif "observ" in val or "note" in val:
-                        header_map["obs"] = col_idx
+                header_map = _header_map(row_clean)
                 data_start_idx = idx + 1
                 break
 
@@ -124,9 +319,9 @@ class PDFImporter(ImporterProtocol):
 
     def _normalize_time(self, time_str: str) -> Optional[str]:
         time_str = time_str.strip()
-        # Ensure HH:MM
-        if re.match(r"^\d{1,2}:\d{2}$", time_str):
-            if len(time_str) == 4:  # H:MM
-                return f"0{time_str}"
-            return time_str
-        return None
+        minutes = parse_time(time_str)
+        if minutes is not None:
+            # H:MM becomes HH:MM
+            return format_minutes(minutes)
+        # Out-of-range times such as 25:00 are kept so validation reports them
+        return time_str if TIME_CELL.fullmatch(time_str) else None
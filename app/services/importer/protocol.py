@@ -18,6 +18,8 @@ class ImportResult:
     total_records: int
     valid_records: int
     errors: List[str]
+    # How the importer read the file, e.g. "text" or "table" for PDFs
+    parse_mode: Optional[str] = None
 
 
 class ImporterProtocol(Protocol):
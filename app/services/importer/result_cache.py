@@ -0,0 +1,86 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from app.services.importer.protocol import ImportResult, TimeEntryRecord
+
+logger = logging.getLogger(__name__)
+
+# Bump when ImportResult or the importers change what they produce, so older
+# cached results are parsed again
+CACHE_VERSION = 2
+
+CACHE_DIRNAME = "parsed"
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _cache_path(upload_folder: str, upload_id: str) -> str:
+    return os.path.join(upload_folder, CACHE_DIRNAME, f"{upload_id}.json")
+
+
+def result_to_dict(result: ImportResult) -> Dict[str, Any]:
+    return dataclasses.asdict(result)
+
+
+def result_from_dict(data: Dict[str, Any]) -> ImportResult:
+    return ImportResult(
+        records=[TimeEntryRecord(**record) for record in data["records"]],
+        total_records=data["total_records"],
+        valid_records=data["valid_records"],
+        errors=list(data["errors"]),
+        parse_mode=data.get("parse_mode"),
+    )
+
+
+def load_result(
+    upload_folder: str, upload_id: str, digest: str
+) -> Optional[ImportResult]:
+    """
+    The cached parse of an upload, or None when it is missing, was made for
+    other file content or by another cache version, or cannot be read.
+    """
+    try:
+        with open(_cache_path(upload_folder, upload_id), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION or data.get("sha256") != digest:
+            return None
+        return result_from_dict(data["result"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable parse cache of %s: %s", upload_id, e)
+        return None
+
+
+def store_result(
+    upload_folder: str, upload_id: str, digest: str, result: ImportResult
+) -> None:
+    """Save the parse of an upload; failures only cost a later re-parse."""
+    path = _cache_path(upload_folder, upload_id)
+    payload = {
+        "version": CACHE_VERSION,
+        "sha256": digest,
+        "result": result_to_dict(result),
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache the parse of %s: %s", upload_id, e)
+
+
+def discard_result(upload_folder: str, upload_id: str) -> None:
+    try:
+        os.remove(_cache_path(upload_folder, upload_id))
+    except FileNotFoundError:
+        pass
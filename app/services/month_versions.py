@@ -0,0 +1,201 @@
+import hashlib
+from calendar import monthrange
+from datetime import date, datetime, timezone
+from functools import wraps
+from typing import Callable, Iterable, Optional, Set, Tuple
+
+from flask import Response, current_app, request
+from sqlalchemy import insert, tuple_, update
+
+from app.db.database import db
+from app.db.repository import dialect_insert
+from app.models.models import Employee, MonthVersion
+
+Month = Tuple[int, int]
+
+# Counters upserted per statement, well under SQLite's bound-parameter limit
+BUMP_BATCH_SIZE = 150
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def _month_index(year: int, month: int) -> int:
+    return year * 12 + month
+
+
+def bump_months(employee_id: int, months: Iterable[Month]) -> None:
+    """Increment the version of each month; must run before the write commits."""
+    _bump({(employee_id, year, month) for year, month in months})
+
+
+def bump_months_for_all(months: Iterable[Month]) -> None:
+    """Bump the months of every employee, e.g. after a holiday change."""
+    months = list(months)
+    _bump(
+        {
+            (employee_id, year, month)
+            for (employee_id,) in db.session.query(Employee.id)
+            for year, month in months
+        }
+    )
+
+
+def _bump(keys: Set[Tuple[int, int, int]]) -> None:
+    """
+    Increment (employee_id, year, month) counters in the database itself, so
+    concurrent writers never lose an increment or race to create a month.
+    """
+    if not keys:
+        return
+
+    now = _now()
+    rows = [
+        {
+            "employee_id": employee_id,
+            "year": year,
+            "month": month,
+            "version": 1,
+            "updated_at": now,
+        }
+        for employee_id, year, month in sorted(keys)
+    ]
+    statement = dialect_insert(MonthVersion)
+    if statement is not None:
+        for start in range(0, len(rows), BUMP_BATCH_SIZE):
+            batch = statement.values(rows[start : start + BUMP_BATCH_SIZE])
+            db.session.execute(
+                batch.on_conflict_do_update(
+                    index_elements=["employee_id", "year", "month"],
+                    set_={
+                        "version": MonthVersion.version + 1,
+                        "updated_at": batch.excluded.updated_at,
+                    },
+                )
+            )
+        return
+
+    # Other databases: increment what exists, then create the rest
+    key_column = tuple_(MonthVersion.employee_id, MonthVersion.year, MonthVersion.month)
+    db.session.execute(
+        update(MonthVersion)
+        .where(key_column.in_(keys))
+        .values(version=MonthVersion.version + 1, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    existing = set(db.session.query(key_column).filter(key_column.in_(keys)))
+    missing = [
+        row
+        for row in rows
+        if (row["employee_id"], row["year"], row["month"]) not in existing
+    ]
+    if missing:
+        db.session.execute(insert(MonthVersion), missing)
+
+
+def range_version(
+    employee_id: int, start: date, end: date
+) -> Tuple[str, Optional[datetime]]:
+    """
+    Digest of every (year, month, version) of an employee's months between
+    start and end, so any write to one of them changes it, and the time of
+    the latest write.
+    """
+    rows = (
+        db.session.query(
+            MonthVersion.year,
+            MonthVersion.month,
+            MonthVersion.version,
+            MonthVersion.updated_at,
+        )
+        .filter(
+            MonthVersion.employee_id == employee_id,
+            (MonthVersion.year * 12 + MonthVersion.month).between(
+                _month_index(start.year, start.month),
+                _month_index(end.year, end.month),
+            ),
+        )
+        .order_by(MonthVersion.year, MonthVersion.month)
+        .all()
+    )
+    versions = ";".join(f"{year}-{month}:{version}" for year, month, version, _ in rows)
+    digest = hashlib.sha256(versions.encode("ascii")).hexdigest()[:20]
+    return digest, max((row[3] for row in rows), default=None)
+
+
+def range_validators(
+    employee_id: int, start: date, end: date
+) -> Tuple[str, Optional[datetime]]:
+    """
+    Strong ETag and Last-Modified for an employee's data between start and
+    end, read from the version counters of the months in the range.
+    """
+    version, last_modified = range_version(employee_id, start, end)
+    return range_etag(employee_id, start, end, version), last_modified
+
+
+def range_etag(employee_id: int, start: date, end: date, version: str) -> str:
+    """The ETag of a body built at `version` (a range_version digest)."""
+    return f"{employee_id}-{start.isoformat()}-{end.isoformat()}-{version}"
+
+
+def tag_response(
+    response: Response, etag: str, last_modified: Optional[datetime]
+) -> None:
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # Let browsers keep the body but revalidate it on every use
+    response.cache_control.no_cache = True
+
+
+def _not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(tzinfo=timezone.utc) <= request.if_modified_since
+    return False
+
+
+def conditional_range(start: date, end: date, build: Callable, employee_id: int = 1):
+    """
+    Answer 304 Not Modified from the version counters alone when the client
+    already has the current data; otherwise call `build` and tag its
+    response with the validators.
+
+    The validators are read before `build` runs, so a write that lands in
+    between leaves the body tagged with an older version, never a newer
+    one. Responses `build` already tagged (cached bodies carry the version
+    they were built from) keep their own validators.
+    """
+    etag, last_modified = range_validators(employee_id, start, end)
+    if _not_modified(etag, last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.make_response(build())
+        if response.status_code != 200 or response.get_etag()[0] is not None:
+            return response
+
+    tag_response(response, etag, last_modified)
+    return response
+
+
+def conditional_month(employee_id: int = 1) -> Callable:
+    """conditional_range for a view taking (year, month) arguments."""
+
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(year: int, month: int):
+            try:
+                start = date(year, month, 1)
+                end = date(year, month, monthrange(year, month)[1])
+            except ValueError:
+                # Invalid months are reported by the view itself
+                return view(year, month)
+            return conditional_range(start, end, lambda: view(year, month), employee_id)
+
+        return wrapper
+
+    return decorator
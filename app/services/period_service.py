@@ -0,0 +1,261 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import numpy as np
+from flask import current_app
+
+from app.db.database import db
+from app.models.models import ScheduleEntry
+from app.services.holiday_cache import holidays_between
+from app.services.work_calendar import WorkCalendar, configured_weekmask
+
+GRANULARITIES = ("day", "week", "month", "quarter", "year", "custom")
+
+
+def _worked_minutes_rows(start: date, end: date, employee_id: int) -> List[Any]:
+    """
+    Load (date, absence_code, worked_minutes) for an employee's entries in a
+    range; the `entries` JSON is never fetched.
+    """
+    return (
+        db.session.query(
+            ScheduleEntry.date,
+            ScheduleEntry.absence_code,
+            ScheduleEntry.worked_minutes,
+        )
+        .filter(
+            ScheduleEntry.date.between(start, end),
+            ScheduleEntry.employee_id == employee_id,
+        )
+        .all()
+    )
+
+
+def classify_day(
+    day: date,
+    entry: Optional[Any],
+    holidays: Set[date],
+    weekmask: Optional[str] = None,
+) -> str:
+    """
+    Determine the type of a day with clear precedence: an explicit absence
+    code, then holidays, then days off in the working week; anything else
+    is a work day.
+
+    `entry` is a ScheduleEntry (or any row with an `absence_code`) or None.
+    `weekmask` is a WorkCalendar weekmask, by default the configured one.
+    """
+    if entry is not None and entry.absence_code:
+        return str(entry.absence_code)
+    if day in holidays:
+        return "Holiday"
+    if weekmask is None:
+        weekmask = configured_weekmask()
+    if weekmask[day.weekday()] != "1":
+        return "Weekend"
+    return "Work Day"
+
+
+def summarize_day(
+    day: date,
+    entry: Optional[Any],
+    holidays: Set[date],
+    hours_worked: float,
+    hours_per_day: float,
+    weekmask: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the summary payload for a single day."""
+    day_type = classify_day(day, entry, holidays, weekmask)
+
+    # Only work days require hours or count the hours worked
+    required_hours = 0.0
+    if day_type == "Work Day":
+        required_hours = hours_per_day
+    else:
+        hours_worked = 0.0
+
+    return {
+        "date": day.isoformat(),
+        "type": day_type,
+        "hours": hours_worked,
+        "required": required_hours,
+        "difference": hours_worked - required_hours,
+        "absence_code": entry.absence_code if entry is not None else None,
+    }
+
+
+def _bucket_start(day: date, granularity: str, range_start: date) -> date:
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    if granularity == "year":
+        return date(day.year, 1, 1)
+    return range_start
+
+
+def _bucket_label(start: date, end: date, granularity: str) -> str:
+    if granularity == "week":
+        iso_year, iso_week, _ = start.isocalendar()
+        return f"{iso_year}-W{iso_week:02d}"
+    if granularity == "month":
+        return f"{start.year}-{start.month:02d}"
+    if granularity == "quarter":
+        return f"{start.year}-Q{(start.month - 1) // 3 + 1}"
+    if granularity == "year":
+        return str(start.year)
+    if granularity == "custom":
+        return f"{start.isoformat()}/{end.isoformat()}"
+    return start.isoformat()
+
+
+def _new_bucket(key: date, start: date) -> Dict[str, Any]:
+    return {
+        "key": key,
+        "start": start,
+        "end": start,
+        "total": 0.0,
+        "required": 0.0,
+        "days": [],
+    }
+
+
+def aggregate_days(
+    start: date,
+    end: date,
+    granularity: str,
+    entries_map: Mapping[date, Any],
+    hours_map: Mapping[date, float],
+    holidays: Set[date],
+    hours_per_day: float,
+) -> Dict[str, Any]:
+    """
+    Aggregate already-loaded data for every day in [start, end] in a single
+    pass, grouping the days into buckets of the requested granularity.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: '{granularity}'")
+
+    weekmask = configured_weekmask()
+    buckets: List[Dict[str, Any]] = []
+    bucket: Optional[Dict[str, Any]] = None
+    total_worked = 0.0
+    total_required = 0.0
+
+    current_date = start
+    while current_date <= end:
+        bucket_key = _bucket_start(current_date, granularity, start)
+        if bucket is None or bucket["key"] != bucket_key:
+            bucket = _new_bucket(bucket_key, current_date)
+            buckets.append(bucket)
+
+        day_data = summarize_day(
+            current_date,
+            entries_map.get(current_date),
+            holidays,
+            hours_map.get(current_date, 0.0),
+            hours_per_day,
+            weekmask,
+        )
+        bucket["days"].append(day_data)
+        bucket["end"] = current_date
+        bucket["total"] += day_data["hours"]
+        bucket["required"] += day_data["required"]
+        total_worked += day_data["hours"]
+        total_required += day_data["required"]
+
+        current_date += timedelta(days=1)
+
+    periods = [
+        {
+            "label": _bucket_label(bucket["start"], bucket["end"], granularity),
+            "start": bucket["start"].isoformat(),
+            "end": bucket["end"].isoformat(),
+            "total": bucket["total"],
+            "required": bucket["required"],
+            "difference": bucket["total"] - bucket["required"],
+            "days": bucket["days"],
+        }
+        for bucket in buckets
+    ]
+
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "granularity": granularity,
+        "total": total_worked,
+        "required": total_required,
+        "difference": total_worked - total_required,
+        "periods": periods,
+    }
+
+
+def aggregate_period(
+    start: date,
+    end: date,
+    granularity: str = "custom",
+    employee_id: int = 1,
+    hours_per_day: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Totals for an employee between start and end (inclusive), nested into
+    per-period buckets that each hold their per-day summaries.
+
+    Uses one ScheduleEntry query regardless of the length of the range;
+    holidays come from the holiday cache.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: '{granularity}'")
+    if hours_per_day is None:
+        hours_per_day = float(current_app.config.get("WORKING_HOURS_PER_DAY", 8))
+
+    rows = _worked_minutes_rows(start, end, employee_id)
+    entries_map = {row.date: row for row in rows}
+    hours_map = {row.date: row.worked_minutes / 60 for row in rows}
+
+    holidays = holidays_between(start, end)
+
+    return aggregate_days(
+        start, end, granularity, entries_map, hours_map, holidays, hours_per_day
+    )
+
+
+def period_totals(
+    start: date,
+    end: date,
+    employee_id: int = 1,
+    hours_per_day: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Total, required and difference hours between start and end (inclusive).
+
+    Required hours come from numpy.busday_count over the holiday calendar and
+    only the stored entries are inspected, so the cost grows with the number
+    of entries rather than with the number of days in the range.
+    """
+    if hours_per_day is None:
+        hours_per_day = float(current_app.config.get("WORKING_HOURS_PER_DAY", 8))
+
+    calendar = WorkCalendar.from_db(start, end)
+    rows = _worked_minutes_rows(start, end, employee_id)
+
+    dates = np.array([row.date for row in rows], dtype="datetime64[D]")
+    has_absence = np.array([bool(row.absence_code) for row in rows], dtype=bool)
+    minutes = np.array([row.worked_minutes for row in rows], dtype=np.int64)
+
+    on_workday = calendar.is_workday(dates)
+    absent_days = int(np.count_nonzero(on_workday & has_absence))
+    counted = on_workday & ~has_absence
+
+    total = float(minutes[counted].sum()) / 60.0
+    required = (calendar.required_days(start, end) - absent_days) * hours_per_day
+
+    return {
+        "total": total,
+        "required": required,
+        "difference": total - required,
+    }
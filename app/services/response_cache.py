@@ -0,0 +1,315 @@
+import os
+import threading
+from calendar import monthrange
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional, Protocol, Set, Tuple
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.database import db
+from app.services.month_versions import range_etag, range_version, tag_response
+
+EXTENSION_KEY = "response_cache"
+
+Month = Tuple[int, int]
+
+# Namespaces of every view decorated with cached_month, registered at import
+# time so invalidation also reaches entries written by an earlier process
+NAMESPACES: Set[str] = set()
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached response bodies."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The value stored under `key`, or None."""
+        ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def delete(self, key: str) -> bool:
+        """Remove `key`; returns whether it was stored."""
+        ...
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with `prefix`; returns how many."""
+        ...
+
+    def clear(self) -> None: ...
+
+
+class NullBackend:
+    """Caches nothing; used when RESPONSE_CACHE_BACKEND is "none"."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    def delete(self, key: str) -> bool:
+        return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryBackend:
+    """Bounded in-process LRU."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FilesystemBackend:
+    """One file per key, shared by every process using the same directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _filename(key: str) -> str:
+        return key.replace(":", "-")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, self._filename(key) + ".json")
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        # Write to a temporary file first so readers never see partial data
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        prefix = self._filename(prefix)
+        deleted = 0
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+        return deleted
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+
+def month_key(namespace: str, employee_id: int, year: int, month: int) -> str:
+    return f"{namespace}:{employee_id}:{year:04d}:{month:02d}"
+
+
+def versioned_key(month: str, version: str) -> str:
+    """Key of a month's body built at `version` (a month_versions digest)."""
+    return f"{month}:{version}"
+
+
+class ResponseCache:
+    """
+    Caches JSON responses per (namespace, employee, year, month) and month
+    version. A write from any process bumps the version, which makes the
+    old bodies unreachable; writes in this process also drop them.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: str, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                namespace, {"hits": 0, "misses": 0, "invalidations": 0}
+            )
+            stats[counter] += amount
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        value = self.backend.get(key)
+        self._count(namespace, "hits" if value is not None else "misses")
+        return value
+
+    def set(self, month: str, version: str, value: bytes) -> None:
+        # Keep one body per month; older versions can no longer be read
+        self.backend.delete_prefix(versioned_key(month, ""))
+        self.backend.set(versioned_key(month, version), value)
+
+    def invalidate_months(self, employee_id: int, months: Iterable[Month]) -> None:
+        for year, month in set(months):
+            for namespace in NAMESPACES:
+                prefix = versioned_key(
+                    month_key(namespace, employee_id, year, month), ""
+                )
+                if self.backend.delete_prefix(prefix):
+                    self._count(namespace, "invalidations")
+
+    def clear(self) -> None:
+        self.backend.clear()
+        for namespace in NAMESPACES:
+            self._count(namespace, "invalidations")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            namespaces = {}
+            for namespace, stats in sorted(self._stats.items()):
+                lookups = stats["hits"] + stats["misses"]
+                namespaces[namespace] = dict(
+                    stats, hit_rate=stats["hits"] / lookups if lookups else 0.0
+                )
+            return {
+                "backend": type(self.backend).__name__,
+                "namespaces": namespaces,
+            }
+
+
+def create_backend(config) -> CacheBackend:
+    backend = config.get("RESPONSE_CACHE_BACKEND", "memory")
+    if backend == "memory":
+        return MemoryBackend(int(config.get("RESPONSE_CACHE_MAX_ENTRIES", 256)))
+    if backend == "filesystem":
+        return FilesystemBackend(config["RESPONSE_CACHE_DIR"])
+    if backend == "none":
+        return NullBackend()
+    raise ValueError(f"Unsupported response cache backend: '{backend}'")
+
+
+def _after_commit(session: Session) -> None:
+    # Drop the months again once the write is visible to other sessions, in
+    # case another request cached one between the invalidation and the commit
+    pending = session.info.pop(EXTENSION_KEY, None)
+    if pending and has_app_context():
+        cache = get_response_cache()
+        for employee_id, months in pending.items():
+            cache.invalidate_months(employee_id, months)
+
+
+def init_response_cache(app: Flask) -> None:
+    app.extensions[EXTENSION_KEY] = ResponseCache(create_backend(app.config))
+    if not event.contains(Session, "after_commit", _after_commit):
+        event.listen(Session, "after_commit", _after_commit)
+
+
+def get_response_cache() -> ResponseCache:
+    cache = current_app.extensions.get(EXTENSION_KEY)
+    if cache is None:
+        cache = current_app.extensions[EXTENSION_KEY] = ResponseCache(
+            create_backend(current_app.config)
+        )
+    return cache
+
+
+def months_of(dates: Iterable[date]) -> Set[Month]:
+    return {(day.year, day.month) for day in dates}
+
+
+def invalidate_dates(employee_id: int, dates: Iterable[date]) -> None:
+    """
+    Drop the cached months of an employee that contain any of `dates`, now
+    and again when the current transaction commits.
+    """
+    months = months_of(dates)
+    get_response_cache().invalidate_months(employee_id, months)
+    pending = db.session.info.setdefault(EXTENSION_KEY, {})
+    pending.setdefault(employee_id, set()).update(months)
+
+
+def cached_month(namespace: str, employee_id: int = 1) -> Callable:
+    """
+    Cache a month view taking (year, month) arguments, under the month's
+    current version. Responses are tagged with the ETag of the version the
+    body was built from. Only successful responses are stored; errors are
+    always recomputed.
+    """
+
+    NAMESPACES.add(namespace)
+
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(year: int, month: int):
+            try:
+                start = date(year, month, 1)
+                end = date(year, month, monthrange(year, month)[1])
+            except ValueError:
+                # Invalid months are reported by the view itself
+                return view(year, month)
+
+            cache = get_response_cache()
+            key = month_key(namespace, employee_id, year, month)
+            # Read before building, so a body is never stored under a
+            # version newer than the data it was built from
+            version, last_modified = range_version(employee_id, start, end)
+            etag = range_etag(employee_id, start, end, version)
+
+            body = cache.get(namespace, versioned_key(key, version))
+            if body is not None:
+                response = current_app.response_class(body, mimetype="application/json")
+                tag_response(response, etag, last_modified)
+                return response
+
+            result = view(year, month)
+            response = current_app.make_response(result)
+            if response.status_code == 200 and response.is_json:
+                cache.set(key, version, response.get_data())
+                tag_response(response, etag, last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,41 @@
+"""
+Write-path hooks for schedule and holiday changes.
+
+Routes call these after changing ScheduleEntry or Holiday rows and before
+committing, so that derived data is updated in the same transaction.
+"""
+
+from datetime import date
+from typing import Iterable
+
+from app.services import balance_ledger
+from app.services.holiday_cache import invalidate_holiday_dates
+from app.services.month_versions import bump_months, bump_months_for_all
+from app.services.response_cache import get_response_cache, invalidate_dates, months_of
+
+
+def schedule_changed(employee_id: int, dates: Iterable[date]) -> None:
+    """An employee's schedule entries for `dates` were added, edited or removed."""
+    dates = list(dates)
+    balance_ledger.apply_changes(employee_id, dates)
+    schedule_relabelled(employee_id, dates)
+
+
+def schedule_relabelled(employee_id: int, dates: Iterable[date]) -> None:
+    """
+    How an employee's days are shown changed without changing the hours,
+    e.g. after renaming an absence code.
+    """
+    dates = list(dates)
+    invalidate_dates(employee_id, dates)
+    bump_months(employee_id, months_of(dates))
+
+
+def holidays_changed(dates: Iterable[date]) -> None:
+    """Holidays on `dates` were added or removed."""
+    dates = list(dates)
+    invalidate_holiday_dates(dates)
+    balance_ledger.refresh_holiday_dates(dates)
+    # Holidays shape every employee's months
+    get_response_cache().clear()
+    bump_months_for_all(months_of(dates))
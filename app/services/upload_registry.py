@@ -0,0 +1,205 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from flask import Flask
+
+from app.db.database import db
+from app.models.models import Upload
+from app.services.import_jobs import get_import_jobs
+from app.services.importer.result_cache import CACHE_DIRNAME, discard_result
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_EXTENSIONS = ("pdf", "xlsx", "xls")
+
+# upload_ids are generated UUIDs; anything else must not reach the file system
+UPLOAD_ID = re.compile(r"[\w-]{1,64}")
+
+# Names of the files the upload handler and the parse cache write, the only
+# ones the sweeper deletes without a registry row
+_UUID = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+UPLOAD_FILE = re.compile(rf"({_UUID})\.(?:{'|'.join(UPLOAD_EXTENSIONS)})")
+PARSE_FILE = re.compile(rf"({_UUID})\.json(?:\.\d+\.tmp)?")
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def register_upload(upload_folder: str, upload_id: str, filename: str) -> Upload:
+    """Record a file saved in the upload folder; the caller commits."""
+    path = os.path.join(upload_folder, filename)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    upload = Upload(
+        id=upload_id,
+        filename=filename,
+        size=os.path.getsize(path),
+        sha256=digest.hexdigest(),
+        created_at=_utcnow(),
+    )
+    db.session.merge(upload)
+    return upload
+
+
+def get_upload_path(upload_folder: str, upload_id: str) -> Optional[str]:
+    """
+    Path of an upload, looked up by primary key. Files saved without a
+    registry row (before it existed) are found by their expected names;
+    the sweeper removes them by age.
+    """
+    if not UPLOAD_ID.fullmatch(upload_id):
+        return None
+
+    upload = db.session.get(Upload, upload_id)
+    if upload is not None:
+        filenames = [str(upload.filename)]
+    else:
+        filenames = [f"{upload_id}.{ext}" for ext in UPLOAD_EXTENSIONS]
+
+    for filename in filenames:
+        path = os.path.join(upload_folder, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def upload_digest(upload_id: str, path: str) -> Optional[str]:
+    """
+    The SHA-256 recorded when the upload was saved, or None when it has no
+    registry row or its file may have changed since: a different size, or
+    modified after it was registered.
+    """
+    upload = db.session.get(Upload, upload_id)
+    if upload is None:
+        return None
+    stat = os.stat(path)
+    # The row is created after the file was written and hashed, so a later
+    # mtime means the content was replaced, possibly with the same size
+    modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc).replace(tzinfo=None)
+    if upload.size != stat.st_size or modified > upload.created_at:
+        return None
+    return str(upload.sha256)
+
+
+def remove_upload(upload_folder: str, upload_id: str) -> None:
+    """
+    Delete an upload's file, cached parse and registry row; the caller
+    commits.
+    """
+    upload = db.session.get(Upload, upload_id)
+    if upload is not None:
+        db.session.delete(upload)
+        filenames = [str(upload.filename)]
+    else:
+        filenames = [f"{upload_id}.{ext}" for ext in UPLOAD_EXTENSIONS]
+
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(upload_folder, filename))
+        except FileNotFoundError:
+            pass
+    discard_result(upload_folder, upload_id)
+
+
+def sweep_uploads(upload_folder: str, ttl: timedelta) -> int:
+    """
+    Delete uploads older than `ttl` with their cached parse, skipping those
+    an import job is still working on. Unregistered uploads and parse caches
+    older than `ttl` are deleted too; other files in the folders are left
+    alone. Returns the number of uploads removed.
+    """
+    jobs = get_import_jobs()
+    removed = 0
+    for upload in Upload.query.filter(Upload.created_at < _utcnow() - ttl).all():
+        job = jobs.get(upload.id)
+        if job is not None and not job.finished:
+            continue
+        remove_upload(upload_folder, upload.id)
+        jobs.discard(upload.id)
+        removed += 1
+    db.session.commit()
+
+    # Leftovers from before the registry, or from crashed requests
+    cutoff = time.time() - ttl.total_seconds()
+    registered = {upload_id for (upload_id,) in db.session.query(Upload.id)}
+    folders = (
+        (upload_folder, UPLOAD_FILE),
+        (os.path.join(upload_folder, CACHE_DIRNAME), PARSE_FILE),
+    )
+    for folder, pattern in folders:
+        if not os.path.isdir(folder):
+            continue
+        for entry in os.scandir(folder):
+            match = pattern.fullmatch(entry.name)
+            if (
+                match is not None
+                and match.group(1) not in registered
+                and entry.is_file()
+                and entry.stat().st_mtime < cutoff
+            ):
+                os.remove(entry.path)
+                if folder == upload_folder:
+                    removed += 1
+
+    if removed:
+        logger.info("Swept %d expired uploads", removed)
+    return removed
+
+
+class UploadSweeper:
+    """Daemon thread calling sweep_uploads every `interval` seconds."""
+
+    def __init__(self, app: Flask, upload_folder: str, ttl: timedelta, interval: float):
+        self._app = app
+        self._upload_folder = upload_folder
+        self._ttl = ttl
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._loop, name="upload-sweeper", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            with self._app.app_context():
+                try:
+                    sweep_uploads(self._upload_folder, self._ttl)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Upload sweep failed")
+
+
+def init_upload_sweeper(app: Flask, upload_folder: str) -> Optional[UploadSweeper]:
+    """Start the sweeper unless disabled (UPLOAD_SWEEP_INTERVAL = 0) or testing."""
+    interval = float(app.config.get("UPLOAD_SWEEP_INTERVAL", 3600))
+    if interval <= 0 or app.testing:
+        return None
+
+    sweeper = UploadSweeper(
+        app,
+        upload_folder,
+        timedelta(hours=float(app.config.get("UPLOAD_TTL_HOURS", 24))),
+        interval,
+    )
+    app.extensions["upload_sweeper"] = sweeper
+    sweeper.start()
+    return sweeper
@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+from typing import Iterable, Optional, Union
+
+import numpy as np
+from flask import current_app, has_app_context
+
+from app.models.models import Holiday
+from app.services.holiday_cache import holidays_between
+
+DateArray = Union[np.ndarray, Iterable[date]]
+
+
+def weekmask_for(working_days_per_week: int) -> str:
+    """Build a NumPy weekmask with the first N days of the week (from Monday) on."""
+    if not 1 <= working_days_per_week <= 7:
+        raise ValueError(
+            f"Invalid number of working days per week: {working_days_per_week}"
+        )
+    return "1" * working_days_per_week + "0" * (7 - working_days_per_week)
+
+
+def configured_weekmask() -> str:
+    """The weekmask of WORKING_DAYS_PER_WEEK (5 outside an application)."""
+    working_days_per_week = 5
+    if has_app_context():
+        working_days_per_week = int(current_app.config.get("WORKING_DAYS_PER_WEEK", 5))
+    return weekmask_for(working_days_per_week)
+
+
+class WorkCalendar:
+    """
+    Business-day calendar built from the holiday table and weekend rules.
+
+    Backed by numpy.busdaycalendar, so counting the working days between two
+    dates is a single vectorized call instead of a walk over every date.
+    """
+
+    def __init__(self, holidays: Iterable[date] = (), weekmask: str = "1111100"):
+        self.weekmask = weekmask
+        self.holidays = sorted(set(holidays))
+        self._calendar = np.busdaycalendar(
+            weekmask=weekmask,
+            holidays=np.array(self.holidays, dtype="datetime64[D]"),
+        )
+
+    @classmethod
+    def from_db(
+        cls,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        working_days_per_week: Optional[int] = None,
+    ) -> "WorkCalendar":
+        """
+        Build a calendar from the Holiday table, optionally limited to the
+        holidays between start and end, using the configured working week.
+
+        Bounded calendars are served from the holiday cache.
+        """
+        holidays: Iterable[date]
+        if start is not None and end is not None:
+            holidays = holidays_between(start, end)
+        else:
+            query = Holiday.query
+            if start is not None:
+                query = query.filter(Holiday.date >= start)
+            if end is not None:
+                query = query.filter(Holiday.date <= end)
+            holidays = [h.date for h in query.all()]
+
+        return cls(
+            holidays=holidays,
+            weekmask=(
+                configured_weekmask()
+                if working_days_per_week is None
+                else weekmask_for(working_days_per_week)
+            ),
+        )
+
+    def required_days(self, start: date, end: date) -> int:
+        """Number of working days between start and end (inclusive)."""
+        if end < start:
+            return 0
+        return int(
+            np.busday_count(start, end + timedelta(days=1), busdaycal=self._calendar)
+        )
+
+    def is_workday(self, dates: DateArray) -> np.ndarray:
+        """Vectorized check of which dates are working days."""
+        return np.is_busday(
+            np.asarray(dates, dtype="datetime64[D]"), busdaycal=self._calendar
+        )
@@ -0,0 +1,72 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const card = document.getElementById('importStatus');
+    if (!card) {
+        return;
+    }
+
+    const progressBar = document.getElementById('importProgress');
+    const stage = document.getElementById('importStage');
+    const rows = document.getElementById('importRows');
+    const rate = document.getElementById('importRate');
+    const message = document.getElementById('importMessage');
+    const next = document.getElementById('importNext');
+
+    const POLL_INTERVAL_MS = 1000;
+
+    function render(job) {
+        progressBar.style.width = `${job.progress}%`;
+        progressBar.setAttribute('aria-valuenow', job.progress);
+        progressBar.textContent = `${job.progress}%`;
+        stage.textContent = job.stage;
+        rows.textContent = `${job.processed_rows} / ${job.total_rows}`;
+        rate.textContent = job.rows_per_second === null ? '-' : `${job.rows_per_second} rows/s`;
+    }
+
+    function finish(job) {
+        progressBar.classList.remove('progress-bar-animated');
+        if (job.kind === 'parse') {
+            // The preview page shows the parsed rows or the parse error
+            window.location.href = card.dataset.previewUrl;
+            return;
+        }
+
+        message.classList.remove('d-none');
+        next.classList.remove('d-none');
+        if (job.stage === 'done') {
+            message.classList.add('alert-success');
+            message.textContent = job.message;
+            next.href = card.dataset.doneUrl;
+            next.textContent = 'Go to monthly log';
+        } else {
+            progressBar.classList.add('bg-danger');
+            message.classList.add('alert-danger');
+            message.textContent = `Error importing data: ${job.error}`;
+            next.href = card.dataset.previewUrl;
+            next.textContent = 'Back to preview';
+        }
+    }
+
+    function poll() {
+        fetch(card.dataset.statusUrl, { cache: 'no-cache' })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(job => {
+                render(job);
+                if (job.finished) {
+                    finish(job);
+                } else {
+                    setTimeout(poll, POLL_INTERVAL_MS);
+                }
+            })
+            .catch(error => {
+                console.error('Error polling import status:', error);
+                setTimeout(poll, POLL_INTERVAL_MS * 5);
+            });
+    }
+
+    poll();
+});
@@ -68,7 +68,7 @@ document.addEventListener('DOMContentLoaded', function() {
         const year = currentDate.getFullYear();
         const month = currentDate.getMonth();
         try {
-            const response = await fetch(`/monthly-log/api/${year}/${month + 1}`);
+            const response = await fetch(`/monthly-log/api/${year}/${month + 1}`, { cache: 'no-cache' });
             if (!response.ok) throw new Error('Failed to fetch calendar data');
             const daysData = await response.json();
             const daysMap = new Map(daysData.map(d => [d.date, d.type]));
@@ -113,7 +113,7 @@ document.addEventListener('DOMContentLoaded', function() {
             const signal = controller.signal;
             currentRequest = controller;
 
-            const response = await fetch(`/logs/monthly/${year}/${month}`, { signal });
+            const response = await fetch(`/logs/monthly/${year}/${month}`, { signal, cache: 'no-cache' });
 
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
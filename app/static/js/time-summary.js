@@ -117,25 +117,30 @@ document.addEventListener('DOMContentLoaded', function() {
             const signal = controller.signal;
             currentRequest = controller;
 
-            const response = await fetch(`/summary/monthly/${year}/${month}`, { signal });
+            // Fetch the whole month (days and totals) in a single request
+            const daysInMonth = new Date(year, month, 0).getDate();
+            const monthStr = month.toString().padStart(2, '0');
+            const start = `${year}-${monthStr}-01`;
+            const end = `${year}-${monthStr}-${daysInMonth.toString().padStart(2, '0')}`;
+
+            const response = await fetch(`/summary/range?start=${start}&end=${end}`, { signal, cache: 'no-cache' });
 
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
 
-            const monthlyData = await response.json();
-            console.log('Monthly data:', monthlyData);
+            const rangeData = await response.json();
+            console.log('Range data:', rangeData);
 
             // Update monthly summary
-            monthlyRequired.textContent = monthlyData.required.toFixed(1);
-            monthlyCompleted.textContent = monthlyData.total.toFixed(1);
+            monthlyRequired.textContent = rangeData.required.toFixed(1);
+            monthlyCompleted.textContent = rangeData.total.toFixed(1);
 
-            const balance = monthlyData.difference;
+            const balance = rangeData.difference;
             monthlyBalance.textContent = balance.toFixed(1);
             monthlyBalance.className = balance >= 0 ? 'balance-positive' : 'balance-negative';
 
-            // Load daily data for the selected month
-            await loadDailyData(year, month);
+            renderDailyData(rangeData.days);
         } catch (error) {
             if (error.name === 'AbortError') {
                 console.log('Fetch aborted');
@@ -149,71 +154,17 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    // Function to load daily data for the month
-    async function loadDailyData(year, month) {
-        console.log(`Loading daily data for ${year}/${month}`);
+    // Function to render the daily rows for the month
+    function renderDailyData(days) {
         // Clear table first
         timeTable.innerHTML = '';
 
-        // Get days in month
-        const daysInMonth = new Date(year, month, 0).getDate();
-        console.log(`Days in month: ${daysInMonth}`);
-
-        // Create a batch of promises for all day requests
-        const dayPromises = [];
-        const dayData = [];
-
-        for (let day = 1; day <= daysInMonth; day++) {
-            const dateStr = `${year}-${month.toString().padStart(2, '0')}-${day.toString().padStart(2, '0')}`;
-
-            // Store date info to be used after fetching
-            dayData.push({
-                date: dateStr
-            });
-
-            // Create the promise but don't await it yet
-            const dayPromise = fetch(`/summary/daily/${dateStr}`)
-                .then(response => {
-                    if (response.ok) {
-                        return response.json();
-                    } else {
-                        // Fallback in case of server error for a specific day
-                        return {
-                            type: "Error",
-                            hours: 0,
-                            required: 0,
-                            difference: 0,
-                            absence_code: null
-                        };
-                    }
-                })
-                .catch(error => {
-                    console.error(`Error loading data for ${dateStr}:`, error);
-                    return {
-                        type: "Error",
-                        hours: 0,
-                        required: 0,
-                        difference: 0,
-                        absence_code: null
-                    };
-                });
-
-            dayPromises.push(dayPromise);
-        }
-
-        // Wait for all promises to resolve
-        const dayResults = await Promise.all(dayPromises);
-
-        // Now build the table with the results
-        for (let i = 0; i < dayResults.length; i++) {
-            const result = dayResults[i];
-            const info = dayData[i];
-
+        for (const result of days) {
             // Create table row
             const row = document.createElement('tr');
             // Using replace with a regular expression ensures all hyphens are replaced
             // This forces the date to be parsed in the local time zone, fixing the off-by-one error
-            const dayDate = new Date(info.date.replace(/-/g, '/'));
+            const dayDate = new Date(result.date.replace(/-/g, '/'));
             const formattedDate = dayDate.toLocaleDateString();
 
 
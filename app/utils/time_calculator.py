@@ -1,72 +1,98 @@
-from datetime import date, datetime
-from typing import Dict, List, cast
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, cast
 
-from app.models.models import ScheduleEntry
+import numpy as np
 
+from app.utils.time_parser import to_minutes
 
-def calculate_daily_hours(entries: List[Dict[str, str]]) -> float:
-    """Calculate total hours worked in a day based on time entries."""
-    total_hours: float = 0.0
+if TYPE_CHECKING:
+    from app.models.models import ScheduleEntry
+
+# The `entries` JSON of a ScheduleEntry
+Segments = List[Dict[str, str]]
+
+
+def calculate_daily_minutes(entries: List[Dict[str, str]]) -> int:
+    """Calculate total minutes worked in a day based on time entries."""
+    total_minutes = 0
     for entry in entries:
         if entry["exit"] and entry["entry"]:
-            entry_time = datetime.strptime(entry["entry"], "%H:%M")
-            exit_time = datetime.strptime(entry["exit"], "%H:%M")
-            diff = exit_time - entry_time
-            total_hours += diff.total_seconds() / 3600
-    return total_hours
+            total_minutes += to_minutes(entry["exit"]) - to_minutes(entry["entry"])
+    return total_minutes
 
 
-def calculate_weekly_hours(schedule_entries: List[ScheduleEntry]) -> Dict[str, float]:
-    """Calculate weekly hours worked and required."""
-    weekly_total: float = 0.0
+def calculate_daily_hours(entries: List[Dict[str, str]]) -> float:
+    """Calculate total hours worked in a day based on time entries."""
+    return calculate_daily_minutes(entries) / 60
 
-    # Count working days (Monday-Friday) without absence code
-    working_days = []
-    for e in schedule_entries:
-        entry_date = cast(date, e.date)
-        if entry_date.weekday() < 5 and not e.absence_code:
-            working_days.append(e)
 
-    # Required hours is 8 hours per working day
-    weekly_required: float = len(working_days) * 8.0
+def _calculate_period_hours(
+    schedule_entries: List["ScheduleEntry"],
+    hours_per_day: float,
+    holidays: Optional[Set[date]],
+) -> Dict[str, float]:
+    """
+    Hours worked and required over a list of entries.
 
-    # Calculate actual hours worked - ONLY count work days (Mon-Fri)
-    for entry in schedule_entries:
-        entry_date = cast(date, entry.date)
-        if not entry.absence_code and entry_date.weekday() < 5:  # Only weekdays
-            entries_list = cast(List[Dict[str, str]], entry.entries)
-            weekly_total += calculate_daily_hours(entries_list)
+    The `entries` JSON of every row is flattened once into minute-of-day
+    arrays, and the totals are NumPy reductions over them. Only weekdays
+    without an absence code that are not holidays count; each of them
+    requires `hours_per_day` hours.
+    """
+    rows: List[int] = []
+    starts: List[str] = []
+    ends: List[str] = []
+    for row, entry in enumerate(schedule_entries):
+        for segment in cast(Segments, entry.entries) or ():
+            if segment["exit"] and segment["entry"]:
+                rows.append(row)
+                starts.append(segment["entry"])
+                ends.append(segment["exit"])
 
+    count = len(schedule_entries)
+    # Each distinct "HH:MM" is parsed once
+    minutes = {text: to_minutes(text) for text in {*starts, *ends}}
+    segments = len(rows)
+    daily_minutes = np.bincount(
+        np.array(rows, dtype=np.intp),
+        weights=np.fromiter(map(minutes.__getitem__, ends), np.int64, segments)
+        - np.fromiter(map(minutes.__getitem__, starts), np.int64, segments),
+        minlength=count,
+    )
+    days = np.fromiter(
+        (entry.date.toordinal() for entry in schedule_entries),
+        np.int64,
+        count,
+    )
+    # date.weekday() of an ordinal; Monday is 0
+    counted = ((days + 6) % 7 < 5) & ~np.fromiter(
+        (bool(entry.absence_code) for entry in schedule_entries), bool, count
+    )
+    if holidays:
+        counted &= ~np.isin(days, [day.toordinal() for day in holidays])
+
+    total = float(daily_minutes[counted].sum()) / 60
+    required = int(np.count_nonzero(counted)) * hours_per_day
     return {
-        "total": weekly_total,
-        "required": weekly_required,
-        "difference": weekly_total - weekly_required,
+        "total": total,
+        "required": required,
+        "difference": total - required,
     }
 
 
-def calculate_monthly_hours(schedule_entries: List[ScheduleEntry]) -> Dict[str, float]:
-    """Calculate monthly hours worked and required."""
-    monthly_total: float = 0.0
-
-    # Count working days (Monday-Friday) without absence code
-    working_days = []
-    for e in schedule_entries:
-        entry_date = cast(date, e.date)
-        if entry_date.weekday() < 5 and not e.absence_code:
-            working_days.append(e)
-
-    # Required hours is 8 hours per working day
-    monthly_required: float = len(working_days) * 8.0
+def calculate_weekly_hours(
+    schedule_entries: List["ScheduleEntry"],
+    hours_per_day: float = 8.0,
+    holidays: Optional[Set[date]] = None,
+) -> Dict[str, float]:
+    """Calculate weekly hours worked and required."""
+    return _calculate_period_hours(schedule_entries, hours_per_day, holidays)
 
-    # Calculate actual hours worked - ONLY count work days (Mon-Fri)
-    for entry in schedule_entries:
-        entry_date = cast(date, entry.date)
-        if not entry.absence_code and entry_date.weekday() < 5:  # Only weekdays
-            entries_list = cast(List[Dict[str, str]], entry.entries)
-            monthly_total += calculate_daily_hours(entries_list)
 
-    return {
-        "total": monthly_total,
-        "required": monthly_required,
-        "difference": monthly_total - monthly_required,
-    }
+def calculate_monthly_hours(
+    schedule_entries: List["ScheduleEntry"],
+    hours_per_day: float = 8.0,
+    holidays: Optional[Set[date]] = None,
+) -> Dict[str, float]:
+    """Calculate monthly hours worked and required."""
+    return _calculate_period_hours(schedule_entries, hours_per_day, holidays)
@@ -0,0 +1,62 @@
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# A day has 1440 valid "HH:MM" values; the cache holds all of them plus
+# room for the odd malformed string without growing unbounded.
+PARSE_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_minutes(time_str: str) -> Optional[int]:
+    hours_str, sep, minutes_str = time_str.partition(":")
+    if (
+        not sep
+        or not 1 <= len(hours_str) <= 2
+        or len(minutes_str) != 2
+        or not (hours_str + minutes_str).isascii()
+        or not hours_str.isdigit()
+        or not minutes_str.isdigit()
+    ):
+        return None
+
+    hours, minutes = int(hours_str), int(minutes_str)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+def parse_time(time_str: object) -> Optional[int]:
+    """
+    Convert an "HH:MM" (or "H:MM") string into minutes since midnight.
+
+    Returns None when the value is not a valid time of day. Results are
+    memoized in a bounded cache, so repeated values cost a dict lookup.
+    """
+    if not isinstance(time_str, str):
+        return None
+    return _parse_minutes(time_str)
+
+
+def to_minutes(time_str: str) -> int:
+    """Like parse_time, but raises ValueError for invalid input."""
+    minutes = parse_time(time_str)
+    if minutes is None:
+        raise ValueError(f"Invalid time value: '{time_str}'")
+    return minutes
+
+
+def format_minutes(minutes: int) -> str:
+    """Convert minutes since midnight back into an "HH:MM" string."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def parse_cache_info() -> CacheInfo:
+    """Expose the memo cache statistics (hits, misses, size)."""
+    return CacheInfo(*_parse_minutes.cache_info())
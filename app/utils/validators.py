@@ -1,22 +1,19 @@
-import re
 from datetime import date, datetime
+from typing import Optional
 
+from app.utils.time_parser import parse_time
 
-def validate_time_format(time_str: str) -> bool:
-    """Validate if a string is in HH:MM format with leading zeros."""
-    if not time_str:
-        return False
 
-    try:
-        # Check the exact format with regex to ensure leading zeros
-        if not re.match(r"^[0-2]\d:[0-5]\d$", time_str):
-            return False
+def _parse_strict_time(time_str: str) -> Optional[int]:
+    """Parse an HH:MM string, rejecting values without the leading zero."""
+    if not time_str or len(time_str) != 5:
+        return None
+    return parse_time(time_str)
 
-        # Also verify it's a valid time
-        datetime.strptime(time_str, "%H:%M")
-        return True
-    except ValueError:
-        return False
+
+def validate_time_format(time_str: str) -> bool:
+    """Validate if a string is in HH:MM format with leading zeros."""
+    return _parse_strict_time(time_str) is not None
 
 
 def validate_entries(entries: list) -> tuple[bool, str]:
@@ -29,20 +26,14 @@ def validate_entries(entries: list) -> tuple[bool, str]:
         if not entry.get("entry") or not entry.get("exit"):
             return False, "Entry and exit times are required"
 
-        # Validate time format
-        if not validate_time_format(entry["entry"]) or not validate_time_format(
-            entry["exit"]
-        ):
+        # Validate time format; the parsed minutes are reused for the comparison
+        entry_minutes = _parse_strict_time(entry["entry"])
+        exit_minutes = _parse_strict_time(entry["exit"])
+        if entry_minutes is None or exit_minutes is None:
             return False, "Invalid time format (use HH:MM)"
 
-        try:
-            entry_time = datetime.strptime(entry["entry"], "%H:%M")
-            exit_time = datetime.strptime(entry["exit"], "%H:%M")
-
-            if exit_time <= entry_time:
-                return False, "Exit time must be after entry time"
-        except ValueError:
-            return False, "Invalid time values"
+        if exit_minutes <= entry_minutes:
+            return False, "Exit time must be after entry time"
 
     return True, ""
 
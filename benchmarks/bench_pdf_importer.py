@@ -0,0 +1,63 @@
+"""
+Benchmark: PDFImporter table extraction with 1, 2, 4 and 8 worker
+processes on a generated 100-page report, then the text-layer fast path
+against table detection on the same report.
+
+Run from the project root:
+
+    python -m benchmarks.bench_pdf_importer
+"""
+
+import os
+import time
+
+from app.services.importer.pdf_importer import PDFImporter
+from benchmarks.pdf_report import make_report_pdf
+
+
+def _timed_parse(content, **options):
+    started = time.perf_counter()
+    result = PDFImporter(**options).parse(content)
+    elapsed = time.perf_counter() - started
+    assert not result.errors, result.errors
+    return result, elapsed
+
+
+def worker_sweep(content, pages, worker_counts):
+    """Table detection is the work the process pool spreads out."""
+    print(f"Table mode, {pages} pages, {os.cpu_count()} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        result, elapsed = _timed_parse(content, workers=workers, mode="table")
+        assert result.parse_mode == "table" and result.valid_records == pages * 25
+
+        baseline = baseline or elapsed
+        print(
+            f"{workers} worker(s)   {elapsed:6.2f} s   "
+            f"{pages / elapsed:6.1f} pages/s   speedup x{baseline / elapsed:.1f}"
+        )
+
+
+def mode_comparison(content, pages):
+    """The text-layer fast path against table detection, in one process."""
+    print(f"\nText vs table mode, {pages} pages, 1 worker")
+    timings = {}
+    for mode in ("table", "text", "auto"):
+        result, elapsed = _timed_parse(content, workers=1, mode=mode)
+        assert result.valid_records == pages * 25
+        timings[mode] = elapsed
+        print(
+            f"{mode:5} (read as {result.parse_mode})   {elapsed:6.2f} s   "
+            f"{pages / elapsed:6.1f} pages/s   "
+            f"x{timings['table'] / elapsed:.1f} vs table"
+        )
+
+
+def main(pages=100, worker_counts=(1, 2, 4, 8)):
+    content = make_report_pdf(pages)
+    worker_sweep(content, pages, worker_counts)
+    mode_comparison(content, pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Microbenchmark: "HH:MM" parsing with datetime.strptime vs app.utils.time_parser.
+
+Run from the project root:
+
+    python -m benchmarks.bench_time_parser
+"""
+
+import random
+import timeit
+from datetime import datetime
+
+from app.utils.time_calculator import calculate_daily_hours
+from app.utils.time_parser import parse_time
+
+
+def _strptime_minutes(time_str):
+    parsed = datetime.strptime(time_str, "%H:%M")
+    return parsed.hour * 60 + parsed.minute
+
+
+def _strptime_daily_hours(entries):
+    # The previous calculate_daily_hours implementation
+    total_hours = 0.0
+    for entry in entries:
+        if entry["exit"] and entry["entry"]:
+            entry_time = datetime.strptime(entry["entry"], "%H:%M")
+            exit_time = datetime.strptime(entry["exit"], "%H:%M")
+            total_hours += (exit_time - entry_time).total_seconds() / 3600
+    return total_hours
+
+
+def _report(label, baseline, candidate, count):
+    print(
+        f"{label:<24} strptime {baseline / count * 1e9:8.0f} ns/op   "
+        f"parser {candidate / count * 1e9:8.0f} ns/op   "
+        f"speedup x{baseline / candidate:.1f}"
+    )
+
+
+def main(count=200_000, repeat=5):
+    rng = random.Random(42)
+    values = [
+        f"{rng.randint(6, 20):02d}:{rng.randint(0, 59):02d}" for _ in range(count)
+    ]
+    days = [
+        [
+            {"entry": values[i], "exit": values[i + 1]},
+            {"entry": values[i + 2], "exit": values[i + 3]},
+        ]
+        for i in range(0, count - 3, 4)
+    ]
+
+    baseline = min(
+        timeit.repeat(
+            lambda: [_strptime_minutes(v) for v in values], number=1, repeat=repeat
+        )
+    )
+    candidate = min(
+        timeit.repeat(lambda: [parse_time(v) for v in values], number=1, repeat=repeat)
+    )
+    _report("parse HH:MM", baseline, candidate, count)
+
+    baseline = min(
+        timeit.repeat(
+            lambda: [_strptime_daily_hours(d) for d in days], number=1, repeat=repeat
+        )
+    )
+    candidate = min(
+        timeit.repeat(
+            lambda: [calculate_daily_hours(d) for d in days], number=1, repeat=repeat
+        )
+    )
+    _report("calculate_daily_hours", baseline, candidate, len(days))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: finding the `const holidays{year}` script in a generated holiday
+page with a full BeautifulSoup parse against the streaming
+HolidayScriptFinder, with the script early, midway and late in the page.
+
+Run from the project root:
+
+    python -m benchmarks.bench_website_provider
+"""
+
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from app.services.holiday_providers.argentina_website_provider import (
+    HolidayScriptFinder,
+)
+from tests.holiday_pages import make_holiday_page
+
+YEAR = 2025
+
+
+def soup_script(html, year):
+    """The lookup the provider used before the streaming finder."""
+    soup = BeautifulSoup(html, "html.parser")
+    tag = soup.find("script", string=re.compile(rf"const holidays{year}\s*="))
+    return tag.string if tag else None
+
+
+def stream_script(html, year):
+    return HolidayScriptFinder(year).find(html)
+
+
+def _best_of(func, html, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        script = func(html, YEAR)
+        best = min(best, time.perf_counter() - started)
+    assert script and f"const holidays{YEAR}" in script
+    return best
+
+
+def main(repeat=5, layouts=((30, 570), (300, 300), (570, 30))):
+    for before, after in layouts:
+        html = make_holiday_page(YEAR, cards_before=before, cards_after=after)
+        soup = _best_of(soup_script, html, repeat)
+        stream = _best_of(stream_script, html, repeat)
+        print(
+            f"{len(html) / 1024:6.0f} KB, script after {before:3d}/{before + after} "
+            f"cards   soup {soup * 1000:7.1f} ms   stream {stream * 1000:6.1f} ms   "
+            f"x{soup / stream:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Synthetic clock-system reports for the PDF importer benchmarks and tests.
+
+Writes the PDF syntax directly, so no PDF library is needed: one table per
+page with the Fecha / Entrada / Salida / Observacion columns.
+"""
+
+from datetime import date, timedelta
+
+COLUMN_X = (50, 150, 250, 350, 500)
+ROW_HEIGHT = 20
+PAGE_TOP = 780
+
+
+def _page_content(rows, ruled):
+    ops = []
+    for index, row in enumerate(rows):
+        y = PAGE_TOP - index * ROW_HEIGHT
+        for x, text in zip(COLUMN_X, row):
+            if text:
+                ops.append(f"BT /F1 10 Tf {x + 4} {y - 14} Td ({text}) Tj ET")
+
+    if ruled:
+        # Cell borders, which pdfplumber's table detection looks for
+        bottom = PAGE_TOP - len(rows) * ROW_HEIGHT
+        for index in range(len(rows) + 1):
+            y = PAGE_TOP - index * ROW_HEIGHT
+            ops.append(f"{COLUMN_X[0]} {y} m {COLUMN_X[-1]} {y} l S")
+        for x in COLUMN_X:
+            ops.append(f"{x} {PAGE_TOP} m {x} {bottom} l S")
+    return ("\n".join(ops) + "\n").encode()
+
+
+def make_report_pdf(pages, rows_per_page=25, start=date(2020, 1, 1), ruled=True):
+    """
+    A report of `pages` pages, each listing `rows_per_page` consecutive days
+    from `start` under a header row, every tenth day an absence without
+    times. With `ruled` the rows are drawn as a
+    bordered table; without it the page is a plain text listing.
+    """
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    font_id, pages_id = 1, 2
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    kids = []
+    day = start
+    for _ in range(pages):
+        rows = [("Fecha", "Entrada", "Salida", "Observacion")]
+        for index in range(rows_per_page):
+            if index % 10 == 5:
+                rows.append((day.isoformat(), "", "", "Vacaciones"))
+            else:
+                observation = "Home office" if index % 7 == 0 else ""
+                rows.append((day.isoformat(), "09:00", "17:30", observation))
+            day += timedelta(days=1)
+
+        stream = _page_content(rows, ruled)
+        content_id = add(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        kids.append(
+            add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 842] "
+                b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                % (pages_id, font_id, content_id)
+            )
+        )
+
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids),
+        len(kids),
+    )
+    catalog_id = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog_id,
+        xref,
+    )
+    return bytes(output)
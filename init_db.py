@@ -51,8 +51,7 @@ def initialize_database_manually():
         from app import create_app
         from app.config.config import Config
         from app.db.database import db
-        from app.models.models import Holiday
-        from app.services.holiday_service import get_holiday_provider
+        from app.services.holiday_sync import HolidaySyncService
         from app.utils.init_data import init_data  # Import the data seeder
 
         print("✓ Módulos importados correctamente")
@@ -75,30 +74,22 @@ def initialize_database_manually():
                 != "n"
             )
             if populate:
-                print("Obteniendo proveedor de feriados...")
-                provider = get_holiday_provider(Config)
                 current_year = time.localtime().tm_year
                 years_to_fetch = [current_year, current_year + 1]
 
                 print(f"Obteniendo feriados para los años {years_to_fetch}...")
-                all_holidays = []
-                for year in years_to_fetch:
-                    holidays = provider.get_holidays(year)
-                    if holidays:
-                        print(f"✓ Se encontraron {len(holidays)} feriados para {year}")
-                        all_holidays.extend(holidays)
+                report = HolidaySyncService.from_config(Config).sync(years_to_fetch)
+                for result in report.years:
+                    if result.ok:
+                        print(
+                            f"✓ Se encontraron {len(result.holidays)} feriados para "
+                            f"{result.year} ({result.elapsed:.2f}s)"
+                        )
                     else:
-                        print(f"⚠️ No se encontraron feriados para {year}.")
+                        print(f"⚠️ No se encontraron feriados para {result.year}.")
 
-                if all_holidays:
-                    unique_holidays = {h.date: h for h in all_holidays}.values()
-
-                    db.session.query(Holiday).delete()
-                    db.session.commit()
-
-                    db.session.bulk_save_objects(list(unique_holidays))
-                    db.session.commit()
-                    print(f"✓ {len(unique_holidays)} feriados únicos guardados.")
+                if report.saved:
+                    print(f"✓ {report.saved} feriados únicos guardados.")
 
         print("\nLa base de datos ha sido inicializada exitosamente.")
         return True, "Base de datos inicializada correctamente"
@@ -0,0 +1,67 @@
+"""Add worked_minutes column
+
+Revision ID: 7c1e4b9d2a65
+Revises: 30dae3457b0c
+Create Date: 2026-10-18 10:12:44.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e4b9d2a65'
+down_revision = '30dae3457b0c'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _to_minutes(value):
+    hours, minutes = value.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def _worked_minutes(entries):
+    total = 0
+    for entry in entries or []:
+        if entry.get('exit') and entry.get('entry'):
+            total += _to_minutes(entry['exit']) - _to_minutes(entry['entry'])
+    return total
+
+
+def upgrade():
+    with op.batch_alter_table('schedule_entries', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('worked_minutes', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from the stored entries JSON
+    schedule_entries = sa.table(
+        'schedule_entries',
+        sa.column('id', sa.Integer()),
+        sa.column('entries', sa.JSON()),
+        sa.column('worked_minutes', sa.Integer()),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(schedule_entries.c.id, schedule_entries.c.entries)
+    ).fetchall()
+
+    updates = [
+        {'row_id': row.id, 'worked_minutes': _worked_minutes(row.entries)}
+        for row in rows
+    ]
+    statement = (
+        schedule_entries.update()
+        .where(schedule_entries.c.id == sa.bindparam('row_id'))
+        .values(worked_minutes=sa.bindparam('worked_minutes'))
+    )
+    for start in range(0, len(updates), BATCH_SIZE):
+        batch = updates[start:start + BATCH_SIZE]
+        if batch:
+            connection.execute(statement, batch)
+
+
+def downgrade():
+    with op.batch_alter_table('schedule_entries', schema=None) as batch_op:
+        batch_op.drop_column('worked_minutes')
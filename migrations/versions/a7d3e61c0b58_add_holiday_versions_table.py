@@ -0,0 +1,30 @@
+"""Add holiday_versions table
+
+Revision ID: a7d3e61c0b58
+Revises: f3c9a1d27b84
+Create Date: 2026-10-18 16:05:12.418903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e61c0b58'
+down_revision = 'f3c9a1d27b84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('holiday_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('year', name='uq_holiday_versions_year')
+    )
+
+
+def downgrade():
+    op.drop_table('holiday_versions')
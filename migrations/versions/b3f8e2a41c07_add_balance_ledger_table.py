@@ -0,0 +1,34 @@
+"""Add balance_ledger table
+
+Revision ID: b3f8e2a41c07
+Revises: 7c1e4b9d2a65
+Create Date: 2026-10-18 11:02:17.530912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f8e2a41c07'
+down_revision = '7c1e4b9d2a65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The ledger is built on first use, so no backfill is needed here
+    op.create_table('balance_ledger',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('balance_minutes', sa.Integer(), nullable=False),
+    sa.Column('cumulative_minutes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_id', 'date', name='uq_balance_ledger_employee_date')
+    )
+
+
+def downgrade():
+    op.drop_table('balance_ledger')
@@ -0,0 +1,34 @@
+"""Add month_versions table
+
+Revision ID: d41a7c9e3f52
+Revises: b3f8e2a41c07
+Create Date: 2026-10-18 12:26:41.207365
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41a7c9e3f52'
+down_revision = 'b3f8e2a41c07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('month_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_id', 'year', 'month', name='uq_month_versions_employee_month')
+    )
+
+
+def downgrade():
+    op.drop_table('month_versions')
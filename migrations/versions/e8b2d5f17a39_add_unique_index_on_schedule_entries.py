@@ -0,0 +1,58 @@
+"""Add unique index on schedule_entries (employee_id, date)
+
+Revision ID: e8b2d5f17a39
+Revises: d41a7c9e3f52
+Create Date: 2026-10-18 13:48:09.615027
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b2d5f17a39'
+down_revision = 'd41a7c9e3f52'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# Rows that share (employee_id, date) with a more recent row
+DUPLICATES = (
+    'FROM schedule_entries WHERE id NOT IN ('
+    'SELECT MAX(id) FROM schedule_entries GROUP BY employee_id, date)'
+)
+
+
+def upgrade():
+    # Keep the most recent row of every (employee_id, date) before enforcing
+    # uniqueness, logging every row removed so it can be restored by hand
+    if not op.get_context().as_sql:
+        removed = op.get_bind().execute(sa.text(
+            'SELECT id, employee_id, date, entries, absence_code, observation '
+            + DUPLICATES + ' ORDER BY employee_id, date, id'
+        )).all()
+        if removed:
+            logger.warning(
+                'Removing %d duplicate schedule entries (%d days affected); the most '
+                'recent row of each day is kept',
+                len(removed),
+                len({(row.employee_id, row.date) for row in removed}),
+            )
+        for row in removed:
+            logger.warning(
+                'Removed schedule entry %s (employee %s, %s): entries=%s, '
+                'absence_code=%r, observation=%r',
+                row.id, row.employee_id, row.date, row.entries,
+                row.absence_code, row.observation,
+            )
+    op.execute('DELETE ' + DUPLICATES)
+    with op.batch_alter_table('schedule_entries', schema=None) as batch_op:
+        batch_op.create_index('ix_schedule_entries_employee_id_date', ['employee_id', 'date'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('schedule_entries', schema=None) as batch_op:
+        batch_op.drop_index('ix_schedule_entries_employee_id_date')
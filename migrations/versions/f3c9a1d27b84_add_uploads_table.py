@@ -0,0 +1,36 @@
+"""Add uploads table
+
+Revision ID: f3c9a1d27b84
+Revises: e8b2d5f17a39
+Create Date: 2026-10-18 16:02:13.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c9a1d27b84'
+down_revision = 'e8b2d5f17a39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('uploads',
+    sa.Column('id', sa.String(length=64), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('uploads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_uploads_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('uploads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_uploads_created_at'))
+
+    op.drop_table('uploads')
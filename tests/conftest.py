@@ -15,6 +15,7 @@ from app.models.models import Employee, ScheduleEntry
 class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    IMPORT_JOB_WORKERS = 0
 
 
 @pytest.fixture
@@ -29,6 +30,26 @@ def app():
         db.drop_all()
 
 
+@pytest.fixture
+def two_apps(tmp_path):
+    """Two applications sharing one database, like two server processes."""
+
+    class SharedConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'shared.db'}"
+
+    first, second = create_app(SharedConfig), create_app(SharedConfig)
+    with first.app_context():
+        db.create_all()
+        db.session.add(Employee(id=1, name="Test"))
+        db.session.commit()
+    yield first, second
+    with first.app_context():
+        db.drop_all()
+        db.engine.dispose()
+    with second.app_context():
+        db.engine.dispose()
+
+
 @pytest.fixture
 def client(app):
     """A test client for the app."""
@@ -0,0 +1,86 @@
+"""
+Synthetic pages shaped like the government holiday calendar, for the
+website provider tests and benchmark.
+
+The real page wraps the `const holidays{year}` script in a large portal
+layout: navigation, news cards, inline styles and analytics scripts.
+"""
+
+from datetime import date, timedelta
+
+HOLIDAYS = [
+    ("01/01", "Año nuevo", "inamovible"),
+    ("03/03", "Carnaval", "inamovible"),
+    ("24/03", "Día Nacional de la Memoria por la Verdad y la Justicia", "inamovible"),
+    (
+        "02/04",
+        "Día del Veterano y de los Caídos en la Guerra de Malvinas",
+        "inamovible",
+    ),
+    ("18/04", "Viernes Santo", "inamovible"),
+    ("01/05", "Día del Trabajador", "inamovible"),
+    ("25/05", "Día de la Revolución de Mayo", "inamovible"),
+    (
+        "16/06",
+        "Paso a la Inmortalidad del General Martín Miguel de Güemes",
+        "trasladable",
+    ),
+    ("20/06", "Paso a la Inmortalidad del General Manuel Belgrano", "inamovible"),
+    ("09/07", "Día de la Independencia", "inamovible"),
+    ("15/08", "Feriado con fines turísticos", "turistico"),
+    ("17/08", "Paso a la Inmortalidad del General José de San Martín", "trasladable"),
+    ("12/10", "Día del Respeto a la Diversidad Cultural", "trasladable"),
+    ("24/11", "Día de la Soberanía Nacional", "trasladable"),
+    ("08/12", "Inmaculada Concepción de María", "inamovible"),
+    ("25/12", "Navidad", "inamovible"),
+]
+
+
+NAV_LINK = '<a href="/">Inicio</a>'
+
+
+def _holiday_script(year):
+    entries = ",\n".join(
+        f'      {{"date": "{day}/{year}", "label": "{label}", "type": "{kind}"}}'
+        for day, label, kind in HOLIDAYS
+    )
+    return (
+        f"<script>\n  const holidays{year} = {{\n    es: [\n{entries},\n    ],\n"
+        f"    en: [],\n  }};\n</script>\n"
+    )
+
+
+def _filler(cards, start):
+    """News cards and an analytics script, roughly 1 KB per card."""
+    parts = []
+    for index in range(cards):
+        day = start + timedelta(days=index)
+        parts.append(
+            f'<div class="col-xs-12 col-sm-6 col-md-4">'
+            f'<a href="/noticias/{index}" class="panel panel-default">'
+            f'<div class="panel-body"><small>{day.isoformat()}</small>'
+            f'<h3 class="h4">Novedad número {index} del portal</h3>'
+            f"<p>{'Texto de ejemplo con información institucional. ' * 12}</p>"
+            f"</div></a></div>\n"
+        )
+        if index % 25 == 0:
+            parts.append(
+                f"<script>window.dataLayer = window.dataLayer || [];"
+                f"dataLayer.push({{'event': 'card{index}'}});</script>\n"
+            )
+    return "".join(parts)
+
+
+def make_holiday_page(year, cards_before=300, cards_after=300):
+    """A page with `const holidays{year}` between two runs of filler cards."""
+    start = date(year, 1, 1)
+    return (
+        "<!DOCTYPE html>\n<html lang='es'><head><meta charset='utf-8'>"
+        "<title>Feriados nacionales</title>"
+        "<style>.panel{margin:0}.h4{font-weight:700}</style></head><body>\n"
+        f"<nav>{NAV_LINK * 40}</nav>\n"
+        f"{_filler(cards_before, start)}"
+        f"{_holiday_script(year - 1)}{_holiday_script(year)}"
+        f"{_filler(cards_after, start)}"
+        "<footer>Argentina.gob.ar</footer></body></html>\n"
+    )
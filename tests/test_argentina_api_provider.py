@@ -16,6 +16,7 @@ class TestArgentinaApiProvider:
     def mock_response(self):
         """Creates a mock response object."""
         mock = MagicMock(spec=requests.Response)
+        mock.status_code = 200
         mock.raise_for_status.return_value = None
         return mock
 
@@ -33,7 +34,7 @@ class TestArgentinaApiProvider:
             },
         ]
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             assert len(holidays) == 2
             assert holidays[0].description == "Año Nuevo"
@@ -49,7 +50,7 @@ class TestArgentinaApiProvider:
             {"fecha": "2024-12-31", "nombre": "Wrong Year", "tipo": "inamovible"},
         ]
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             assert len(holidays) == 1
             assert holidays[0].description == "Correct Year"
@@ -65,7 +66,7 @@ class TestArgentinaApiProvider:
             {"fecha": "2025-01-02", "nombre": "", "tipo": "inamovible"},
         ]
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             assert len(holidays) == 1
             assert holidays[0].description == "Good"
@@ -76,7 +77,8 @@ class TestArgentinaApiProvider:
         """
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
         with patch(
-            "requests.get", side_effect=requests.RequestException("Network Error")
+            "requests.Session.get",
+            side_effect=requests.RequestException("Network Error"),
         ):
             holidays = provider.get_holidays(2025)
             assert holidays == []
@@ -87,7 +89,7 @@ class TestArgentinaApiProvider:
         """
         mock_response.json = MagicMock(side_effect=ValueError("Invalid JSON"))
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(2025)
             assert holidays == []
 
@@ -109,7 +111,7 @@ class TestArgentinaApiProvider:
             "invalid_string_entry",
         ]
         provider = ArgentinaApiProvider(api_url="http://fake-api.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             # Should only contain the valid holiday
             assert len(holidays) == 1
@@ -0,0 +1,217 @@
+"""Tests for app/services/balance_ledger.py."""
+
+from datetime import date
+
+import pytest
+
+from app.db.database import db
+from app.db.repository import upsert_schedule_entries
+from app.models.models import BalanceLedger, Holiday, ScheduleEntry
+from app.services.balance_ledger import apply_changes, get_balance, rebuild_ledger
+from app.services.period_service import aggregate_period
+from app.services.schedule_events import holidays_changed
+
+RANGES = [
+    (date(2025, 1, 1), date(2025, 12, 31)),
+    (date(2025, 3, 3), date(2025, 3, 9)),
+    (date(2024, 11, 15), date(2025, 2, 10)),
+    (date(2025, 12, 1), date(2026, 1, 31)),
+    (date(2024, 1, 1), date(2024, 3, 1)),
+]
+
+WORK_DAY = {"entry": "09:00", "exit": "18:00"}
+
+
+@pytest.fixture
+def worked_days(app, default_employee_id):
+    """Some long and short days in 2025, an absence and a holiday."""
+    with app.app_context():
+        for day, exit_time in [
+            (date(2025, 1, 6), "19:00"),
+            (date(2025, 3, 4), "15:00"),
+            (date(2025, 3, 5), "17:30"),
+            (date(2025, 6, 14), "12:00"),  # Saturday
+            (date(2025, 11, 28), "18:00"),
+        ]:
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=default_employee_id,
+                    date=day,
+                    entries=[{"entry": "09:00", "exit": exit_time}],
+                )
+            )
+        db.session.add(
+            ScheduleEntry(
+                employee_id=default_employee_id,
+                date=date(2025, 3, 6),
+                entries=[],
+                absence_code="Vacation",
+            )
+        )
+        db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+        db.session.commit()
+
+
+def _expected_minutes(start, end):
+    return round(aggregate_period(start, end)["difference"] * 60)
+
+
+def _assert_matches_summary(employee_id=1):
+    for start, end in RANGES:
+        balance = get_balance(employee_id, start, end)
+        assert balance["balance_minutes"] == _expected_minutes(start, end), (
+            start,
+            end,
+        )
+
+
+class TestBalanceLedger:
+    def test_built_on_first_use(self, app, worked_days):
+        with app.app_context():
+            assert BalanceLedger.query.count() == 0
+            _assert_matches_summary()
+            # Covers the first to the last schedule entry
+            assert BalanceLedger.query.count() == 327
+
+    def test_balance_inside_the_ledger_is_one_query(self, app, worked_days):
+        from sqlalchemy import event
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            rebuild_ledger(1)
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                balance = get_balance(1, date(2025, 1, 7), date(2025, 11, 28))
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+            assert len(statements) == 1
+            assert balance["balance_minutes"] == _expected_minutes(
+                date(2025, 1, 7), date(2025, 11, 28)
+            )
+
+    def test_updates_incrementally_through_routes(self, app, client, worked_days):
+        with app.app_context():
+            rebuild_ledger(1)
+            db.session.commit()
+
+        # Edit inside the ledger, then extend it on both sides
+        for day, exit_time in [
+            ("2025-03-05", "20:00"),
+            ("2024-12-02", "13:00"),
+            ("2026-01-05", "18:00"),
+        ]:
+            response = client.post(
+                "/entry",
+                json={
+                    "date": day,
+                    "employee_id": 1,
+                    "entries": [{"entry": "09:00", "exit": exit_time}],
+                },
+            )
+            assert response.status_code == 200
+
+        response = client.post(
+            "/monthly-log/api/update-days",
+            json={"dates": ["2025-03-10", "2025-03-11"], "day_type": "Vacation"},
+        )
+        assert response.status_code == 200
+        response = client.post(
+            "/monthly-log/api/update-days",
+            json={"dates": ["2025-03-06"], "day_type": "DEFAULT"},
+        )
+        assert response.status_code == 200
+
+        with app.app_context():
+            assert BalanceLedger.query.order_by(
+                BalanceLedger.date
+            ).first().date == date(2024, 12, 2)
+            _assert_matches_summary()
+
+            # Compare with a ledger rebuilt from scratch
+            incremental = [
+                (row.date, row.balance_minutes, row.cumulative_minutes)
+                for row in BalanceLedger.query.order_by(BalanceLedger.date)
+            ]
+            rebuild_ledger(1)
+            rebuilt = [
+                (row.date, row.balance_minutes, row.cumulative_minutes)
+                for row in BalanceLedger.query.order_by(BalanceLedger.date)
+            ]
+            assert incremental == rebuilt
+
+    def test_large_edits_shift_with_range_updates(self, app, worked_days):
+        from sqlalchemy import event
+
+        shifts = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE balance_ledger SET cumulative_minutes"):
+                shifts.append((statement, executemany, len(parameters)))
+
+        with app.app_context():
+            rebuild_ledger(1)
+            days = [
+                day
+                for day in (date.fromordinal(n) for n in range(739260, 739560))
+                if day.weekday() < 5
+            ]
+            upsert_schedule_entries(
+                {"employee_id": 1, "date": day, "entries": [WORK_DAY]} for day in days
+            )
+
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", capture)
+            try:
+                apply_changes(1, days)
+            finally:
+                event.remove(engine, "before_cursor_execute", capture)
+
+            # One statement of fixed size, run once per changed day; the
+            # Labour Day holiday keeps its balance
+            [(statement, executemany, runs)] = shifts
+            assert executemany and runs == len(days) - 1
+            assert "CASE" not in statement
+
+            incremental = [
+                (row.date, row.cumulative_minutes)
+                for row in BalanceLedger.query.order_by(BalanceLedger.date)
+            ]
+            rebuild_ledger(1)
+            assert incremental == [
+                (row.date, row.cumulative_minutes)
+                for row in BalanceLedger.query.order_by(BalanceLedger.date)
+            ]
+
+    def test_holiday_changes_refresh_the_ledger(self, app, worked_days):
+        with app.app_context():
+            rebuild_ledger(1)
+            before = get_balance(1, date(2025, 1, 1), date(2025, 12, 31))
+
+            db.session.add(Holiday(date=date(2025, 7, 9), description="Independence"))
+            holidays_changed([date(2025, 7, 9)])
+            db.session.commit()
+
+            after = get_balance(1, date(2025, 1, 1), date(2025, 12, 31))
+            assert after["balance_minutes"] == before["balance_minutes"] + 480
+            _assert_matches_summary()
+
+
+class TestBalanceRoute:
+    def test_balance_endpoint(self, client, worked_days):
+        response = client.get("/summary/balance?start=2020-01-01&end=2025-12-31")
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["start"] == "2020-01-01"
+        assert data["balance"] == data["balance_minutes"] / 60
+
+    def test_balance_endpoint_requires_a_valid_range(self, client):
+        response = client.get("/summary/balance?start=2025-03-10&end=2025-03-01")
+        assert response.status_code == 400
+        response = client.get("/summary/balance?start=2025-03-10")
+        assert response.status_code == 400
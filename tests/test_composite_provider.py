@@ -0,0 +1,122 @@
+"""Tests for app/services/holiday_providers/composite_provider.py."""
+
+import time
+from datetime import date
+
+from app.config.config import Config
+from app.models.models import Holiday
+from app.services.holiday_providers.composite_provider import (
+    CompositeHolidayProvider,
+    hedge_stats,
+)
+from app.services.holiday_service import get_holiday_provider
+
+
+class FakeSource:
+    def __init__(self, days=(1,), delay=0.0, fails=False):
+        self.days = days
+        self.delay = delay
+        self.fails = fails
+        self.calls = 0
+
+    def get_holidays(self, year):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fails:
+            raise RuntimeError("source down")
+        return [
+            Holiday(date=date(year, 1, day), description=f"Day {day}", type="x")
+            for day in self.days
+        ]
+
+
+def _days(holidays):
+    return [h.date.day for h in holidays]
+
+
+def test_fast_primary_is_not_hedged():
+    primary, backup = FakeSource(), FakeSource(days=(2,))
+    provider = CompositeHolidayProvider(
+        [("primary", primary), ("backup", backup)], hedge_after=1
+    )
+
+    assert _days(provider.get_holidays(2025)) == [1]
+    assert backup.calls == 0
+    outcome = provider.outcomes[2025]
+    assert (outcome.winner, outcome.hedged) == ("primary", False)
+    assert set(outcome.latencies) == {"primary"}
+
+
+def test_slow_primary_is_hedged():
+    primary, backup = FakeSource(delay=0.5), FakeSource(days=(2,))
+    provider = CompositeHolidayProvider(
+        [("primary", primary), ("backup", backup)], hedge_after=0.05
+    )
+
+    start = time.perf_counter()
+    holidays = provider.get_holidays(2025)
+
+    assert time.perf_counter() - start < 0.4
+    assert _days(holidays) == [2]
+    outcome = provider.outcomes[2025]
+    assert (outcome.winner, outcome.hedged) == ("backup", True)
+
+
+def test_empty_or_failing_sources_fall_through():
+    provider = CompositeHolidayProvider(
+        [
+            ("empty", FakeSource(days=())),
+            ("broken", FakeSource(fails=True)),
+            ("backup", FakeSource(days=(3,))),
+        ],
+        hedge_after=5,
+    )
+
+    assert _days(provider.get_holidays(2025)) == [3]
+    assert provider.outcomes[2025].winner == "backup"
+
+
+def test_no_source_answers():
+    provider = CompositeHolidayProvider(
+        [("a", FakeSource(days=())), ("b", FakeSource(fails=True))]
+    )
+
+    assert provider.get_holidays(2025) == []
+    assert provider.outcomes[2025].winner is None
+
+
+def test_cross_check_reports_mismatched_dates():
+    provider = CompositeHolidayProvider(
+        [("a", FakeSource(days=(1, 2))), ("b", FakeSource(days=(1, 3), delay=0.05))],
+        cross_check=True,
+    )
+
+    assert _days(provider.get_holidays(2025)) == [1, 2]
+    outcome = provider.outcomes[2025]
+    assert outcome.winner == "a"
+    assert set(outcome.latencies) == {"a", "b"}
+    assert outcome.mismatched_dates == ["2025-01-02", "2025-01-03"]
+
+
+def test_stats(client):
+    CompositeHolidayProvider([("stats-source", FakeSource())]).get_holidays(2025)
+
+    data = client.get("/stats/holiday-hedging").get_json()
+
+    assert data == hedge_stats()
+    assert data["sources"]["stats-source"]["wins"] >= 1
+
+
+def test_factory_builds_api_then_website():
+    class CompositeConfig(Config):
+        HOLIDAY_PROVIDER = "COMPOSITE"
+        HOLIDAY_HEDGE_AFTER = 0.5
+
+    provider = get_holiday_provider(CompositeConfig)
+
+    assert isinstance(provider, CompositeHolidayProvider)
+    assert [name for name, _ in provider.sources] == [
+        "ARGENTINA_API",
+        "ARGENTINA_WEBSITE",
+    ]
+    assert provider.hedge_after == 0.5
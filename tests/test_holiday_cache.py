@@ -0,0 +1,122 @@
+"""Tests for app/services/holiday_cache.py."""
+
+from datetime import date
+
+import pytest
+
+from app.db.database import db
+from app.models.models import Holiday
+from app.services.holiday_cache import HolidayYear, get_holiday_cache
+from app.services.schedule_events import holidays_changed
+
+
+@pytest.fixture
+def holidays(app):
+    with app.app_context():
+        db.session.add(Holiday(date=date(2024, 12, 25), description="Christmas"))
+        db.session.add(Holiday(date=date(2025, 1, 1), description="New Year"))
+        db.session.add(Holiday(date=date(2025, 12, 31), description="Year End"))
+        db.session.commit()
+
+
+class TestHolidayYear:
+    def test_set_and_bitmap_agree(self):
+        year = HolidayYear(2024, [date(2024, 2, 29), date(2024, 12, 31)])
+
+        assert date(2024, 2, 29) in year
+        assert date(2024, 12, 31) in year
+        assert date(2024, 3, 1) not in year
+        assert date(2025, 2, 28) not in year
+        assert int(year.bitmap.sum()) == 2
+
+
+class TestHolidayCache:
+    def test_loads_each_year_once(self, app, holidays):
+        with app.app_context():
+            cache = get_holiday_cache()
+
+            assert cache.between(date(2024, 12, 1), date(2025, 1, 31)) == {
+                date(2024, 12, 25),
+                date(2025, 1, 1),
+            }
+            assert cache.is_holiday(date(2025, 12, 31))
+            assert not cache.is_holiday(date(2025, 12, 30))
+
+            stats = cache.stats()
+            assert stats["misses"] == 2
+            assert stats["hits"] == 2
+            assert stats["cached_years"] == [2024, 2025]
+
+    def test_orm_writes_invalidate_the_year(self, app, holidays):
+        with app.app_context():
+            cache = get_holiday_cache()
+            assert not cache.is_holiday(date(2025, 5, 1))
+
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            db.session.commit()
+            assert cache.is_holiday(date(2025, 5, 1))
+
+            # Moving a holiday drops both the old and the new year
+            cache.year(2024)
+            holiday = Holiday.query.filter_by(date=date(2024, 12, 25)).one()
+            holiday.date = date(2026, 12, 25)
+            db.session.commit()
+            assert not cache.is_holiday(date(2024, 12, 25))
+            assert cache.is_holiday(date(2026, 12, 25))
+
+    def test_bulk_writes_and_hooks_invalidate(self, app, holidays):
+        with app.app_context():
+            cache = get_holiday_cache()
+            assert cache.is_holiday(date(2025, 1, 1))
+
+            db.session.query(Holiday).delete()
+            db.session.commit()
+            assert not cache.is_holiday(date(2025, 1, 1))
+
+            # bulk_save_objects skips the flush events; the write paths
+            # report the change through the holidays_changed hook
+            db.session.bulk_save_objects([Holiday(date=date(2025, 1, 1))])
+            holidays_changed([date(2025, 1, 1)])
+            db.session.commit()
+            assert cache.is_holiday(date(2025, 1, 1))
+
+    def test_rollback_drops_years_loaded_mid_transaction(self, app, holidays):
+        with app.app_context():
+            cache = get_holiday_cache()
+
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            db.session.flush()
+            # Reloaded from the uncommitted row
+            assert cache.is_holiday(date(2025, 5, 1))
+            db.session.rollback()
+            assert not cache.is_holiday(date(2025, 5, 1))
+
+            db.session.bulk_save_objects([Holiday(date=date(2026, 1, 6))])
+            holidays_changed([date(2026, 1, 6)])
+            assert cache.is_holiday(date(2026, 1, 6))
+            db.session.rollback()
+            assert not cache.is_holiday(date(2026, 1, 6))
+
+    def test_writes_from_another_process_are_picked_up(self, two_apps):
+        server, sync = two_apps
+        url = "/summary/range?start=2025-05-01&end=2025-05-01"
+        client = server.test_client()
+        assert client.get(url).get_json()["days"][0]["type"] == "Work Day"
+
+        with sync.app_context():
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            holidays_changed([date(2025, 5, 1)])
+            db.session.commit()
+
+        assert client.get(url).get_json()["days"][0]["type"] == "Holiday"
+        with server.app_context():
+            assert get_holiday_cache().stats()["misses"] == 2
+
+    def test_stats_endpoint(self, client, holidays):
+        client.get("/summary/range?start=2025-01-01&end=2025-01-31")
+        client.get("/summary/range?start=2025-01-01&end=2025-01-31")
+
+        data = client.get("/stats/holiday-cache").get_json()
+        assert data["misses"] == 1
+        assert data["hits"] == 1
+        assert data["hit_rate"] == 0.5
@@ -0,0 +1,217 @@
+"""Tests for app/services/holiday_providers/http_client.py, against a local server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app.services.holiday_providers.argentina_api_provider import ArgentinaApiProvider
+from app.services.holiday_providers.http_client import (
+    HolidayHttpClient,
+    HttpCache,
+    get_session,
+    provider_stats,
+)
+
+HOLIDAYS = [{"fecha": "2025-01-01", "nombre": "Año Nuevo", "tipo": "inamovible"}]
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Answers GETs from a script of (status, delay) steps, then with 200s.
+    With an `etag` or `last_modified`, matching conditional requests get 304.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.script = []
+        self.requests = 0
+        self.connections = set()
+        self.etag = None
+        self.last_modified = None
+        self.bodies_sent = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/feriados/{{year}}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        server.connections.add(self.client_address)
+        status, delay = server.script.pop(0) if server.script else (200, 0)
+        time.sleep(delay)
+
+        if status == 200 and (
+            (server.etag and self.headers["If-None-Match"] == server.etag)
+            or (
+                server.last_modified
+                and self.headers["If-Modified-Since"] == server.last_modified
+            )
+        ):
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        server.bodies_sent += 1
+        body = json.dumps(HOLIDAYS if status == 200 else {"error": status}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        if server.last_modified:
+            self.send_header("Last-Modified", server.last_modified)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(server, name, **kwargs):
+    kwargs.setdefault("backoff", 0.01)
+    return ArgentinaApiProvider(
+        api_url=server.url, client=HolidayHttpClient(name, **kwargs)
+    )
+
+
+def test_connections_are_kept_alive(server):
+    provider = _provider(server, "keepalive")
+
+    for year in (2025, 2025, 2025):
+        assert len(provider.get_holidays(year)) == 1
+
+    assert server.requests == 3
+    assert len(server.connections) == 1
+
+
+def test_server_errors_are_retried(server):
+    server.script = [(503, 0), (500, 0)]
+    provider = _provider(server, "flaky")
+
+    holidays = provider.get_holidays(2025)
+
+    assert [h.description for h in holidays] == ["Año Nuevo"]
+    stats = provider_stats()["flaky"]
+    assert (stats["requests"], stats["attempts"], stats["retries"]) == (1, 3, 2)
+    assert stats["failures"] == 0
+
+
+def test_timeouts_are_retried(server):
+    server.script = [(200, 0.5)]
+    provider = _provider(server, "slow", timeout=0.1)
+
+    assert len(provider.get_holidays(2025)) == 1
+    assert provider_stats()["slow"]["attempts"] == 2
+
+
+def test_gives_up_after_the_retries(server):
+    server.script = [(503, 0)] * 3
+    provider = _provider(server, "down", retries=2)
+
+    assert provider.get_holidays(2025) == []
+    stats = provider_stats()["down"]
+    assert (stats["attempts"], stats["failures"]) == (3, 1)
+    assert stats["max_latency"] > 0
+
+
+def test_client_errors_are_not_retried(server):
+    server.script = [(404, 0)]
+    client = HolidayHttpClient("missing", backoff=0.01)
+
+    with pytest.raises(requests.HTTPError):
+        client.get(server.url.format(year=2025))
+    assert server.requests == 1
+
+
+def test_providers_share_the_session():
+    assert HolidayHttpClient("a").session is HolidayHttpClient("b").session
+    assert HolidayHttpClient("a").session is get_session()
+
+
+def test_stats_endpoint(client, server):
+    _provider(server, "endpoint").get_holidays(2025)
+
+    data = client.get("/stats/holiday-providers").get_json()
+
+    assert data["endpoint"]["requests"] == 1
+
+
+def test_unchanged_years_are_revalidated(server, tmp_path):
+    server.etag = '"v1"'
+    provider = _provider(server, "etag", cache=HttpCache(str(tmp_path)))
+
+    first = provider.get_holidays(2025)
+    second = provider.get_holidays(2025)
+
+    assert [h.date for h in second] == [h.date for h in first]
+    assert (server.requests, server.bodies_sent) == (2, 1)
+    assert provider_stats()["etag"]["not_modified"] == 1
+
+
+def test_changed_years_are_downloaded_again(server, tmp_path):
+    server.last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    client = HolidayHttpClient("modified", backoff=0.01, cache=HttpCache(str(tmp_path)))
+    url = server.url.format(year=2025)
+    calls = []
+
+    def extract(response):
+        calls.append(response.status_code)
+        return response.json()
+
+    client.fetch(url, extract)
+    client.fetch(url, extract)
+    server.last_modified = "Thu, 02 Jan 2025 00:00:00 GMT"
+    data = client.fetch(url, extract)
+
+    assert calls == [200, 200]
+    assert data == HOLIDAYS
+    assert server.bodies_sent == 2
+
+
+def test_responses_without_validators_are_not_cached(server, tmp_path):
+    client = HolidayHttpClient("plain", backoff=0.01, cache=HttpCache(str(tmp_path)))
+    url = server.url.format(year=2025)
+
+    client.fetch(url, lambda response: response.json())
+    client.fetch(url, lambda response: response.json())
+
+    assert server.bodies_sent == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_empty_extracts_are_not_cached(server, tmp_path):
+    server.etag = '"v1"'
+    client = HolidayHttpClient("empty", backoff=0.01, cache=HttpCache(str(tmp_path)))
+    url = server.url.format(year=2025)
+
+    client.fetch(url, lambda response: response.json())
+    assert len(list(tmp_path.iterdir())) == 1
+    # The year went missing from the source; the stored entry goes too
+    server.etag = '"v2"'
+    assert client.fetch(url, lambda response: []) == []
+    assert list(tmp_path.iterdir()) == []
+
+    assert client.fetch(url, lambda response: response.json()) == HOLIDAYS
+    assert server.bodies_sent == 3
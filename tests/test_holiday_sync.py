@@ -0,0 +1,106 @@
+"""Tests for app/services/holiday_sync.py and the `flask holidays sync` command."""
+
+import threading
+import time
+from datetime import date
+from unittest.mock import patch
+
+from app.db.database import db
+from app.models.models import Holiday
+from app.services.holiday_sync import HolidaySyncService
+
+
+class FakeProvider:
+    """New Year's Day for every year, slowly; `failing` years raise."""
+
+    def __init__(self, delay=0.05, failing=(), empty=()):
+        self.delay = delay
+        self.failing = failing
+        self.empty = empty
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def get_holidays(self, year):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+
+        if year in self.failing:
+            raise RuntimeError("provider down")
+        if year in self.empty:
+            return []
+        return [Holiday(date=date(year, 1, 1), description="Año Nuevo", type="x")]
+
+
+def _stored():
+    return sorted((h.date, h.description) for h in Holiday.query.all())
+
+
+class TestHolidaySyncService:
+    def test_fetches_years_concurrently_up_to_the_limit(self):
+        provider = FakeProvider()
+        service = HolidaySyncService(provider, workers=3)
+
+        results = service.fetch(range(2016, 2026))
+
+        assert [r.year for r in results] == list(range(2016, 2026))
+        assert provider.max_running == 3
+        assert all(r.ok and r.elapsed >= 0.05 for r in results)
+
+    def test_failures_are_reported_per_year(self):
+        service = HolidaySyncService(FakeProvider(delay=0, failing={2025}))
+
+        results = service.fetch([2024, 2025])
+
+        assert results[0].ok
+        assert results[1].error == "provider down" and not results[1].ok
+
+    def test_sync_replaces_the_fetched_years(self, app):
+        db.session.add_all(
+            [
+                Holiday(date=date(2024, 5, 1), description="Old", type="x"),
+                Holiday(date=date(2025, 5, 1), description="Kept", type="x"),
+                Holiday(date=date(2026, 5, 1), description="Other", type="x"),
+            ]
+        )
+        db.session.commit()
+        service = HolidaySyncService(FakeProvider(delay=0, failing={2025}))
+
+        report = service.sync([2024, 2025])
+
+        assert report.saved == 1
+        assert _stored() == [
+            (date(2024, 1, 1), "Año Nuevo"),
+            (date(2025, 5, 1), "Kept"),
+            (date(2026, 5, 1), "Other"),
+        ]
+
+    def test_empty_years_keep_their_holidays(self, app):
+        db.session.add(Holiday(date=date(2025, 5, 1), description="Kept", type="x"))
+        db.session.commit()
+        service = HolidaySyncService(FakeProvider(delay=0, empty={2025}))
+
+        report = service.sync([2025])
+
+        assert report.saved == 0
+        assert _stored() == [(date(2025, 5, 1), "Kept")]
+
+
+def test_cli_sync(app):
+    with patch(
+        "app.services.holiday_sync.get_holiday_provider",
+        return_value=FakeProvider(delay=0, empty={2021}),
+    ):
+        result = app.test_cli_runner().invoke(
+            args=["holidays", "sync", "--start", "2020", "--end", "2022"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "2020: 1 holidays" in result.output
+    assert "2021: no holidays found" in result.output
+    assert "Saved 2 holidays" in result.output
+    assert [day for day, _ in _stored()] == [date(2020, 1, 1), date(2022, 1, 1)]
@@ -0,0 +1,100 @@
+"""Tests for app/services/import_jobs.py."""
+
+import threading
+
+import pytest
+
+from app.services.import_jobs import (
+    KIND_IMPORT,
+    KIND_PARSE,
+    STAGE_DONE,
+    STAGE_FAILED,
+    STAGE_IMPORTING,
+    STAGE_PARSED,
+    ImportJob,
+    ImportJobManager,
+    get_import_jobs,
+)
+
+
+def _wait(job, timeout=5):
+    for _ in range(timeout * 100):
+        if job.finished:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError(f"Job {job.upload_id} did not finish")
+
+
+class TestImportJob:
+    def test_progress_by_stage(self):
+        job = ImportJob("upload", KIND_IMPORT)
+        assert job.to_dict()["progress"] == 0
+
+        job.update(stage=STAGE_PARSED, total_rows=10, processed_rows=10)
+        assert job.to_dict()["progress"] == 50
+
+        job.update(stage=STAGE_IMPORTING, processed_rows=5)
+        status = job.to_dict()
+        assert status["progress"] == 75
+        assert status["finished"] is False
+        assert status["rows_per_second"] > 0
+
+        job.update(stage=STAGE_DONE, processed_rows=10, message="ok")
+        status = job.to_dict()
+        assert (status["progress"], status["finished"]) == (100, True)
+        assert status["rows_per_second"] > 0
+
+
+class TestImportJobManager:
+    def test_inline_runs_in_the_request(self, app):
+        manager = ImportJobManager(app, workers=0)
+
+        job = manager.submit(
+            "upload", KIND_PARSE, lambda j: j.update(stage=STAGE_PARSED)
+        )
+
+        assert manager.inline
+        assert job.stage == STAGE_PARSED
+        assert manager.get("upload") is job
+
+    def test_failures_are_recorded(self, app):
+        manager = ImportJobManager(app, workers=0)
+
+        def task(job):
+            raise ValueError("broken file")
+
+        job = manager.submit("upload", KIND_PARSE, task)
+
+        assert (job.stage, job.error) == (STAGE_FAILED, "broken file")
+
+    def test_pool_runs_tasks_in_an_app_context(self, app):
+        manager = ImportJobManager(app, workers=1)
+        release = threading.Event()
+        seen = {}
+
+        def task(job):
+            from flask import current_app
+
+            seen["app"] = current_app.name
+            job.update(stage=STAGE_IMPORTING, total_rows=2)
+            release.wait(5)
+            job.update(stage=STAGE_DONE, processed_rows=2)
+
+        try:
+            job = manager.submit("upload", KIND_IMPORT, task)
+            # A running upload cannot be submitted twice
+            with pytest.raises(RuntimeError):
+                manager.submit("upload", KIND_IMPORT, task)
+
+            release.set()
+            _wait(job)
+        finally:
+            release.set()
+            manager.shutdown()
+
+        assert job.stage == STAGE_DONE
+        assert seen["app"] == app.name
+
+    def test_app_has_a_manager(self, app):
+        with app.app_context():
+            assert get_import_jobs().inline
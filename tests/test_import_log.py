@@ -4,6 +4,7 @@ import io
 import json
 import os
 import tempfile
+import threading
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +14,7 @@ from app import create_app
 from app.config.config import Config
 from app.db.database import db
 from app.models.models import Employee, ScheduleEntry
+from app.routes import import_log
 from app.services.importer.protocol import ImportResult, TimeEntryRecord
 
 
@@ -21,14 +23,17 @@ class TestConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    IMPORT_JOB_WORKERS = 0
 
 
 class TestImportLogRoutes:
     """Tests for the import log feature."""
 
     @pytest.fixture
-    def app(self):
+    def app(self, tmp_path, monkeypatch):
         """Create and configure a Flask app for testing."""
+        # Keep uploads and parse caches out of the working tree
+        monkeypatch.setattr("app.routes.import_log.UPLOAD_FOLDER", str(tmp_path))
         app = create_app(TestConfig)
         with app.app_context():
             db.create_all()
@@ -251,6 +256,7 @@ class TestImportLogRoutes:
             ).first()
             assert entry.entries[0]["entry"] == "09:00"
             assert entry.observation == "Updated"
+            assert entry.worked_minutes == 8 * 60
 
     @patch("app.routes.import_log.ImporterFactory")
     def test_confirm_skips_invalid_records(self, mock_factory, client, app):
@@ -331,6 +337,194 @@ class TestImportLogRoutes:
 
             assert response.status_code == 200
 
+    def _write_upload(self, upload_id, content=b"fake content"):
+        from app.routes.import_log import UPLOAD_FOLDER
+        from app.services.importer.result_cache import discard_result
+
+        discard_result(UPLOAD_FOLDER, upload_id)
+        filepath = os.path.join(UPLOAD_FOLDER, f"{upload_id}.xlsx")
+        with open(filepath, "wb") as f:
+            f.write(content)
+        return filepath
+
+    def _mock_parse(self, mock_factory, observation="Cached"):
+        mock_importer = MagicMock()
+        mock_importer.parse.return_value = ImportResult(
+            records=[
+                TimeEntryRecord(
+                    date="2025-03-10",
+                    entry_time="09:00",
+                    exit_time="17:00",
+                    observation=observation,
+                )
+            ],
+            total_records=1,
+            valid_records=1,
+            errors=[],
+        )
+        mock_factory.get_importer.return_value = mock_importer
+        return mock_importer
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_confirm_reuses_preview_parse(self, mock_factory, client, app):
+        """Test confirm imports the result parsed by the preview."""
+        with app.app_context():
+            from app.routes.import_log import UPLOAD_FOLDER
+
+            upload_id = "test-parse-once-id"
+            self._write_upload(upload_id)
+            mock_importer = self._mock_parse(mock_factory)
+
+            assert client.get(f"/import/preview/{upload_id}").status_code == 200
+            response = client.post(f"/import/confirm/{upload_id}")
+
+            assert response.status_code == 302
+            assert mock_importer.parse.call_count == 1
+            entry = ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).one()
+            assert entry.observation == "Cached"
+            # The cache goes with the upload
+            assert not os.path.exists(
+                os.path.join(UPLOAD_FOLDER, "parsed", f"{upload_id}.json")
+            )
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_confirm_reparses_changed_file(self, mock_factory, client, app):
+        """Test confirm ignores a cached parse of other file content."""
+        with app.app_context():
+            upload_id = "test-stale-parse-id"
+            filepath = self._write_upload(upload_id)
+            self._mock_parse(mock_factory)
+            client.get(f"/import/preview/{upload_id}")
+
+            with open(filepath, "wb") as f:
+                f.write(b"other content")
+            mock_importer = self._mock_parse(mock_factory, observation="Fresh")
+            client.post(f"/import/confirm/{upload_id}")
+
+            assert mock_importer.parse.call_count == 1
+            entry = ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).one()
+            assert entry.observation == "Fresh"
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_registered_uploads_are_not_hashed_again(
+        self, mock_factory, client, app, mocker
+    ):
+        """Test preview and confirm reuse the digest recorded at upload."""
+        mock_importer = self._mock_parse(mock_factory)
+        hashes = mocker.spy(import_log, "content_hash")
+
+        response = client.post(
+            "/import/",
+            data={"file": (io.BytesIO(b"report"), "report.xlsx")},
+            content_type="multipart/form-data",
+        )
+        upload_id = response.location.rsplit("/", 1)[-1]
+        assert client.get(f"/import/preview/{upload_id}").status_code == 200
+        client.post(f"/import/confirm/{upload_id}")
+
+        assert hashes.call_count == 0
+        assert mock_importer.parse.call_count == 1
+        with app.app_context():
+            assert ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).count() == 1
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_preview_ignores_corrupt_cache(self, mock_factory, client, app):
+        """Test a damaged cache file falls back to parsing."""
+        with app.app_context():
+            from app.routes.import_log import UPLOAD_FOLDER
+
+            upload_id = "test-corrupt-parse-id"
+            filepath = self._write_upload(upload_id)
+            os.makedirs(os.path.join(UPLOAD_FOLDER, "parsed"), exist_ok=True)
+            with open(
+                os.path.join(UPLOAD_FOLDER, "parsed", f"{upload_id}.json"), "w"
+            ) as f:
+                f.write("{not json")
+            mock_importer = self._mock_parse(mock_factory)
+
+            response = client.get(f"/import/preview/{upload_id}")
+            client.post(f"/import/cancel/{upload_id}")
+
+            assert response.status_code == 200
+            assert mock_importer.parse.call_count == 1
+            assert not os.path.exists(filepath)
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_status_reports_the_finished_import(self, mock_factory, client, app):
+        """Test the status endpoint after an inline import."""
+        with app.app_context():
+            upload_id = "test-status-id"
+            self._write_upload(upload_id)
+            self._mock_parse(mock_factory)
+
+            assert client.get(f"/import/status/{upload_id}").status_code == 404
+            client.post(f"/import/confirm/{upload_id}")
+            status = client.get(f"/import/status/{upload_id}").get_json()
+
+            assert status["kind"] == "import"
+            assert status["stage"] == "done"
+            assert status["progress"] == 100
+            assert status["processed_rows"] == status["total_rows"] == 1
+            assert "1 new" in status["message"]
+
+    @patch("app.routes.import_log.ImporterFactory")
+    def test_background_upload_and_import(self, mock_factory, client, app):
+        """Test the upload flow with a worker thread."""
+        from app.services.import_jobs import init_import_jobs
+
+        app.config["IMPORT_JOB_WORKERS"] = 1
+        manager = init_import_jobs(app)
+        release = threading.Event()
+        mock_importer = self._mock_parse(mock_factory)
+
+        def slow_parse(content):
+            release.wait(5)
+            return mock_importer.parse.return_value
+
+        mock_importer.parse.side_effect = slow_parse
+        try:
+            response = client.post(
+                "/import/",
+                data={"file": (io.BytesIO(b"report"), "report.xlsx")},
+                content_type="multipart/form-data",
+            )
+            upload_id = response.location.rsplit("/", 1)[-1]
+
+            # The preview waits for the parse job
+            waiting = client.get(f"/import/preview/{upload_id}")
+            assert b"importStatus" in waiting.data
+            assert client.get(f"/import/status/{upload_id}").get_json()["stage"] in (
+                "queued",
+                "parsing",
+            )
+
+            release.set()
+            self._wait(manager, upload_id)
+            preview = client.get(f"/import/preview/{upload_id}")
+            assert b"Import Preview" in preview.data
+
+            response = client.post(f"/import/confirm/{upload_id}")
+            assert f"/import/preview/{upload_id}" in response.location
+            self._wait(manager, upload_id)
+            status = client.get(f"/import/status/{upload_id}").get_json()
+        finally:
+            release.set()
+            manager.shutdown()
+
+        assert status["stage"] == "done"
+        assert mock_importer.parse.call_count == 1
+        with app.app_context():
+            entry = ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).one()
+            assert entry.observation == "Cached"
+
+    @staticmethod
+    def _wait(manager, upload_id):
+        for _ in range(500):
+            if manager.get(upload_id).finished:
+                return
+            threading.Event().wait(0.01)
+        raise AssertionError("Import job did not finish")
+
     def test_cancel_removes_file(self, client, app):
         """Test cancel removes the uploaded file."""
         with app.app_context():
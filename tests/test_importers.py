@@ -1,10 +1,11 @@
 import io
 from datetime import datetime, time
 
+import openpyxl
 import pandas as pd
 import pytest
 
-from app.services.importer.excel_importer import ExcelImporter
+from app.services.importer.excel_importer import NA_VALUES, ExcelImporter
 from app.services.importer.factory import ImporterFactory
 from app.services.importer.pdf_importer import PDFImporter
 
@@ -201,6 +202,140 @@ class TestExcelImporter:
         assert len(result.errors) > 0
         assert "Error parsing Excel" in result.errors[0]
 
+    def _workbook(self, rows):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for row in rows:
+            sheet.append(row)
+        output = io.BytesIO()
+        workbook.save(output)
+        return output.getvalue()
+
+    def test_streaming_matches_dataframe_path(self):
+        """The openpyxl streaming path returns what the pandas path returns."""
+        content = self._workbook(
+            [
+                ["Fecha", "Entrada", "Salida", None, "Observación"],
+                [datetime(2025, 1, 1), time(9, 0), time(18, 0), None, "Test"],
+                ["2025-01-02", "09:30", "18:30", 1, "N/A"],
+                [None, "09:00", "18:00"],
+                [],
+                ["02/01/2025", "9:00", None, 2.0, 3.0],
+                ["2025-01-04", "09:00", "25:00"],
+                ["2025-01-05"],
+            ]
+        )
+        importer = ExcelImporter()
+
+        streamed = importer._parse_streaming(content)
+
+        assert streamed == importer._parse_dataframe(content)
+        assert streamed.total_records == 5
+        assert streamed.records[0].date == "2025-01-01"
+        assert streamed.records[1].observation is None
+
+    def test_na_tokens_match_on_both_paths(self):
+        tokens = sorted(NA_VALUES - {""}) + ["-", "n.a."]
+        content = self._workbook(
+            [["Fecha", "Entrada", "Observación"]]
+            + [["2025-01-02", "09:00", token] for token in tokens]
+        )
+        importer = ExcelImporter()
+
+        streamed = importer._parse_streaming(content)
+
+        assert streamed == importer._parse_dataframe(content)
+        assert [r.observation for r in streamed.records] == [None] * (
+            len(tokens) - 2
+        ) + ["-", "n.a."]
+
+    def test_streaming_missing_date_column(self):
+        content = self._workbook([["Entrada", "Salida"], ["09:00", "18:00"]])
+        importer = ExcelImporter()
+
+        assert importer._parse_streaming(content) == importer._parse_dataframe(content)
+        assert importer.parse(content).errors == [
+            "Could not find 'Fecha' or 'Date' column"
+        ]
+
+    def test_xlsx_does_not_build_a_dataframe(self, mocker):
+        read_excel = mocker.patch("app.services.importer.excel_importer.pd.read_excel")
+        content = self._workbook([["Date", "In", "Out"], ["2025-01-01", "09:00", ""]])
+
+        result = ExcelImporter().parse(content)
+
+        read_excel.assert_not_called()
+        assert result.records[0].entry_time == "09:00"
+        assert result.records[0].exit_time is None
+
+    def test_iter_records_is_lazy(self):
+        rows = iter([("2025-01-01", "09:00"), ("2025-01-02", "10:00")])
+        records = ExcelImporter().iter_records(rows, {"date": 0, "entry": 1})
+
+        assert next(records).entry_time == "09:00"
+        assert next(rows) == ("2025-01-02", "10:00")
+
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            pd.DataFrame(
+                {
+                    "Fecha": [
+                        "2025-1-1",
+                        "2025-02-30",
+                        "2024-02-29",
+                        "1900-02-29",
+                        "1500-06-01",
+                        " 2025-01-02 ",
+                        None,
+                        datetime(2025, 3, 1),
+                        45000,
+                    ],
+                    "Entrada": [
+                        "9:00",
+                        "24:00",
+                        "",
+                        time(9, 5),
+                        pd.Timestamp("2025-01-01 08:07"),
+                        9.5,
+                        None,
+                        "09:00",
+                        "08:00",
+                    ],
+                    "Salida": [None] * 9,
+                    "Nota": [1, None, "x", 2.5, "", "a", "b", "c", "d"],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "Date": pd.to_datetime(["2025-01-01", "2025-01-02", None]),
+                    "In": pd.to_datetime(
+                        ["2025-01-01 09:00", None, "2025-01-01 10:00"]
+                    ),
+                    "Out": [1.0, float("nan"), 3.0],
+                }
+            ),
+        ],
+    )
+    def test_vectorized_frame_matches_rows(self, frame):
+        """Column-wise records match building each row with _build_record."""
+        importer = ExcelImporter()
+        col_map = importer._map_columns(frame.columns)
+
+        by_row = [
+            importer._build_record(
+                *(
+                    row[col_map[key]] if key in col_map else None
+                    for key in ("date", "entry", "exit", "obs")
+                )
+            )
+            for row in frame.itertuples(index=False)
+        ]
+
+        assert importer._records_from_frame(frame, col_map) == [
+            record for record in by_row if record is not None
+        ]
+
     def test_format_time_with_timestamp(self):
         """Test _format_time with pandas Timestamp."""
         importer = ExcelImporter()
@@ -67,6 +67,26 @@ class TestModels(unittest.TestCase):
             self.assertEqual(len(entries_list), 1)
             self.assertEqual(entries_list[0].id, saved_entry.id)
 
+    def test_schedule_entry_worked_minutes_follow_entries(self):
+        with self.app.app_context():
+            schedule_entry = ScheduleEntry(
+                date=date(2025, 3, 17),
+                entries=[
+                    {"entry": "09:00", "exit": "12:30"},
+                    {"entry": "13:15", "exit": "18:00"},
+                ],
+            )
+            self.assertEqual(schedule_entry.worked_minutes, 495)
+
+            db.session.add(schedule_entry)
+            db.session.commit()
+
+            schedule_entry.entries = []
+            db.session.commit()
+
+            saved_entry = ScheduleEntry.query.filter_by(date=date(2025, 3, 17)).one()
+            self.assertEqual(saved_entry.worked_minutes, 0)
+
     def test_holiday_model(self):
         with self.app.app_context():
             holiday_date = date(2025, 1, 1)
@@ -0,0 +1,177 @@
+"""Tests for app/services/month_versions.py and the conditional month APIs."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+
+from app.db.database import db
+from app.models.models import Holiday, MonthVersion
+from app.services.month_versions import bump_months, range_validators
+from app.services.schedule_events import holidays_changed
+
+MONTH_URLS = [
+    "/monthly-log/api/2025/3",
+    "/logs/monthly/2025/3",
+    "/summary/monthly/2025/3",
+    "/summary/daily/2025-03-10",
+    "/summary/range?start=2025-03-01&end=2025-03-31",
+]
+
+
+def _save(client, day):
+    response = client.post(
+        "/entry",
+        json={
+            "date": day,
+            "employee_id": 1,
+            "entries": [{"entry": "09:00", "exit": "17:00"}],
+        },
+    )
+    assert response.status_code == 200
+
+
+class TestVersionCounters:
+    def test_bump_inserts_then_increments(self, app, default_employee_id):
+        with app.app_context():
+            bump_months(1, [(2025, 3)])
+            bump_months(1, [(2025, 3), (2025, 4)])
+            db.session.commit()
+
+            versions = {
+                (row.year, row.month): row.version for row in MonthVersion.query.all()
+            }
+            assert versions == {(2025, 3): 2, (2025, 4): 1}
+
+            etag, last_modified = range_validators(
+                1, date(2025, 3, 1), date(2025, 4, 30)
+            )
+            assert last_modified is not None
+
+            # Every further write changes it
+            bump_months(1, [(2025, 4)])
+            db.session.commit()
+            assert range_validators(1, date(2025, 3, 1), date(2025, 4, 30))[0] != etag
+
+    def test_bump_increments_in_the_database(self, app, default_employee_id):
+        with app.app_context():
+            bump_months(1, [(2025, 3)])
+            db.session.commit()
+            row = MonthVersion.query.one()
+            assert row.version == 1
+
+            # Another writer got in after this session read the row
+            db.session.execute(text("UPDATE month_versions SET version = 5"))
+            bump_months(1, [(2025, 3)])
+            db.session.commit()
+
+            assert MonthVersion.query.one().version == 6
+
+    def test_writes_bump_the_month(self, app, client, default_employee_id):
+        _save(client, "2025-03-10")
+        client.post(
+            "/monthly-log/api/update-days",
+            json={"dates": ["2025-03-11", "2025-04-01"], "day_type": "Vacation"},
+        )
+        with app.app_context():
+            holidays_changed([date(2025, 5, 1)])
+            db.session.commit()
+
+            versions = {
+                (row.year, row.month): row.version for row in MonthVersion.query.all()
+            }
+        assert versions == {(2025, 3): 2, (2025, 4): 1, (2025, 5): 1}
+
+
+class TestConditionalGet:
+    @pytest.mark.parametrize("url", MONTH_URLS)
+    def test_etag_round_trip(self, client, default_employee_id, url):
+        _save(client, "2025-03-10")
+
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == "no-cache"
+        etag = first.headers["ETag"]
+        assert not etag.startswith("W/")
+        assert "Last-Modified" in first.headers
+
+        repeat = client.get(url, headers={"If-None-Match": etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b""
+        assert repeat.headers["ETag"] == etag
+
+        since = client.get(
+            url, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+        )
+        assert since.status_code == 304
+
+        _save(client, "2025-03-12")
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_other_months_keep_their_etag(self, client, default_employee_id):
+        etag = client.get("/logs/monthly/2025/4").headers["ETag"]
+        _save(client, "2025-03-10")
+
+        response = client.get("/logs/monthly/2025/4", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_not_modified_skips_schedule_entries(
+        self, app, client, default_employee_id
+    ):
+        _save(client, "2025-03-10")
+        etag = client.get("/monthly-log/api/2025/3").headers["ETag"]
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                response = client.get(
+                    "/monthly-log/api/2025/3", headers={"If-None-Match": etag}
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "schedule_entries" not in statements[0]
+
+    def test_holiday_changes_change_the_etag(self, app, client, default_employee_id):
+        etag = client.get("/monthly-log/api/2025/5").headers["ETag"]
+        with app.app_context():
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            holidays_changed([date(2025, 5, 1)])
+            db.session.commit()
+
+        response = client.get(
+            "/monthly-log/api/2025/5", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.get_json()[0]["type"] == "Holiday"
+
+    def test_cached_bodies_keep_the_etag_they_were_built_at(
+        self, client, mocker, default_employee_id
+    ):
+        _save(client, "2025-03-10")
+        first = client.get("/logs/monthly/2025/3")
+        # A write lands after the counters are read for the 304 check
+        mocker.patch(
+            "app.services.month_versions.range_validators",
+            return_value=("1-2025-03-01-2025-03-31-newer", None),
+        )
+
+        response = client.get("/logs/monthly/2025/3")
+        assert response.status_code == 200
+        assert response.headers["ETag"] == first.headers["ETag"]
+        assert response.headers["Last-Modified"] == first.headers["Last-Modified"]
+
+    def test_errors_carry_no_validators(self, client):
+        response = client.get("/logs/monthly/2025/13")
+        assert response.status_code == 500
+        assert "ETag" not in response.headers
@@ -107,6 +107,28 @@ class TestMonthlyLogRoutes:
             assert updated_entry.absence_code == "MEDICAL"
             assert updated_entry.entries == []
 
+    def test_update_day_types_resets_worked_minutes(self, app, default_employee_id):
+        """Test that marking a worked day as an absence zeroes worked_minutes."""
+        client = app.test_client()
+        target_date = date(2025, 9, 8)
+
+        with app.app_context():
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=default_employee_id,
+                    date=target_date,
+                    entries=[{"entry": "09:00", "exit": "17:00"}],
+                )
+            )
+            db.session.commit()
+
+        payload = {"dates": [target_date.isoformat()], "day_type": "Vacation"}
+        client.post("/monthly-log/api/update-days", json=payload)
+
+        with app.app_context():
+            entry = ScheduleEntry.query.filter_by(date=target_date).one()
+            assert entry.worked_minutes == 0
+
     def test_update_day_types_api_exception(self, client, mocker, default_employee_id):
         """Test exception handling for the update day types API."""
         mocker.patch("app.routes.monthly_log.db.session.commit").side_effect = (
@@ -127,3 +149,94 @@ class TestMonthlyLogRoutes:
         payload = {"invalid_key": "some_value"}
         response = client.post("/monthly-log/api/update-days", json=payload)
         assert response.status_code == 400
+
+    def test_update_day_types_accepts_ranges(self, app, default_employee_id):
+        """Test that ranges and explicit dates are combined."""
+        client = app.test_client()
+        with app.app_context():
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=default_employee_id,
+                    date=date(2025, 9, 3),
+                    entries=[{"entry": "09:00", "exit": "17:00"}],
+                )
+            )
+            db.session.commit()
+
+        payload = {
+            "dates": ["2025-09-30"],
+            "ranges": [{"start": "2025-09-01", "end": "2025-09-21"}],
+            "day_type": "Vacation",
+        }
+        response = client.post("/monthly-log/api/update-days", json=payload)
+        assert response.status_code == 200
+        assert response.get_json()["updated"] == 22
+
+        with app.app_context():
+            entries = ScheduleEntry.query.order_by(ScheduleEntry.date).all()
+            assert len(entries) == 22
+            assert {e.absence_code for e in entries} == {"Vacation"}
+            assert entries[2].entries == [] and entries[2].worked_minutes == 0
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"ranges": [{"start": "2025-09-10", "end": "2025-09-01"}]},
+            {"ranges": [{"start": "2025-09-10"}]},
+            {"ranges": [{"start": "2024-01-01", "end": "2025-12-31"}]},
+            {"dates": ["2025-13-01"]},
+            {"dates": "2025-09-01"},
+        ],
+    )
+    def test_update_day_types_invalid_dates(self, client, payload):
+        payload["day_type"] = "Vacation"
+        response = client.post("/monthly-log/api/update-days", json=payload)
+        assert response.status_code == 400
+
+    def test_update_day_types_query_count_is_constant(self, app, default_employee_id):
+        """Test that the number of statements does not grow with the dates."""
+        from sqlalchemy import event
+
+        client = app.test_client()
+        # Build the balance ledger first so both requests do the same work
+        client.post(
+            "/monthly-log/api/update-days",
+            json={"dates": ["2025-01-01", "2025-12-31"], "day_type": "Work Day"},
+        )
+
+        def run(payload):
+            statements = []
+
+            def count(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            with app.app_context():
+                engine = db.engine
+                event.listen(engine, "before_cursor_execute", count)
+                try:
+                    response = client.post("/monthly-log/api/update-days", json=payload)
+                finally:
+                    event.remove(engine, "before_cursor_execute", count)
+            assert response.status_code == 200
+            return statements
+
+        week = run(
+            {
+                "ranges": [{"start": "2025-03-03", "end": "2025-03-07"}],
+                "day_type": "Vacation",
+            }
+        )
+        three_weeks = run(
+            {
+                "ranges": [{"start": "2025-06-02", "end": "2025-06-22"}],
+                "day_type": "Vacation",
+            }
+        )
+        assert len(week) == len(three_weeks)
+
+        writes = [
+            s
+            for s in three_weeks
+            if s.startswith(("INSERT INTO schedule_entries", "UPDATE schedule_entries"))
+        ]
+        assert len(writes) == 1
@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.services.importer.pdf_importer import PDFImporter
+from app.services.importer.pdf_importer import (
+    PDFImporter,
+    _is_text_layout,
+    _page_ranges,
+    _text_table,
+)
+from benchmarks.pdf_report import make_report_pdf
 
 
 class TestPDFImporter:
@@ -46,6 +52,11 @@ class TestPDFImporter:
         result = importer._normalize_time("invalid")
         assert result is None
 
+    def test_normalize_time_keeps_out_of_range_times(self, importer):
+        """Times of the right shape but out of range are left for validation."""
+        assert importer._normalize_time("25:00") == "25:00"
+        assert importer._normalize_time("9:5") is None
+
     def test_normalize_time_strips_whitespace(self, importer):
         """Test time with whitespace is stripped."""
         result = importer._normalize_time("  09:30  ")
@@ -283,5 +294,135 @@ class TestPDFImporter:
         assert result.valid_records == 2
 
 
+class TestParallelExtraction:
+    """Tests for extracting pages with a process pool."""
+
+    def test_page_ranges_cover_all_pages_in_order(self):
+        assert _page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+        assert _page_ranges(2, 2) == [(0, 1), (1, 2)]
+
+    def test_worker_count_from_config(self, app):
+        app.config["PDF_IMPORT_WORKERS"] = 4
+        with app.app_context():
+            importer = PDFImporter()
+            assert importer._worker_count(100) == 4
+            # Small documents are not worth extra processes
+            assert importer._worker_count(3) == 1
+            assert PDFImporter(workers=2)._worker_count(100) == 2
+
+    def test_parallel_matches_serial(self):
+        content = make_report_pdf(pages=4, rows_per_page=5)
+
+        serial = PDFImporter(workers=1, mode="table").parse(content)
+        parallel = PDFImporter(workers=2, mode="table").parse(content)
+
+        assert serial.errors == []
+        assert serial.total_records == 20
+        assert parallel == serial
+        assert [r.date for r in parallel.records][:2] == ["2020-01-01", "2020-01-02"]
+
+    def test_table_mode_uses_the_pool(self, mocker):
+        # The generated report reads as a text layout, so "auto" never
+        # reaches the pool; forcing table mode must
+        content = make_report_pdf(pages=4, rows_per_page=5)
+        spy = mocker.spy(PDFImporter, "_extract_parallel")
+
+        assert PDFImporter(workers=2).parse(content).parse_mode == "text"
+        assert spy.call_count == 0
+
+        result = PDFImporter(workers=2, mode="table").parse(content)
+
+        assert result.parse_mode == "table"
+        assert spy.call_count == 1
+        assert result.total_records == 20
+
+    def test_worker_errors_are_reported(self, mocker):
+        content = make_report_pdf(pages=4, rows_per_page=1)
+        mocker.patch.object(
+            PDFImporter, "_extract_parallel", side_effect=RuntimeError("worker died")
+        )
+
+        result = PDFImporter(workers=2, mode="table").parse(content)
+
+        assert result.errors == ["Error parsing PDF: worker died"]
+        assert result.records == []
+
+
+def _words(*lines):
+    """pdfplumber-like words from (top, [(x0, text), ...]) lines."""
+    return [
+        {"text": text, "x0": x0, "x1": x0 + 5 * len(text), "top": top}
+        for top, words in lines
+        for x0, text in words
+    ]
+
+
+class TestTextFastPath:
+    """Tests for reading report listings from the text layer."""
+
+    def test_text_table_assigns_words_to_header_columns(self):
+        table = _text_table(
+            _words(
+                (10, [(50, "Attendance"), (100, "report")]),
+                (30, [(50, "Fecha"), (150, "Hora"), (175, "entrada"), (250, "Salida")]),
+                (50, [(50, "2025-03-10"), (150, "09:00"), (250, "17:00")]),
+                (70, [(50, "2025-03-11"), (250, "13:00"), (300, "late")]),
+                (90, [(50, "Total"), (150, "16h")]),
+            )
+        )
+
+        assert table == [
+            ["Fecha", "Hora entrada", "Salida"],
+            ["2025-03-10", "09:00", "17:00"],
+            ["2025-03-11", "", "13:00 late"],
+        ]
+
+    def test_probe_rejects_pages_without_clean_rows(self):
+        assert not _is_text_layout(None)
+        assert not _is_text_layout([["Fecha", "Entrada"]])
+        assert not _is_text_layout([["Fecha", "Entrada"], ["2025-03-10", "9h"]])
+        assert _is_text_layout([["Fecha", "Entrada"], ["2025-03-10", "9:00"]])
+
+    def test_auto_reads_plain_listings_from_text(self):
+        content = make_report_pdf(pages=2, rows_per_page=10, ruled=False)
+
+        result = PDFImporter().parse(content)
+
+        assert result.parse_mode == "text"
+        assert result.total_records == result.valid_records == 20
+        assert result.records[5].entry_time is None
+        assert result.records[5].observation == "Vacaciones"
+        # Table detection finds nothing without cell borders
+        assert PDFImporter(mode="table").parse(content).total_records == 0
+
+    def test_text_and_table_modes_agree_on_ruled_reports(self):
+        content = make_report_pdf(pages=2, rows_per_page=10)
+
+        text = PDFImporter(mode="text").parse(content)
+        table = PDFImporter(mode="table").parse(content)
+
+        assert (text.parse_mode, table.parse_mode) == ("text", "table")
+        assert text.records == table.records
+
+    @patch("app.services.importer.pdf_importer.pdfplumber")
+    def test_auto_falls_back_to_tables(self, mock_pdfplumber):
+        page = MagicMock()
+        page.extract_words.return_value = _words(
+            (30, [(50, "Fecha"), (150, "Entrada")]),
+            (50, [(50, "2025-03-10"), (150, "nine")]),
+        )
+        page.extract_tables.return_value = []
+        mock_pdfplumber.open.return_value.__enter__.return_value.pages = [page]
+
+        result = PDFImporter().parse(b"fake pdf content")
+
+        assert result.parse_mode == "table"
+        page.extract_tables.assert_called_once()
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            PDFImporter(mode="ocr")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
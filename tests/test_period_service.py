@@ -0,0 +1,183 @@
+"""Tests for app/services/period_service.py."""
+
+from datetime import date
+
+import pytest
+
+from app.db.database import db
+from app.models.models import Holiday, ScheduleEntry
+from app.services.period_service import aggregate_period, classify_day, period_totals
+
+
+@pytest.fixture
+def year_of_entries(app, default_employee_id):
+    """A full year with a worked day per week, a vacation and two holidays."""
+    with app.app_context():
+        day = date(2025, 1, 6)  # Monday
+        while day.year == 2025:
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=default_employee_id,
+                    date=day,
+                    entries=[{"entry": "09:00", "exit": "19:00"}],
+                )
+            )
+            day = date.fromordinal(day.toordinal() + 7)
+
+        db.session.add(
+            ScheduleEntry(
+                employee_id=default_employee_id,
+                date=date(2025, 3, 4),
+                entries=[],
+                absence_code="Vacation",
+            )
+        )
+        db.session.add(Holiday(date=date(2025, 1, 1), description="New Year"))
+        db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+        db.session.commit()
+
+
+class TestClassifyDay:
+    def test_precedence(self):
+        holidays = {date(2025, 3, 3)}
+        absence = ScheduleEntry(date=date(2025, 3, 3), entries=[], absence_code="SICK")
+
+        assert classify_day(date(2025, 3, 3), absence, holidays) == "SICK"
+        assert classify_day(date(2025, 3, 3), None, holidays) == "Holiday"
+        assert classify_day(date(2025, 3, 8), None, holidays) == "Weekend"
+        assert classify_day(date(2025, 3, 4), None, holidays) == "Work Day"
+
+    def test_follows_the_working_week(self, app):
+        saturday, friday = date(2025, 3, 8), date(2025, 3, 7)
+
+        app.config["WORKING_DAYS_PER_WEEK"] = 6
+        assert classify_day(saturday, None, set()) == "Work Day"
+
+        app.config["WORKING_DAYS_PER_WEEK"] = 4
+        assert classify_day(friday, None, set()) == "Weekend"
+        assert classify_day(friday, None, set(), "1111100") == "Work Day"
+
+    def test_range_and_totals_agree_on_workdays(self, app, default_employee_id):
+        app.config["WORKING_DAYS_PER_WEEK"] = 6
+        start, end = date(2025, 3, 3), date(2025, 3, 16)
+
+        summary = aggregate_period(start, end)
+
+        assert summary["required"] == period_totals(start, end)["required"] == 12 * 8
+
+
+class TestAggregatePeriod:
+    def test_month_buckets_cover_the_year(self, app, year_of_entries):
+        with app.app_context():
+            result = aggregate_period(date(2025, 1, 1), date(2025, 12, 31), "month")
+
+        assert result["granularity"] == "month"
+        assert [p["label"] for p in result["periods"]][:3] == [
+            "2025-01",
+            "2025-02",
+            "2025-03",
+        ]
+        assert len(result["periods"]) == 12
+        assert sum(len(p["days"]) for p in result["periods"]) == 365
+
+        # 261 weekdays in 2025, minus 2 holidays and 1 vacation day
+        assert result["required"] == 258 * 8.0
+        assert result["total"] == 52 * 10.0
+        assert result["difference"] == result["total"] - result["required"]
+        assert sum(p["total"] for p in result["periods"]) == result["total"]
+
+    def test_month_bucket_matches_monthly_summary(self, app, client, year_of_entries):
+        with app.app_context():
+            result = aggregate_period(date(2025, 1, 1), date(2025, 12, 31), "month")
+
+        march = result["periods"][2]
+        monthly = client.get("/summary/monthly/2025/3").get_json()
+        assert monthly == {
+            "total": march["total"],
+            "required": march["required"],
+            "difference": march["difference"],
+        }
+
+    def test_week_buckets_are_clipped_to_range(self, app, year_of_entries):
+        with app.app_context():
+            result = aggregate_period(date(2025, 3, 5), date(2025, 3, 20), "week")
+
+        assert [p["label"] for p in result["periods"]] == [
+            "2025-W10",
+            "2025-W11",
+            "2025-W12",
+        ]
+        assert result["periods"][0]["start"] == "2025-03-05"
+        assert result["periods"][1]["start"] == "2025-03-10"
+        assert result["periods"][-1]["end"] == "2025-03-20"
+
+    @pytest.mark.parametrize(
+        "granularity,labels",
+        [
+            ("quarter", ["2025-Q1", "2025-Q2"]),
+            ("year", ["2025"]),
+            ("custom", ["2025-02-15/2025-04-10"]),
+        ],
+    )
+    def test_other_granularities(self, app, year_of_entries, granularity, labels):
+        with app.app_context():
+            result = aggregate_period(date(2025, 2, 15), date(2025, 4, 10), granularity)
+
+        assert [p["label"] for p in result["periods"]] == labels
+        assert sum(p["required"] for p in result["periods"]) == result["required"]
+
+    def test_uses_configured_hours_per_day(self, app, year_of_entries):
+        app.config["WORKING_HOURS_PER_DAY"] = 6
+        with app.app_context():
+            result = aggregate_period(date(2025, 1, 6), date(2025, 1, 10), "day")
+
+        assert [p["required"] for p in result["periods"]] == [6.0] * 5
+        assert result["periods"][0]["days"][0]["difference"] == 4.0
+
+    def test_invalid_granularity(self, app):
+        with app.app_context():
+            with pytest.raises(ValueError, match="Unsupported granularity"):
+                aggregate_period(date(2025, 1, 1), date(2025, 1, 31), "fortnight")
+
+    def test_runs_three_queries_for_a_year(self, app, year_of_entries):
+        from sqlalchemy import event
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                aggregate_period(date(2025, 1, 1), date(2025, 12, 31), "week")
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+        # Entries, holidays and the holiday versions checked by the cache
+        assert len(statements) == 3
+
+
+class TestPeriodTotals:
+    def test_matches_aggregate_period(self, app, year_of_entries):
+        with app.app_context():
+            for start, end in [
+                (date(2025, 1, 1), date(2025, 12, 31)),
+                (date(2025, 2, 27), date(2025, 3, 9)),
+                (date(2025, 4, 26), date(2025, 5, 4)),
+            ]:
+                expected = aggregate_period(start, end)
+                assert period_totals(start, end) == {
+                    "total": expected["total"],
+                    "required": expected["required"],
+                    "difference": expected["difference"],
+                }
+
+    def test_multi_year_range(self, app, year_of_entries):
+        with app.app_context():
+            result = period_totals(date(2020, 1, 1), date(2029, 12, 31))
+            in_2025 = period_totals(date(2025, 1, 1), date(2025, 12, 31))
+
+        assert result["total"] == in_2025["total"]
+        assert result["required"] > in_2025["required"] * 9
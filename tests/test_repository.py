@@ -0,0 +1,250 @@
+"""Tests for app/db/repository.py."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from app.db.database import db
+from app.db.repository import (
+    SQLITE_MAX_VARIABLES,
+    merge_schedule_entries,
+    upsert_schedule_entries,
+)
+from app.models.models import ScheduleEntry
+
+
+def _entries(app):
+    with app.app_context():
+        return {
+            entry.date: (entry.entries, entry.absence_code, entry.observation)
+            for entry in ScheduleEntry.query.all()
+        }
+
+
+@pytest.fixture(params=["sqlite", "generic"])
+def dialect(request, mocker):
+    """Run each test with ON CONFLICT and with the select-and-split fallback."""
+    if request.param == "generic":
+        bind = MagicMock()
+        bind.dialect.name = "mysql"
+        mocker.patch("app.db.repository.db.session.get_bind", return_value=bind)
+    return request.param
+
+
+class TestUpsertScheduleEntries:
+    def test_inserts_then_updates(self, app, default_employee_id, dialect):
+        with app.app_context():
+            written = upsert_schedule_entries(
+                [
+                    {
+                        "employee_id": 1,
+                        "date": date(2025, 3, 10),
+                        "entries": [{"entry": "09:00", "exit": "17:30"}],
+                        "observation": "first",
+                    },
+                    {
+                        "employee_id": 1,
+                        "date": date(2025, 3, 11),
+                        "absence_code": "SICK",
+                    },
+                ]
+            )
+            db.session.commit()
+            assert written == 2
+            inserted = ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).one()
+            assert inserted.worked_minutes == 510
+
+            upsert_schedule_entries(
+                [
+                    {
+                        "employee_id": 1,
+                        "date": date(2025, 3, 10),
+                        "entries": [{"entry": "09:00", "exit": "12:00"}],
+                        "observation": "ignored",
+                    },
+                    {"employee_id": 1, "date": date(2025, 3, 12)},
+                ],
+                update_columns=["entries"],
+            )
+            db.session.commit()
+
+            updated = ScheduleEntry.query.filter_by(date=date(2025, 3, 10)).one()
+            assert updated.entries == [{"entry": "09:00", "exit": "12:00"}]
+            assert updated.worked_minutes == 180
+            assert updated.observation == "first"
+            assert ScheduleEntry.query.count() == 3
+
+    def test_later_rows_win(self, app, default_employee_id, dialect):
+        with app.app_context():
+            upsert_schedule_entries(
+                [
+                    {"employee_id": 1, "date": date(2025, 3, 10), "absence_code": "A"},
+                    {"employee_id": 1, "date": date(2025, 3, 10), "absence_code": "B"},
+                ]
+            )
+            db.session.commit()
+
+        assert _entries(app) == {date(2025, 3, 10): ([], "B", None)}
+
+    def test_rejects_unknown_columns(self, app):
+        with app.app_context(), pytest.raises(ValueError):
+            upsert_schedule_entries(
+                [{"employee_id": 1, "date": date(2025, 3, 10)}],
+                update_columns=["employee_id"],
+            )
+
+    def test_large_batches(self, app, default_employee_id):
+        rows = [
+            {
+                "employee_id": 1,
+                "date": date.fromordinal(date(2020, 1, 1).toordinal() + i),
+            }
+            for i in range(1200)
+        ]
+        with app.app_context():
+            assert upsert_schedule_entries(rows) == 1200
+            assert (
+                upsert_schedule_entries(rows, update_columns=["absence_code"]) == 1200
+            )
+            db.session.commit()
+            assert ScheduleEntry.query.count() == 1200
+
+    def test_batches_fit_old_sqlite_parameter_limits(self, app, default_employee_id):
+        rows = [
+            {
+                "employee_id": 1,
+                "date": date.fromordinal(date(2020, 1, 1).toordinal() + i),
+            }
+            for i in range(400)
+        ]
+        parameters = []
+
+        def count(conn, cursor, statement, params, context, executemany):
+            parameters.append(len(params))
+
+        with app.app_context():
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                upsert_schedule_entries(rows)
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+        assert len(parameters) == 3
+        assert max(parameters) <= SQLITE_MAX_VARIABLES
+
+
+class TestScheduleEntryUniqueness:
+    def test_duplicate_employee_date_is_rejected(self, app, default_employee_id):
+        with app.app_context():
+            for _ in range(2):
+                db.session.add(
+                    ScheduleEntry(employee_id=1, date=date(2025, 3, 10), entries=[])
+                )
+            with pytest.raises(IntegrityError):
+                db.session.commit()
+            db.session.rollback()
+
+
+class TestMergeScheduleEntries:
+    def test_counts_and_changed_dates(self, app, default_employee_id):
+        with app.app_context():
+            upsert_schedule_entries(
+                [
+                    {
+                        "employee_id": 1,
+                        "date": date(2025, 3, 10),
+                        "entries": [{"entry": "09:00", "exit": "17:00"}],
+                    },
+                    {
+                        "employee_id": 1,
+                        "date": date(2025, 3, 11),
+                        "absence_code": "SICK",
+                    },
+                ]
+            )
+            db.session.commit()
+
+            result = merge_schedule_entries(
+                1,
+                [
+                    # Same entries: unchanged
+                    {
+                        "date": date(2025, 3, 10),
+                        "entries": [{"entry": "09:00", "exit": "17:00"}],
+                    },
+                    # Only the observation differs; the absence code stays
+                    {"date": date(2025, 3, 11), "entries": [], "observation": "flu"},
+                    {
+                        "date": date(2025, 3, 12),
+                        "entries": [{"entry": "08:00", "exit": "12:00"}],
+                    },
+                ],
+            )
+            db.session.commit()
+
+            assert (result.inserted, result.updated, result.unchanged) == (1, 1, 1)
+            assert result.changed_dates == [date(2025, 3, 11), date(2025, 3, 12)]
+            assert result.elapsed >= 0
+            inserted = ScheduleEntry.query.filter_by(date=date(2025, 3, 12)).one()
+            assert inserted.worked_minutes == 240
+
+        assert _entries(app)[date(2025, 3, 11)] == ([], "SICK", "flu")
+
+    def test_updates_worked_minutes_with_entries(self, app, default_employee_id):
+        with app.app_context():
+            upsert_schedule_entries([{"employee_id": 1, "date": date(2025, 3, 10)}])
+            merge_schedule_entries(
+                1,
+                [
+                    {
+                        "date": date(2025, 3, 10),
+                        "entries": [{"entry": "09:00", "exit": "10:30"}],
+                    }
+                ],
+            )
+            db.session.commit()
+
+            entry = ScheduleEntry.query.one()
+            assert entry.worked_minutes == 90
+
+    def test_statement_count_is_constant(self, app, default_employee_id):
+        def rows(days, observation):
+            return [
+                {
+                    "date": date.fromordinal(date(2025, 1, 1).toordinal() + i),
+                    "entries": [{"entry": "09:00", "exit": "17:00"}],
+                    "observation": observation,
+                }
+                for i in range(days)
+            ]
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            merge_schedule_entries(1, rows(100, "first"))
+            db.session.commit()
+
+            engine = db.engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                # 100 updates and 100 inserts
+                result = merge_schedule_entries(1, rows(200, "second"))
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+            db.session.commit()
+
+        assert (result.inserted, result.updated) == (100, 100)
+        # One select, one upsert and one executemany update
+        assert len(statements) == 3
+
+    def test_empty_input(self, app):
+        with app.app_context():
+            result = merge_schedule_entries(1, [])
+        assert (result.inserted, result.updated, result.unchanged) == (0, 0, 0)
@@ -0,0 +1,181 @@
+"""Tests for app/services/response_cache.py."""
+
+from datetime import date
+
+import pytest
+
+from app import create_app
+from app.config.config import Config
+from app.db.database import db
+from app.models.models import AbsenceCode, Employee, Holiday
+from app.services.response_cache import (
+    FilesystemBackend,
+    MemoryBackend,
+    get_response_cache,
+)
+from app.services.schedule_events import holidays_changed
+
+
+def _save(client, day, exit_time="17:00", absence_code=None):
+    payload = {"date": day, "employee_id": 1, "absence_code": absence_code}
+    if absence_code is None:
+        payload["entries"] = [{"entry": "09:00", "exit": exit_time}]
+    response = client.post("/entry", json=payload)
+    assert response.status_code == 200
+
+
+def _cache_stats(app):
+    with app.app_context():
+        return get_response_cache().stats()["namespaces"]
+
+
+class TestBackends:
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.get("a")
+        backend.set("c", b"3")
+
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert backend.delete("c")
+        assert not backend.delete("c")
+
+    def test_filesystem_backend_round_trip(self, tmp_path):
+        backend = FilesystemBackend(str(tmp_path / "cache"))
+        backend.set("monthly_log:1:2025:03", b"[]")
+
+        assert backend.get("monthly_log:1:2025:03") == b"[]"
+        assert FilesystemBackend(backend.directory).get("monthly_log:1:2025:03")
+        assert backend.delete("monthly_log:1:2025:03")
+        assert backend.get("monthly_log:1:2025:03") is None
+
+        backend.set("a", b"1")
+        backend.clear()
+        assert backend.get("a") is None
+
+
+class TestCachedMonthViews:
+    URLS = [
+        "/summary/monthly/2025/3",
+        "/logs/monthly/2025/3",
+        "/monthly-log/api/2025/3",
+    ]
+
+    def test_repeat_views_are_served_from_cache(self, client, default_employee_id):
+        first = [client.get(url).get_json() for url in self.URLS]
+        second = [client.get(url).get_json() for url in self.URLS]
+        assert first == second
+
+        stats = client.get("/stats/response-cache").get_json()
+        assert stats["backend"] == "MemoryBackend"
+        for namespace in ("monthly_summary", "time_log", "monthly_log"):
+            assert stats["namespaces"][namespace]["hits"] == 1
+            assert stats["namespaces"][namespace]["misses"] == 1
+            assert stats["namespaces"][namespace]["hit_rate"] == 0.5
+
+    def test_writes_invalidate_only_their_month(self, app, client, default_employee_id):
+        client.get("/logs/monthly/2025/3")
+        client.get("/logs/monthly/2025/4")
+
+        _save(client, "2025-03-10")
+        march = client.get("/logs/monthly/2025/3").get_json()
+        client.get("/logs/monthly/2025/4")
+
+        assert [day["date"] for day in march] == ["2025-03-10"]
+        stats = _cache_stats(app)["time_log"]
+        assert stats["invalidations"] == 1
+        assert stats["hits"] == 1
+
+    def test_day_type_updates_invalidate(self, client, default_employee_id):
+        assert client.get("/monthly-log/api/2025/3").get_json()[9]["type"] == (
+            "Work Day"
+        )
+        response = client.post(
+            "/monthly-log/api/update-days",
+            json={"dates": ["2025-03-10"], "day_type": "Vacation"},
+        )
+        assert response.status_code == 200
+
+        days = client.get("/monthly-log/api/2025/3").get_json()
+        assert days[9]["type"] == "Vacation"
+
+    def test_absence_code_rename_invalidates(self, app, client, default_employee_id):
+        with app.app_context():
+            code = AbsenceCode(code="SICK")
+            db.session.add(code)
+            db.session.commit()
+            code_id = code.id
+        _save(client, "2025-03-11", absence_code="SICK")
+        client.get("/logs/monthly/2025/3")
+        client.get("/logs/monthly/2025/4")
+
+        response = client.put(
+            f"/settings/api/absence-codes/{code_id}", json={"code": "ILL"}
+        )
+        assert response.status_code == 200
+        stats = _cache_stats(app)["time_log"]
+        # Only March holds the renamed code
+        assert stats["invalidations"] == 1
+        assert stats["hits"] == 0
+
+    def test_errors_are_not_cached(self, client, mocker, default_employee_id):
+        mocker.patch("app.routes.time_log.ScheduleEntry.query").filter.side_effect = (
+            Exception("Database error")
+        )
+        assert client.get("/logs/monthly/2025/5").status_code == 500
+        mocker.stopall()
+        assert client.get("/logs/monthly/2025/5").status_code == 200
+
+
+class TestSharedDatabase:
+    def test_writes_from_another_process_are_not_served_stale(self, two_apps):
+        server, sync = two_apps
+        client = server.test_client()
+        before = client.get("/summary/monthly/2025/5").get_json()
+        assert client.get("/summary/monthly/2025/5").get_json() == before
+
+        with sync.app_context():
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            holidays_changed([date(2025, 5, 1)])
+            db.session.commit()
+
+        after = client.get("/summary/monthly/2025/5").get_json()
+        assert after["required"] == before["required"] - 8
+        with server.app_context():
+            stats = get_response_cache().stats()["namespaces"]["monthly_summary"]
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+class TestFilesystemCache:
+    @pytest.fixture
+    def fs_app(self, tmp_path):
+        class FilesystemConfig(Config):
+            TESTING = True
+            SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+            RESPONSE_CACHE_BACKEND = "filesystem"
+            RESPONSE_CACHE_DIR = str(tmp_path / "responses")
+
+        app = create_app(FilesystemConfig)
+        with app.app_context():
+            db.create_all()
+            db.session.add(Employee(id=1, name="Test"))
+            db.session.commit()
+            yield app
+            db.session.remove()
+            db.drop_all()
+
+    def test_entries_are_files_and_invalidated(self, fs_app, tmp_path):
+        client = fs_app.test_client()
+        responses = tmp_path / "responses"
+        client.get("/logs/monthly/2025/3")
+        assert len(list(responses.glob("time_log-1-2025-03-*.json"))) == 1
+
+        _save(client, "2025-03-10")
+        assert not list(responses.glob("time_log-1-2025-03-*.json"))
+        assert len(client.get("/logs/monthly/2025/3").get_json()) == 1
+        # The new version replaces the old body
+        _save(client, "2025-03-11")
+        assert len(client.get("/logs/monthly/2025/3").get_json()) == 2
+        assert len(list(responses.glob("time_log-1-2025-03-*.json"))) == 1
@@ -433,6 +433,118 @@ class TestRoutes(unittest.TestCase):
         self.assertEqual(data["required"], 8.0)
         self.assertEqual(data["difference"], -8.0)
 
+    def test_range_summary_route(self):
+        """Test the range summary returns every day plus totals in one response."""
+        from app.models.models import Holiday
+
+        with self.app.app_context():
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=1,
+                    date=date(2025, 3, 10),  # Monday
+                    entries=[{"entry": "09:00", "exit": "18:00"}],
+                    absence_code=None,
+                )
+            )
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=1,
+                    date=date(2025, 3, 11),  # Tuesday
+                    entries=[],
+                    absence_code="SICK",
+                )
+            )
+            db.session.add(Holiday(date=date(2025, 3, 12), description="Test Holiday"))
+            db.session.commit()
+
+        response = self.client.get("/summary/range?start=2025-03-10&end=2025-03-16")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+
+        self.assertEqual(len(data["days"]), 7)
+        day_map = {day["date"]: day for day in data["days"]}
+        self.assertEqual(day_map["2025-03-10"]["type"], "Work Day")
+        self.assertEqual(day_map["2025-03-10"]["hours"], 9.0)
+        self.assertEqual(day_map["2025-03-10"]["difference"], 1.0)
+        self.assertEqual(day_map["2025-03-11"]["type"], "SICK")
+        self.assertEqual(day_map["2025-03-12"]["type"], "Holiday")
+        self.assertEqual(day_map["2025-03-15"]["type"], "Weekend")
+
+        # Mon worked, Thu and Fri missing, Tue absent, Wed holiday
+        self.assertEqual(data["total"], 9.0)
+        self.assertEqual(data["required"], 24.0)
+        self.assertEqual(data["difference"], -15.0)
+
+    def test_range_summary_matches_daily_summary(self):
+        """Test that every day in the range matches the per-day endpoint."""
+        with self.app.app_context():
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=1,
+                    date=date(2025, 3, 17),
+                    entries=[{"entry": "08:30", "exit": "12:00"}],
+                    absence_code=None,
+                )
+            )
+            db.session.commit()
+
+        response = self.client.get("/summary/range?start=2025-03-01&end=2025-03-31")
+        days = json.loads(response.data)["days"]
+        self.assertEqual(len(days), 31)
+
+        for day in days:
+            daily = json.loads(self.client.get(f"/summary/daily/{day['date']}").data)
+            self.assertEqual({k: v for k, v in day.items() if k != "date"}, daily)
+
+    def test_range_summary_invalid_params(self):
+        """Test the range summary validates its query parameters."""
+        response = self.client.get("/summary/range?start=2025-03-01")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/summary/range?start=2025-03-01&end=bad")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)["error"], "Invalid date format")
+
+        response = self.client.get("/summary/range?start=2025-03-31&end=2025-03-01")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/summary/range?start=2020-01-01&end=2025-01-01")
+        self.assertEqual(response.status_code, 400)
+
+    def test_period_summary_route(self):
+        """Test the period summary groups a range into buckets."""
+        with self.app.app_context():
+            db.session.add(
+                ScheduleEntry(
+                    employee_id=1,
+                    date=date(2025, 2, 3),
+                    entries=[{"entry": "09:00", "exit": "17:00"}],
+                    absence_code=None,
+                )
+            )
+            db.session.commit()
+
+        response = self.client.get(
+            "/summary/period?start=2025-01-01&end=2025-03-31&granularity=month"
+        )
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+
+        self.assertEqual(
+            [p["label"] for p in data["periods"]], ["2025-01", "2025-02", "2025-03"]
+        )
+        self.assertEqual(data["periods"][1]["total"], 8.0)
+        self.assertEqual(len(data["periods"][1]["days"]), 28)
+
+        monthly = json.loads(self.client.get("/summary/monthly/2025/2").data)
+        self.assertEqual(monthly["required"], data["periods"][1]["required"])
+
+    def test_period_summary_invalid_granularity(self):
+        response = self.client.get(
+            "/summary/period?start=2025-01-01&end=2025-03-31&granularity=decade"
+        )
+        self.assertEqual(response.status_code, 400)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,8 +11,10 @@ from app.models.models import Holiday
 from app.services.holiday_providers.argentina_api_provider import ArgentinaApiProvider
 from app.services.holiday_providers.argentina_website_provider import (
     ArgentinaWebsiteProvider,
+    HolidayScriptFinder,
 )
 from app.services.holiday_service import PROVIDER_MAP, get_holiday_provider
+from tests.holiday_pages import HOLIDAYS, make_holiday_page
 
 
 class TestArgentinaWebsiteProvider:
@@ -22,8 +24,9 @@ class TestArgentinaWebsiteProvider:
 
     @pytest.fixture
     def mock_response(self):
-        """Creates a mock response object for requests.get."""
+        """Creates a mock response object for requests.Session.get."""
         mock = MagicMock(spec=requests.Response)
+        mock.status_code = 200
         mock.raise_for_status.return_value = None
         return mock
 
@@ -43,7 +46,7 @@ class TestArgentinaWebsiteProvider:
         </script></html>
         """
         provider = ArgentinaWebsiteProvider(base_url="http://fake-url.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             assert len(holidays) == 2
             assert holidays[0].description == "Año Nuevo"
@@ -64,7 +67,7 @@ class TestArgentinaWebsiteProvider:
         </script></html>
         """
         provider = ArgentinaWebsiteProvider(base_url="http://fake-url.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(year)
             assert len(holidays) == 1
             assert holidays[0].description == "Año Nuevo"
@@ -75,7 +78,8 @@ class TestArgentinaWebsiteProvider:
         """
         provider = ArgentinaWebsiteProvider(base_url="http://fake-url.com/{year}")
         with patch(
-            "requests.get", side_effect=requests.RequestException("Network Error")
+            "requests.Session.get",
+            side_effect=requests.RequestException("Network Error"),
         ):
             holidays = provider.get_holidays(2025)
             assert holidays == []
@@ -86,7 +90,7 @@ class TestArgentinaWebsiteProvider:
         """
         mock_response.text = "<html><body>No data here</body></html>"
         provider = ArgentinaWebsiteProvider(base_url="http://fake-url.com/{year}")
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             holidays = provider.get_holidays(2025)
             assert holidays == []
 
@@ -124,6 +128,43 @@ class TestArgentinaWebsiteProvider:
         assert holidays == []
 
 
+class TestHolidayScriptFinder:
+    """
+    Tests for the streaming <script> lookup of ArgentinaWebsiteProvider.
+    """
+
+    def test_finds_the_year_among_other_scripts(self):
+        html = make_holiday_page(2025, cards_before=20, cards_after=20)
+
+        provider = ArgentinaWebsiteProvider(base_url="")
+        entries = provider._extract_holidays(html, 2025)
+
+        assert len(entries) == len(HOLIDAYS)
+        assert entries[0]["date"] == "01/01/2025"
+        assert provider._extract_holidays(html, 2023) == []
+
+    def test_script_split_across_chunks(self):
+        html = make_holiday_page(2025, cards_before=3, cards_after=3)
+
+        with patch(
+            "app.services.holiday_providers.argentina_website_provider.SCAN_CHUNK_SIZE",
+            7,
+        ):
+            script = HolidayScriptFinder(2025).find(html)
+
+        assert script is not None and "const holidays2025 =" in script
+
+    def test_stops_after_the_script(self):
+        html = make_holiday_page(2025, cards_before=1, cards_after=200)
+        finder = HolidayScriptFinder(2025)
+        fed = []
+        original_feed = finder.feed
+        finder.feed = lambda data: fed.append(data) or original_feed(data)
+
+        assert finder.find(html) is not None
+        assert sum(len(chunk) for chunk in fed) < len(html) / 10
+
+
 class TestHolidayService:
     """
     Tests for the holiday provider factory service.
@@ -42,6 +42,49 @@ class TestSettingsRoutes:
         assert data["code"] == "NEW-TEST-CODE"
         assert "id" in data
 
+    def test_update_absence_code_renames_entries(self, app, default_employee_id):
+        """Schedule entries using a renamed code show the new name."""
+        client = app.test_client()
+        with app.app_context():
+            code = AbsenceCode(code="LIC")
+            db.session.add_all(
+                [
+                    code,
+                    ScheduleEntry(
+                        employee_id=default_employee_id,
+                        date=date(2025, 10, 10),
+                        absence_code="LIC",
+                        entries=[],
+                    ),
+                    ScheduleEntry(
+                        employee_id=default_employee_id,
+                        date=date(2025, 10, 13),
+                        absence_code="VAC",
+                        entries=[],
+                    ),
+                ]
+            )
+            db.session.commit()
+            code_id = code.id
+        # Cache the month as it looks before the rename
+        assert {"date": "2025-10-10", "type": "LIC"} in client.get(
+            "/monthly-log/api/2025/10"
+        ).get_json()
+
+        response = client.put(
+            f"/settings/api/absence-codes/{code_id}", json={"code": "LICENCIA"}
+        )
+        assert response.status_code == 200
+
+        with app.app_context():
+            codes = dict(
+                db.session.query(ScheduleEntry.date, ScheduleEntry.absence_code)
+            )
+        assert codes == {date(2025, 10, 10): "LICENCIA", date(2025, 10, 13): "VAC"}
+        assert {"date": "2025-10-10", "type": "LICENCIA"} in client.get(
+            "/monthly-log/api/2025/10"
+        ).get_json()
+
     @pytest.mark.parametrize(
         "payload", [({"code": "   "}), ({"code": ""}), ({"wrong_key": "v"}), ({})]
     )
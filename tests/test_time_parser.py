@@ -0,0 +1,57 @@
+"""Tests for app/utils/time_parser.py."""
+
+from datetime import datetime
+
+import pytest
+
+from app.utils.time_parser import (
+    format_minutes,
+    parse_cache_info,
+    parse_time,
+    to_minutes,
+)
+
+
+class TestTimeParser:
+    """Tests for the cached minute-of-day parser."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("00:00", 0),
+            ("09:05", 545),
+            ("9:05", 545),
+            ("12:30", 750),
+            ("23:59", 1439),
+        ],
+    )
+    def test_parse_valid(self, value, expected):
+        assert parse_time(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        ["", "24:00", "09:60", "09-00", "9:5", "109:00", "ab:cd", "٠٩:٠٠", None, 900],
+    )
+    def test_parse_invalid(self, value):
+        assert parse_time(value) is None
+
+    def test_matches_strptime_for_every_minute(self):
+        for minutes in range(24 * 60):
+            value = format_minutes(minutes)
+            parsed = datetime.strptime(value, "%H:%M")
+            assert parse_time(value) == parsed.hour * 60 + parsed.minute
+
+    def test_to_minutes_raises_for_invalid(self):
+        assert to_minutes("17:00") == 1020
+        with pytest.raises(ValueError, match="Invalid time value"):
+            to_minutes("25:00")
+
+    def test_cache_is_bounded_and_reused(self):
+        parse_time("07:45")
+        before = parse_cache_info()
+        parse_time("07:45")
+        after = parse_cache_info()
+
+        assert after.hits == before.hits + 1
+        assert after.maxsize is not None
+        assert after.currsize <= after.maxsize
@@ -0,0 +1,177 @@
+"""Tests for app/services/upload_registry.py."""
+
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.db.database import db
+from app.models.models import Upload
+from app.services.import_jobs import KIND_PARSE, STAGE_PARSING, get_import_jobs
+from app.services.importer.result_cache import CACHE_DIRNAME
+from app.services.upload_registry import (
+    get_upload_path,
+    register_upload,
+    remove_upload,
+    sweep_uploads,
+    upload_digest,
+)
+
+TTL = timedelta(hours=24)
+
+
+def _save(folder, upload_id, ext="pdf", content=b"%PDF-1.4 test"):
+    filename = f"{upload_id}.{ext}"
+    with open(os.path.join(folder, filename), "wb") as f:
+        f.write(content)
+    return filename
+
+
+def _cache(folder, upload_id):
+    os.makedirs(os.path.join(folder, CACHE_DIRNAME), exist_ok=True)
+    path = os.path.join(folder, CACHE_DIRNAME, f"{upload_id}.json")
+    with open(path, "w") as f:
+        f.write("{}")
+    return path
+
+
+def _age(path, hours=48):
+    stamp = time.time() - hours * 3600
+    os.utime(path, (stamp, stamp))
+
+
+class TestRegistry:
+    def test_register_and_lookup(self, app, tmp_path):
+        folder = str(tmp_path)
+        filename = _save(folder, "abc")
+
+        upload = register_upload(folder, "abc", filename)
+        db.session.commit()
+
+        stored = db.session.get(Upload, "abc")
+        assert stored.size == len(b"%PDF-1.4 test")
+        assert stored.sha256 == upload.sha256 and len(stored.sha256) == 64
+        assert get_upload_path(folder, "abc") == os.path.join(folder, filename)
+
+    def test_digest_of_unchanged_upload(self, app, tmp_path):
+        folder = str(tmp_path)
+        filename = _save(folder, "abc")
+        upload = register_upload(folder, "abc", filename)
+        db.session.commit()
+
+        path = os.path.join(folder, filename)
+        assert upload_digest("abc", path) == upload.sha256
+        assert upload_digest("other", path) is None
+
+    def test_digest_of_replaced_upload(self, app, tmp_path):
+        folder = str(tmp_path)
+        filename = _save(folder, "abc", content=b"first")
+        register_upload(folder, "abc", filename)
+        db.session.commit()
+
+        path = os.path.join(folder, filename)
+        # Same size, written after the upload was registered
+        _save(folder, "abc", content=b"other")
+        later = time.time() + 60
+        os.utime(path, (later, later))
+
+        assert upload_digest("abc", path) is None
+
+    def test_digest_of_resized_upload(self, app, tmp_path):
+        folder = str(tmp_path)
+        filename = _save(folder, "abc")
+        register_upload(folder, "abc", filename)
+        db.session.commit()
+
+        path = os.path.join(folder, filename)
+        _save(folder, "abc", content=b"longer content")
+        _age(path)
+
+        assert upload_digest("abc", path) is None
+
+    def test_unregistered_files_are_found_by_name(self, app, tmp_path):
+        folder = str(tmp_path)
+        filename = _save(folder, "legacy", ext="xlsx")
+
+        assert get_upload_path(folder, "legacy") == os.path.join(folder, filename)
+        assert get_upload_path(folder, "missing") is None
+
+    def test_ids_are_validated(self, app, tmp_path):
+        assert get_upload_path(str(tmp_path), "../etc/passwd") is None
+        assert get_upload_path(str(tmp_path), "") is None
+
+    def test_remove(self, app, tmp_path):
+        folder = str(tmp_path)
+        register_upload(folder, "abc", _save(folder, "abc"))
+        cache = _cache(folder, "abc")
+        db.session.commit()
+
+        remove_upload(folder, "abc")
+        db.session.commit()
+
+        assert db.session.get(Upload, "abc") is None
+        assert os.listdir(folder) == [CACHE_DIRNAME]
+        assert not os.path.exists(cache)
+
+
+class TestSweep:
+    def _register(self, folder, upload_id, age):
+        register_upload(folder, upload_id, _save(folder, upload_id))
+        db.session.get(Upload, upload_id).created_at = datetime.utcnow() - age
+        db.session.commit()
+
+    def test_expired_uploads_are_removed(self, app, tmp_path):
+        folder = str(tmp_path)
+        self._register(folder, "old", timedelta(hours=30))
+        self._register(folder, "new", timedelta(hours=1))
+        old_cache = _cache(folder, "old")
+        new_cache = _cache(folder, "new")
+        _age(new_cache)
+
+        assert sweep_uploads(folder, TTL) == 1
+
+        assert [u.id for u in Upload.query.all()] == ["new"]
+        assert not os.path.exists(os.path.join(folder, "old.pdf"))
+        assert not os.path.exists(old_cache)
+        # A registered upload keeps its cache, however old the file is
+        assert os.path.exists(new_cache)
+
+    def test_running_jobs_are_kept(self, app, tmp_path):
+        folder = str(tmp_path)
+        self._register(folder, "busy", timedelta(hours=30))
+        get_import_jobs().submit(
+            "busy", KIND_PARSE, lambda job: job.update(stage=STAGE_PARSING)
+        )
+
+        assert sweep_uploads(folder, TTL) == 0
+        assert db.session.get(Upload, "busy") is not None
+
+    def test_old_unregistered_files_are_removed(self, app, tmp_path):
+        folder = str(tmp_path)
+        stale_id, fresh_id = str(uuid.uuid4()), str(uuid.uuid4())
+        stale = os.path.join(folder, _save(folder, stale_id))
+        fresh = os.path.join(folder, _save(folder, fresh_id))
+        stale_cache = _cache(folder, stale_id)
+        _age(stale)
+        _age(stale_cache)
+
+        assert sweep_uploads(folder, TTL) == 1
+
+        assert not os.path.exists(stale)
+        assert not os.path.exists(stale_cache)
+        assert os.path.exists(fresh)
+
+    def test_other_files_are_left_alone(self, app, tmp_path):
+        folder = str(tmp_path)
+        upload_id = str(uuid.uuid4())
+        others = [
+            os.path.join(folder, _save(folder, ".gitkeep", ext="txt")),
+            os.path.join(folder, _save(folder, "notes", ext="pdf")),
+            os.path.join(folder, _save(folder, upload_id, ext="txt")),
+            _cache(folder, "report"),
+        ]
+        for path in others:
+            _age(path)
+
+        assert sweep_uploads(folder, TTL) == 0
+        assert all(os.path.exists(path) for path in others)
@@ -1,6 +1,6 @@
 import datetime
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from app.utils.time_calculator import (
     calculate_daily_hours,
@@ -41,28 +41,18 @@ class TestTimeCalculator(unittest.TestCase):
         monday = datetime.date(2025, 3, 10)  # A Monday
         entries = []
 
-        # 5 work days
-        for i in range(5):
-            entry = MagicMock()
-            entry.date = monday + datetime.timedelta(days=i)
-            entry.absence_code = None
-            entry.entries = []  # Empty entries initially
-            entries.append(entry)
-
-        # 2 weekend days
-        for i in range(5, 7):
+        # 5 work days and 2 weekend days, 8 hours each
+        for i in range(7):
             entry = MagicMock()
             entry.date = monday + datetime.timedelta(days=i)
             entry.absence_code = None
-            entry.entries = []
+            entry.entries = [{"entry": "09:00", "exit": "17:00"}]
             entries.append(entry)
 
-        # Mock the calculate_daily_hours function
-        with patch("app.utils.time_calculator.calculate_daily_hours", return_value=8.0):
-            result = calculate_weekly_hours(entries)
-            self.assertEqual(result["total"], 40.0)  # 5 days × 8 hours
-            self.assertEqual(result["required"], 40.0)  # 5 work days × 8 hours
-            self.assertEqual(result["difference"], 0.0)
+        result = calculate_weekly_hours(entries)
+        self.assertEqual(result["total"], 40.0)  # 5 days × 8 hours
+        self.assertEqual(result["required"], 40.0)  # 5 work days × 8 hours
+        self.assertEqual(result["difference"], 0.0)
 
     def test_calculate_monthly_hours(self):
         # Create mock entries for a month (assuming 20 work days)
@@ -75,24 +65,75 @@ class TestTimeCalculator(unittest.TestCase):
             entry = MagicMock()
             entry.date = day
             entry.absence_code = None
-            entry.entries = []  # Empty entries initially
+            entry.entries = [
+                {"entry": "08:00", "exit": "12:00"},
+                {"entry": "13:00", "exit": "17:00"},
+            ]
             entries.append(entry)
 
-        # Mock the calculate_daily_hours function
-        with patch("app.utils.time_calculator.calculate_daily_hours", return_value=8.0):
-            result = calculate_monthly_hours(entries)
+        result = calculate_monthly_hours(entries)
+
+        # We should expect the number of weekdays in March 2025
+        weekdays = sum(
+            1
+            for i in range(31)
+            if (first_day + datetime.timedelta(days=i)).weekday() < 5
+        )
 
-            # We should expect the number of weekdays in March 2025
-            weekdays = sum(
-                1
-                for i in range(31)
-                if (first_day + datetime.timedelta(days=i)).weekday() < 5
-            )
+        self.assertEqual(result["total"], weekdays * 8.0)
+        self.assertEqual(result["required"], weekdays * 8.0)
+        self.assertEqual(result["difference"], 0.0)
+
+    def test_period_hours_respect_holidays_and_hours_per_day(self):
+        monday = datetime.date(2025, 3, 10)
+        entries = []
+        for i in range(7):
+            entry = MagicMock()
+            entry.date = monday + datetime.timedelta(days=i)
+            entry.absence_code = "VAC" if i == 1 else None
+            entry.entries = [{"entry": "09:00", "exit": "15:00"}]
+            entries.append(entry)
 
-            self.assertEqual(result["total"], weekdays * 8.0)
-            self.assertEqual(result["required"], weekdays * 8.0)
+        holidays = {monday + datetime.timedelta(days=2)}
+        for calculate in (calculate_weekly_hours, calculate_monthly_hours):
+            result = calculate(entries, hours_per_day=6.0, holidays=holidays)
+            # Monday, Thursday and Friday count; Tuesday is absent, Wednesday
+            # is a holiday and the weekend never counts
+            self.assertEqual(result["total"], 18.0)
+            self.assertEqual(result["required"], 18.0)
             self.assertEqual(result["difference"], 0.0)
 
+    def test_period_hours_match_a_per_day_sum(self):
+        first_day = datetime.date(2024, 12, 20)
+        holidays = {datetime.date(2024, 12, 25), datetime.date(2025, 1, 1)}
+        entries = []
+        for i in range(60):
+            entry = MagicMock()
+            entry.date = first_day + datetime.timedelta(days=i)
+            entry.absence_code = "SICK" if i % 11 == 0 else None
+            entry.entries = [
+                {"entry": f"{8 + i % 3:02d}:{i % 60:02d}", "exit": "12:30"},
+                {"entry": "13:15", "exit": f"{16 + i % 4:02d}:05"},
+                {"entry": "", "exit": ""},
+            ][: 1 + i % 3]
+            entries.append(entry)
+
+        counted = [
+            e
+            for e in entries
+            if not e.absence_code and e.date.weekday() < 5 and e.date not in holidays
+        ]
+        total = sum(calculate_daily_hours(e.entries) for e in counted)
+        result = calculate_monthly_hours(entries, hours_per_day=7.5, holidays=holidays)
+
+        self.assertAlmostEqual(result["total"], total)
+        self.assertEqual(result["required"], len(counted) * 7.5)
+        self.assertAlmostEqual(result["difference"], total - len(counted) * 7.5)
+        self.assertEqual(
+            calculate_weekly_hours([]),
+            {"total": 0.0, "required": 0.0, "difference": 0.0},
+        )
+
 
 class TestValidators(unittest.TestCase):
     def test_validate_time_format(self):
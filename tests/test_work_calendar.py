@@ -0,0 +1,83 @@
+"""Tests for app/services/work_calendar.py."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.db.database import db
+from app.models.models import Holiday
+from app.services.work_calendar import WorkCalendar, weekmask_for
+
+
+def _walk_required_days(start, end, holidays, working_days=5):
+    """Reference implementation: walk every date in the range."""
+    count = 0
+    current = start
+    while current <= end:
+        if current.weekday() < working_days and current not in holidays:
+            count += 1
+        current += timedelta(days=1)
+    return count
+
+
+class TestWorkCalendar:
+    def test_weekmask_for(self):
+        assert weekmask_for(5) == "1111100"
+        assert weekmask_for(6) == "1111110"
+        with pytest.raises(ValueError):
+            weekmask_for(0)
+
+    def test_required_days_matches_date_walk(self):
+        rng = random.Random(7)
+        holidays = {
+            date(2020, 1, 1) + timedelta(days=rng.randint(0, 365 * 6))
+            for _ in range(60)
+        }
+        calendar = WorkCalendar(holidays)
+
+        for _ in range(200):
+            start = date(2020, 1, 1) + timedelta(days=rng.randint(0, 365 * 5))
+            end = start + timedelta(days=rng.randint(0, 400))
+            assert calendar.required_days(start, end) == _walk_required_days(
+                start, end, holidays
+            )
+
+    def test_required_days_empty_and_reversed_range(self):
+        calendar = WorkCalendar()
+        assert calendar.required_days(date(2025, 3, 10), date(2025, 3, 10)) == 1
+        assert calendar.required_days(date(2025, 3, 15), date(2025, 3, 16)) == 0
+        assert calendar.required_days(date(2025, 3, 16), date(2025, 3, 10)) == 0
+
+    def test_six_day_week(self):
+        calendar = WorkCalendar([date(2025, 3, 12)], weekmask=weekmask_for(6))
+        # Mon 10 to Sun 16: six working days minus the Wednesday holiday
+        assert calendar.required_days(date(2025, 3, 10), date(2025, 3, 16)) == 5
+
+    def test_is_workday_is_vectorized(self):
+        calendar = WorkCalendar([date(2025, 3, 12)])
+        days = [date(2025, 3, 10) + timedelta(days=i) for i in range(7)]
+        assert calendar.is_workday(days).tolist() == [
+            True,
+            True,
+            False,
+            True,
+            True,
+            False,
+            False,
+        ]
+
+    def test_from_db(self, app):
+        with app.app_context():
+            db.session.add(Holiday(date=date(2025, 5, 1), description="Labour Day"))
+            db.session.add(Holiday(date=date(2026, 1, 1), description="New Year"))
+            db.session.commit()
+
+            calendar = WorkCalendar.from_db(date(2025, 1, 1), date(2025, 12, 31))
+            assert calendar.holidays == [date(2025, 5, 1)]
+            assert calendar.required_days(date(2025, 5, 1), date(2025, 5, 2)) == 1
+
+            app.config["WORKING_DAYS_PER_WEEK"] = 6
+            calendar = WorkCalendar.from_db()
+            assert calendar.weekmask == "1111110"
+            assert len(calendar.holidays) == 2